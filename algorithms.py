@@ -5,6 +5,9 @@ Contiene las implementaciones de los tres problemas a analizar.
 
 import numpy as np
 
+# Backends disponibles para ejecutar los bucles
+BACKENDS = ('python', 'numpy')
+
 class Algorithms:
     """Clase que contiene todos los algoritmos a analizar"""
     
@@ -116,7 +119,7 @@ class Algorithms:
         """
         if problem_num == 1:
             # O(n² log n)
-            return n * n * np.log2(n) if n > 0 else 0
+            return n * n * np.log2(float(n)) if n > 0 else 0
         elif problem_num == 2:
             # O(n)
             return n
@@ -142,19 +145,22 @@ class Algorithms:
                 'name': 'Triple bucles anidados',
                 'complexity': 'O(n² log n)',
                 'description': 'Tres bucles anidados con incrementos específicos',
-                'algorithm_func': Algorithms.problem_1
+                'algorithm_func': Algorithms.problem_1,
+                'vectorized_func': VectorizedAlgorithms.problem_1
             },
             2: {
                 'name': 'Doble bucle con break',
                 'complexity': 'O(n)',
                 'description': 'Bucles anidados con break que reduce la complejidad',
-                'algorithm_func': Algorithms.problem_2
+                'algorithm_func': Algorithms.problem_2,
+                'vectorized_func': VectorizedAlgorithms.problem_2
             },
             3: {
                 'name': 'Bucles anidados con incrementos específicos',
                 'complexity': 'O(n²)',
                 'description': 'Bucle externo (n/3) × Bucle interno (n/4) = O(n²)',
-                'algorithm_func': Algorithms.problem_3
+                'algorithm_func': Algorithms.problem_3,
+                'vectorized_func': VectorizedAlgorithms.problem_3
             }
         }
         
@@ -168,4 +174,397 @@ class Algorithms:
         Returns:
             dict: Diccionario con información de todos los problemas
         """
-        return {i: Algorithms.get_problem_info(i) for i in range(1, 4)}
\ No newline at end of file
+        return {i: Algorithms.get_problem_info(i) for i in range(1, 4)}
+    
+    @staticmethod
+    def get_algorithm(problem_num, backend='python'):
+        """
+        Obtiene la implementación de un problema para el backend indicado
+        
+        Args:
+            problem_num (int): Número del problema
+            backend (str): 'python' (bucles puros) o 'numpy' (vectorizado)
+            
+        Returns:
+            function: Función del algoritmo, o None si no existe
+        """
+        problem_info = Algorithms.get_problem_info(problem_num)
+        if not problem_info:
+            return None
+        
+        if backend == 'python':
+            return problem_info['algorithm_func']
+        elif backend == 'numpy':
+            return problem_info['vectorized_func']
+        else:
+            raise ValueError(f"Backend desconocido: {backend} (opciones: {', '.join(BACKENDS)})")
+
+
+class VectorizedAlgorithms:
+    """
+    Backend vectorizado con NumPy para los tres problemas.
+    
+    Cada bucle se representa como un espacio de iteración construido con
+    np.arange en bloques de tamaño acotado (CHUNK_SIZE), se evalúa su
+    condición como máscara booleana y se reduce con np.count_nonzero.
+    Como los límites de cada bucle no dependen de los índices externos,
+    el total del contador es el producto de las reducciones de cada nivel,
+    y coincide exactamente con las implementaciones de Algorithms.
+    """
+    
+    # Máximo de elementos por bloque (limita la memoria a ~8 MB por arreglo)
+    CHUNK_SIZE = 1 << 20
+    
+    @staticmethod
+    def _count_iterations(start, stop, step=1, condition=None):
+        """
+        Cuenta las iteraciones de range(start, stop, step) que cumplen una condición
+        
+        Args:
+            start (int): Valor inicial del índice
+            stop (int): Límite superior (exclusivo)
+            step (int): Incremento del índice
+            condition: Función que recibe el arreglo de índices y devuelve una máscara
+            
+        Returns:
+            int: Número de iteraciones
+        """
+        total = 0
+        block = VectorizedAlgorithms.CHUNK_SIZE * step
+        
+        for block_start in range(start, stop, block):
+            block_stop = min(block_start + block, stop)
+            values = np.arange(block_start, block_stop, step, dtype=np.int64)
+            
+            if condition is None:
+                total += int(values.size)
+            else:
+                total += int(np.count_nonzero(condition(values)))
+        
+        return total
+    
+    @staticmethod
+    def problem_1(n):
+        """
+        Problema 1 vectorizado: Triple bucles anidados
+        
+        Args:
+            n (int): Tamaño de entrada
+            
+        Returns:
+            int: Valor final del contador
+        """
+        half = n // 2
+        
+        # Bucle i: for (i = n / 2; i <= n; i++)
+        outer = VectorizedAlgorithms._count_iterations(half, n + 1)
+        
+        # Bucle j: for (j = 1; j + n / 2 <= n; j++)
+        middle = VectorizedAlgorithms._count_iterations(
+            1, n + 1, condition=lambda j: j + half <= n
+        )
+        
+        # Bucle k: for (k = 1; k <= n; k = k * 2)
+        powers = np.left_shift(np.int64(1), np.arange(0, 63, dtype=np.int64))
+        inner = int(np.count_nonzero(powers <= n))
+        
+        return outer * middle * inner
+    
+    @staticmethod
+    def problem_2(n):
+        """
+        Problema 2 vectorizado: Doble bucle con break
+        
+        Args:
+            n (int): Tamaño de entrada
+            
+        Returns:
+            int: Valor final del contador
+        """
+        if n <= 1:
+            return 0
+        
+        # Bucle i: for (i = 1; i <= n; i++)
+        outer = VectorizedAlgorithms._count_iterations(1, n + 1)
+        
+        # Bucle j: el break deja solo la primera iteración (si existe)
+        inner = min(1, VectorizedAlgorithms._count_iterations(1, 2))
+        
+        return outer * inner
+    
+    @staticmethod
+    def problem_3(n):
+        """
+        Problema 3 vectorizado: Bucles anidados con incrementos específicos
+        
+        Args:
+            n (int): Tamaño de entrada
+            
+        Returns:
+            int: Valor final del contador
+        """
+        # Bucle i: for (i = 1; i <= n / 3; i++)
+        outer = VectorizedAlgorithms._count_iterations(1, n // 3 + 1)
+        
+        # Bucle j: for (j = 1; j <= n; j += 4)
+        inner = VectorizedAlgorithms._count_iterations(1, n + 1, step=4)
+        
+        return outer * inner
+
+
+class OperationCounter:
+    """
+    Motor de conteo en forma cerrada para los problemas de Algorithms.
+    
+    Devuelve exactamente el mismo valor del contador que las implementaciones
+    con bucles, pero en O(1) (o O(log n) por el uso de bit_length), lo que
+    permite obtener las operaciones para cualquier n (incluso n = 10^12)
+    sin ejecutar los bucles.
+    """
+    
+    @staticmethod
+    def problem_1(n):
+        """
+        Conteo exacto del Problema 1
+        
+        - Bucle i: desde n//2 hasta n -> n - n//2 + 1 iteraciones
+        - Bucle j: mientras j + n//2 <= n -> n - n//2 iteraciones
+        - Bucle k: potencias de 2 hasta n -> floor(log2 n) + 1 = n.bit_length()
+        
+        Args:
+            n (int): Tamaño de entrada
+            
+        Returns:
+            int: Valor final del contador
+        """
+        n = int(n)
+        if n < 1:
+            return 0
+        
+        outer = n - n // 2 + 1
+        middle = n - n // 2
+        inner = n.bit_length()
+        
+        return outer * middle * inner
+    
+    @staticmethod
+    def problem_2(n):
+        """
+        Conteo exacto del Problema 2
+        
+        El break deja una sola iteración del bucle interno por cada i.
+        
+        Args:
+            n (int): Tamaño de entrada
+            
+        Returns:
+            int: Valor final del contador
+        """
+        n = int(n)
+        if n <= 1:
+            return 0
+        
+        return n
+    
+    @staticmethod
+    def problem_3(n):
+        """
+        Conteo exacto del Problema 3
+        
+        - Bucle i: de 1 hasta n//3 -> n//3 iteraciones
+        - Bucle j: 1, 5, 9, ... <= n -> (n - 1)//4 + 1 iteraciones
+        
+        Args:
+            n (int): Tamaño de entrada
+            
+        Returns:
+            int: Valor final del contador
+        """
+        n = int(n)
+        if n < 1:
+            return 0
+        
+        outer = n // 3
+        inner = (n - 1) // 4 + 1
+        
+        return outer * inner
+    
+    @staticmethod
+    def count(problem_num, n):
+        """
+        Obtiene el número exacto de operaciones de un problema
+        
+        Args:
+            problem_num (int): Número del problema (1, 2, o 3)
+            n (int): Tamaño de entrada
+            
+        Returns:
+            int: Número de operaciones (0 si el problema no existe)
+        """
+        counters = {
+            1: OperationCounter.problem_1,
+            2: OperationCounter.problem_2,
+            3: OperationCounter.problem_3
+        }
+        
+        counter_func = counters.get(problem_num)
+        if counter_func is None:
+            return 0
+        
+        return counter_func(n)
+    
+    @staticmethod
+    def verify(problem_num, n_values=None):
+        """
+        Compara el conteo en forma cerrada contra la implementación con bucles
+        
+        Args:
+            problem_num (int): Número del problema
+            n_values (list): Valores de n a verificar (por defecto 0..200)
+            
+        Returns:
+            list: Lista de tuplas (n, esperado, obtenido) que no coinciden
+        """
+        if n_values is None:
+            n_values = range(0, 201)
+        
+        problem_info = Algorithms.get_problem_info(problem_num)
+        if not problem_info:
+            return []
+        
+        algorithm_func = problem_info['algorithm_func']
+        mismatches = []
+        
+        for n in n_values:
+            expected = algorithm_func(n)
+            obtained = OperationCounter.count(problem_num, n)
+            if expected != obtained:
+                mismatches.append((n, expected, obtained))
+        
+        return mismatches
+
+class PartitionedAlgorithms:
+    """
+    Ejecución por particiones del bucle externo de los problemas 1 y 3.
+    
+    Las iteraciones del bucle i son independientes entre sí, por lo que el
+    rango de i puede dividirse en bloques que se ejecutan por separado
+    (por ejemplo en distintos procesos); la suma de los contadores de cada
+    bloque coincide exactamente con el contador de Algorithms.
+    """
+    
+    @staticmethod
+    def problem_1_chunk(n, i_start, i_stop):
+        """
+        Problema 1 restringido a i en [i_start, i_stop)
+        
+        Args:
+            n (int): Tamaño de entrada
+            i_start (int): Primer valor de i del bloque
+            i_stop (int): Límite superior de i (exclusivo)
+            
+        Returns:
+            int: Contador parcial del bloque
+        """
+        counter = 0
+        
+        for i in range(i_start, i_stop):
+            j = 1
+            while j + n // 2 <= n:
+                k = 1
+                while k <= n:
+                    counter += 1
+                    k = k * 2
+                j += 1
+        
+        return counter
+    
+    @staticmethod
+    def problem_3_chunk(n, i_start, i_stop):
+        """
+        Problema 3 restringido a i en [i_start, i_stop)
+        
+        Args:
+            n (int): Tamaño de entrada
+            i_start (int): Primer valor de i del bloque
+            i_stop (int): Límite superior de i (exclusivo)
+            
+        Returns:
+            int: Contador parcial del bloque
+        """
+        operations = 0
+        
+        for i in range(i_start, i_stop):
+            j = 1
+            while j <= n:
+                operations += 1
+                j += 4
+        
+        return operations
+    
+    @staticmethod
+    def outer_range(problem_num, n):
+        """
+        Rango del bucle externo de un problema particionable
+        
+        Args:
+            problem_num (int): Número del problema
+            n (int): Tamaño de entrada
+            
+        Returns:
+            tuple: (inicio, fin_exclusivo), o None si el problema no se particiona
+        """
+        if problem_num == 1:
+            return n // 2, n + 1
+        elif problem_num == 3:
+            return 1, n // 3 + 1
+        else:
+            return None
+    
+    @staticmethod
+    def get_chunk_func(problem_num):
+        """
+        Obtiene la función que ejecuta un bloque del bucle externo
+        
+        Args:
+            problem_num (int): Número del problema
+            
+        Returns:
+            function: Función (n, i_start, i_stop), o None si no se particiona
+        """
+        chunk_funcs = {
+            1: PartitionedAlgorithms.problem_1_chunk,
+            3: PartitionedAlgorithms.problem_3_chunk
+        }
+        
+        return chunk_funcs.get(problem_num)
+    
+    @staticmethod
+    def split(problem_num, n, num_chunks):
+        """
+        Divide el bucle externo en bloques contiguos de tamaño similar
+        
+        Args:
+            problem_num (int): Número del problema
+            n (int): Tamaño de entrada
+            num_chunks (int): Número de bloques deseado
+            
+        Returns:
+            list: Lista de tuplas (i_start, i_stop), sin bloques vacíos
+        """
+        bounds = PartitionedAlgorithms.outer_range(problem_num, n)
+        if bounds is None:
+            return []
+        
+        start, stop = bounds
+        total = max(0, stop - start)
+        num_chunks = max(1, min(num_chunks, total))
+        
+        chunks = []
+        for c in range(num_chunks):
+            chunk_start = start + total * c // num_chunks
+            chunk_stop = start + total * (c + 1) // num_chunks
+            if chunk_stop > chunk_start:
+                chunks.append((chunk_start, chunk_stop))
+        
+        return chunks
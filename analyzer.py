@@ -3,107 +3,1108 @@ Módulo Analizador para Medición de Rendimiento y Visualización
 Contiene las funciones para profiling, generación de tablas y gráficas.
 """
 
+import gc
 import time
 import os
-from tabulate import tabulate
-import matplotlib.pyplot as plt
+import sys
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
-import pandas as pd
-from algorithms import Algorithms
+from algorithms import Algorithms, OperationCounter, PartitionedAlgorithms, BACKENDS
+from complexity_fit import classify, theoretical_ratio, throughput, fit_call_overhead
+from result_sink import new_sweep_id
+from memory_usage import measure_peak_memory
+from loop_nest import analyze_problem
+from grid_planner import GridPlanner
+from sample_stats import ROBUST_COLUMNS, reject_outliers, robust_summary, sample_array
+from background import SweepCancelled
+from plot_renderer import (PlotRenderer, draw_problem, draw_throughput, draw_comparison,
+                           PROBLEM_FIGSIZE, COMPARISON_FIGSIZE)
+
+
+def _init_pool_worker(core_counter, cores):
+    """
+    Inicializa un proceso del pool fijándolo a un núcleo propio
+    
+    Args:
+        core_counter: Contador compartido para repartir los núcleos
+        cores (list): Núcleos disponibles (vacío para no fijar)
+    """
+    if not cores:
+        return
+    
+    with core_counter.get_lock():
+        index = core_counter.value
+        core_counter.value += 1
+    
+    os.sched_setaffinity(0, {cores[index % len(cores)]})
+
+
+def _timed_job(problem_num, n, backend):
+    """
+    Ejecuta una sola medición dentro de un proceso del pool
+    
+    Args:
+        problem_num (int): Número del problema
+        n (int): Tamaño de entrada
+        backend (str): Backend a utilizar
+        
+    Returns:
+        tuple: (tiempo_en_segundos, resultado)
+    """
+    algorithm_func = Algorithms.get_algorithm(problem_num, backend)
+    
+    start_time = time.perf_counter()
+    result = algorithm_func(n)
+    end_time = time.perf_counter()
+    
+    return end_time - start_time, result
+
+
+def _profile_job(problem_num, n, backend, num_runs):
+    """
+    Ejecuta todas las repeticiones de una medición en un proceso aparte
+    
+    Args:
+        problem_num (int): Número del problema
+        n (int): Tamaño de entrada
+        backend (str): Backend a utilizar
+        num_runs (int): Número de ejecuciones
+        
+    Returns:
+        tuple: (lista_de_tiempos, resultado)
+    """
+    times = []
+    result = None
+    
+    for _ in range(num_runs):
+        elapsed, result = _timed_job(problem_num, n, backend)
+        times.append(elapsed)
+    
+    return times, result
+
+
+def _isolated_job(conn, results_dir, problem_num, n, backend, num_runs, core, track_memory,
+                  profile_options):
+    """
+    Mide un (problema, n) en un intérprete nuevo y envía las muestras por el pipe
+    
+    Args:
+        conn: Extremo de escritura del pipe
+        results_dir (str): Directorio de resultados del analizador padre
+        problem_num (int): Número del problema
+        n (int): Tamaño de entrada
+        backend (str): Backend a utilizar
+        num_runs (int): Número de ejecuciones
+        core (int): Núcleo al que fijar el proceso (None para no fijarlo)
+        track_memory (bool): Medir también el pico de memoria
+        profile_options (dict): Argumentos adicionales de profile_algorithm
+    """
+    try:
+        if core is not None:
+            os.sched_setaffinity(0, {core})
+        
+        analyzer = PerformanceAnalyzer(results_dir, show_plots=False, track_memory=track_memory)
+        algorithm_func = Algorithms.get_algorithm(problem_num, backend)
+        _, _, result = analyzer.profile_algorithm(algorithm_func, n, num_runs, **profile_options)
+        conn.send((analyzer.last_profile, result))
+    except Exception as e:
+        conn.send(e)
+    finally:
+        conn.close()
+
+
+def default_isolation_core():
+    """
+    Elige el núcleo para las mediciones aisladas
+    
+    Se usa el último núcleo disponible, el menos ocupado habitualmente por
+    el sistema operativo (que suele atender interrupciones en el núcleo 0).
+    
+    Returns:
+        int: Núcleo elegido (None si la plataforma no permite fijar procesos)
+    """
+    if not hasattr(os, 'sched_getaffinity'):
+        return None
+    return max(os.sched_getaffinity(0))
+
+
+def run_jobs_in_pool(jobs, workers, pin_cores=False, on_complete=None):
+    """
+    Ejecuta trabajos (problema, n, backend) en un pool de procesos
+    
+    Args:
+        jobs (list): Lista de tuplas (problem_num, n, backend)
+        workers (int): Número de procesos
+        pin_cores (bool): Fijar cada proceso a un núcleo distinto
+        on_complete: Función (índice, (tiempo, resultado)) llamada al terminar
+            cada trabajo exitoso, en orden de finalización
+        
+    Returns:
+        list: (tiempo, resultado) o la excepción de cada trabajo, en el orden original
+    """
+    cores = []
+    if pin_cores:
+        if hasattr(os, 'sched_setaffinity'):
+            cores = sorted(os.sched_getaffinity(0))
+            if workers > len(cores):
+                print(f"Advertencia: {workers} procesos para {len(cores)} núcleos disponibles")
+        else:
+            print("Advertencia: esta plataforma no permite fijar procesos a núcleos")
+    
+    # Los trabajos más costosos se envían primero
+    order = sorted(
+        range(len(jobs)),
+        key=lambda i: Algorithms.get_theoretical_complexity(jobs[i][0], jobs[i][1]),
+        reverse=True
+    )
+    
+    core_counter = multiprocessing.Value('i', 0)
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_pool_worker,
+        initargs=(core_counter, cores)
+    )
+    
+    try:
+        futures = {executor.submit(_timed_job, *jobs[i]): i for i in order}
+        
+        outcomes = [None] * len(jobs)
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                outcomes[i] = future.result()
+            except Exception as e:
+                outcomes[i] = e
+                continue
+            
+            if on_complete is not None:
+                on_complete(i, outcomes[i])
+    except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    
+    executor.shutdown()
+    return outcomes
+
+
+def _chunk_job(problem_num, n, i_start, i_stop):
+    """
+    Ejecuta un bloque del bucle externo dentro de un proceso del pool
+    
+    Args:
+        problem_num (int): Número del problema
+        n (int): Tamaño de entrada
+        i_start (int): Primer valor de i del bloque
+        i_stop (int): Límite superior de i (exclusivo)
+        
+    Returns:
+        int: Contador parcial del bloque
+    """
+    return PartitionedAlgorithms.get_chunk_func(problem_num)(n, i_start, i_stop)
+
+
+def run_partitioned(problem_num, n, workers, num_chunks=None, pin_cores=False):
+    """
+    Ejecuta una sola llamada de un problema repartiendo su bucle externo en un pool
+    
+    El tiempo medido cubre el envío de los bloques y la suma de los
+    contadores, pero no el arranque de los procesos.
+    
+    Args:
+        problem_num (int): Número del problema (1 o 3)
+        n (int): Tamaño de entrada
+        workers (int): Número de procesos
+        num_chunks (int): Número de bloques (por defecto 4 por proceso)
+        pin_cores (bool): Fijar cada proceso a un núcleo distinto
+        
+    Returns:
+        tuple: (tiempo_en_segundos, contador_total)
+    """
+    if PartitionedAlgorithms.get_chunk_func(problem_num) is None:
+        raise ValueError(f"El Problema {problem_num} no admite ejecución particionada")
+    
+    if num_chunks is None:
+        num_chunks = workers * 4
+    chunks = PartitionedAlgorithms.split(problem_num, n, num_chunks)
+    
+    cores = []
+    if pin_cores and hasattr(os, 'sched_setaffinity'):
+        cores = sorted(os.sched_getaffinity(0))
+    
+    core_counter = multiprocessing.Value('i', 0)
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_pool_worker,
+        initargs=(core_counter, cores)
+    )
+    
+    try:
+        # Arrancar los procesos antes de medir
+        list(executor.map(abs, range(workers)))
+        
+        start_time = time.perf_counter()
+        futures = [executor.submit(_chunk_job, problem_num, n, i_start, i_stop)
+                   for i_start, i_stop in chunks]
+        result = sum(future.result() for future in futures)
+        end_time = time.perf_counter()
+    except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    
+    executor.shutdown()
+    return end_time - start_time, result
+
+
+# Columnas que agrega el modo de memoria a cada resultado
+MEMORY_COLUMNS = ('peak_alloc_bytes', 'peak_rss_bytes')
+
+# Columnas opcionales que profile_algorithm deja en last_profile
+PROFILE_COLUMNS = MEMORY_COLUMNS + ROBUST_COLUMNS + ('remeasures', 'timing_controls',
+                                                     'isolated_core', 'samples')
+
+# Coeficiente de variación máximo (sin atípicos) antes de repetir la medición
+MAX_CV = 0.10
+
+# Costo de una llamada a time.perf_counter (calculado en el primer uso)
+_timer_overhead = None
+
+
+def calibrate_timer_overhead(samples=10000):
+    """
+    Estima el costo de medir un intervalo vacío con time.perf_counter
+    
+    El valor se calcula una sola vez por proceso y se reutiliza.
+    
+    Args:
+        samples (int): Número de pares de lecturas consecutivas
+        
+    Returns:
+        float: Mediana del intervalo vacío en segundos
+    """
+    global _timer_overhead
+    if _timer_overhead is None:
+        perf_counter = time.perf_counter
+        deltas = []
+        for _ in range(samples):
+            start_time = perf_counter()
+            end_time = perf_counter()
+            deltas.append(end_time - start_time)
+        _timer_overhead = float(np.median(deltas))
+    
+    return _timer_overhead
+
+
+def _batch_size(algorithm_func, n, min_sample_time, single_call_time, max_loops=1000000):
+    """
+    Elige cuántas llamadas agrupar por muestra, como timeit.Timer.autorange
+    
+    Prueba 1, 2, 5, 10, 20, 50, ... llamadas hasta que una muestra dure al
+    menos min_sample_time.
+    
+    Args:
+        algorithm_func: Función del algoritmo
+        n (int): Tamaño de entrada
+        min_sample_time (float): Duración mínima de una muestra en segundos
+        single_call_time (float): Duración ya medida de una llamada
+        max_loops (int): Máximo de llamadas por muestra
+        
+    Returns:
+        int: Número de llamadas por muestra
+    """
+    if single_call_time >= min_sample_time:
+        return 1
+    
+    base = 1
+    while True:
+        for factor in (2, 5, 10):
+            loops = base * factor
+            start_time = time.perf_counter()
+            for _ in range(loops):
+                algorithm_func(n)
+            elapsed = time.perf_counter() - start_time
+            if elapsed >= min_sample_time or loops >= max_loops:
+                return loops
+        base *= 10
+
+
+def load_pyplot(headless=False):
+    """
+    Importa matplotlib.pyplot en el primer uso
+    
+    matplotlib, pandas y tabulate se cargan de forma diferida para que las
+    ejecuciones que solo miden no paguen el costo de importarlos.
+    
+    Args:
+        headless (bool): Usar el backend 'Agg' (sin GUI) si pyplot aún no se cargó
+        
+    Returns:
+        module: matplotlib.pyplot
+    """
+    import matplotlib
+    if headless and 'matplotlib.pyplot' not in sys.modules:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _format_bytes(num_bytes):
+    """
+    Formatea una cantidad de bytes con la unidad más adecuada
+    
+    Args:
+        num_bytes (int): Cantidad de bytes (None o NaN si no se midió)
+        
+    Returns:
+        str: Texto como '8.0 MB', o '-' si no hay valor
+    """
+    if num_bytes is None or num_bytes != num_bytes:
+        return "-"
+    
+    for unit in ('B', 'KB', 'MB'):
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.1f} {unit}" if unit != 'B' else f"{num_bytes:.0f} B"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+
+# Cuantiles 0.975 de la distribución t de Student para 1..30 grados de libertad
+_T_975 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042
+]
+
+
+def _t_critical(degrees_of_freedom):
+    """
+    Valor crítico bilateral al 95% de la distribución t de Student
+    
+    Args:
+        degrees_of_freedom (int): Grados de libertad
+        
+    Returns:
+        float: Valor crítico (aproximación normal para más de 30 grados)
+    """
+    if degrees_of_freedom < 1:
+        return float('inf')
+    if degrees_of_freedom <= len(_T_975):
+        return _T_975[degrees_of_freedom - 1]
+    return 1.960
+
 
 class PerformanceAnalyzer:
     """Clase para análisis de rendimiento de algoritmos"""
     
-    def __init__(self, results_dir="results"):
+    def __init__(self, results_dir="results", cache=None, show_plots=True, sink=None,
+                 checkpoint=None, track_memory=False, history=None, isolate=False,
+                 isolate_core=None, renderer=None):
         """
         Inicializa el analizador
         
         Args:
             results_dir (str): Directorio donde guardar los resultados
+            cache (MeasurementCache): Caché persistente de mediciones (None para desactivarla)
+            show_plots (bool): Mostrar las gráficas en pantalla (False para modo sin GUI)
+            sink (ResultSink): Flujo donde escribir cada resultado al obtenerlo (None para desactivarlo)
+            checkpoint (SweepCheckpoint): Registro de ejecuciones completadas para reanudar
+                barridos (None para desactivarlo)
+            track_memory (bool): Registrar el pico de memoria asignada y de RSS de cada medición
+            history (ResultHistory): Historial donde anexar los resultados de cada barrido
+                (None para desactivarlo)
+            isolate (bool): Medir cada (problema, n) en un intérprete nuevo (profile_isolated)
+            isolate_core (int): Núcleo para las mediciones aisladas (None usa
+                default_isolation_core)
+            renderer (PlotRenderer): Renderizador de las gráficas (None usa uno
+                sincrónico en PNG a 300 dpi)
         """
         self.results_dir = results_dir
+        self.cache = cache
+        self.show_plots = show_plots
+        self.sink = sink
+        self.checkpoint = checkpoint
+        self.track_memory = track_memory
+        self.history = history
+        self.isolate = isolate
+        self.isolate_core = isolate_core if isolate_core is not None else default_isolation_core()
+        self.renderer = renderer if renderer is not None else PlotRenderer(results_dir)
+        self.cancel_event = threading.Event()
+        self.progress = None
+        self.session_results = {}
+        self.sweep_id = None
+        self.interrupted = False
         self.results = []
         self.current_problem = None
+        self.last_profile = {}
         
         # Crear directorio de resultados si no existe
         os.makedirs(self.results_dir, exist_ok=True)
     
-    def profile_algorithm(self, algorithm_func, n, num_runs=3):
+    def profile_algorithm(self, algorithm_func, n, num_runs=3, adaptive=False,
+                          rel_precision=0.05, min_runs=3, max_runs=50, max_time=10.0,
+                          previous_runs=None, on_run=None, rigorous=False, warmup_runs=1,
+                          min_sample_time=0.01, max_cv=MAX_CV, max_remeasures=2):
         """
         Perfila un algoritmo midiendo su tiempo de ejecución
         
+        En modo adaptativo (muestreo secuencial) se repite la medición hasta que
+        el intervalo de confianza del 95% de la media sea menor que
+        rel_precision × media, o hasta alcanzar max_runs o max_time. El número
+        de ejecuciones usadas queda en self.last_profile['num_runs'].
+        
+        Con track_memory activo se hace una ejecución adicional, fuera de las
+        mediciones de tiempo, que registra en self.last_profile el pico de
+        memoria asignada ('peak_alloc_bytes') y el aumento del RSS sobre el
+        previo a la llamada ('peak_rss_bytes'). Esa ejecución cuesta
+        aproximadamente una ejecución más por n (algo más por tracemalloc).
+        
+        En modo riguroso se ejecutan warmup_runs llamadas previas, se desactiva
+        el recolector cíclico (gc) durante la medición, se resta el costo
+        calibrado de time.perf_counter y, si una llamada dura menos que
+        min_sample_time, cada muestra agrupa varias llamadas (como timeit) y
+        se divide entre el número de llamadas. Los controles aplicados quedan
+        en self.last_profile['timing_controls'].
+        
+        Todas las muestras se conservan en self.last_profile['samples'] (un
+        array('d')) junto con los estadísticos de robust_summary. En modo fijo,
+        si tras descartar los atípicos el coeficiente de variación supera
+        max_cv, se duplica el número de muestras (hasta max_remeasures veces y
+        mientras el tiempo medido no supere max_time).
+        
         Args:
             algorithm_func: Función del algoritmo a perfilar
             n (int): Tamaño de entrada
-            num_runs (int): Número de ejecuciones para promediar
+            num_runs (int): Número de ejecuciones para promediar (modo fijo)
+            adaptive (bool): Usar muestreo secuencial en lugar de num_runs
+            rel_precision (float): Semiancho relativo objetivo del intervalo de confianza
+            min_runs (int): Mínimo de ejecuciones antes de evaluar el intervalo
+            max_runs (int): Máximo de ejecuciones
+            max_time (float): Tiempo total máximo de medición en segundos
+            previous_runs (list): Ejecuciones (tiempo, resultado) ya completadas,
+                por ejemplo recuperadas de un checkpoint
+            on_run: Función (tiempo, resultado) llamada tras cada ejecución nueva
+            rigorous (bool): Aplicar calentamiento, gc desactivado, resta del
+                costo del temporizador y agrupación de llamadas
+            warmup_runs (int): Llamadas de calentamiento (modo riguroso)
+            min_sample_time (float): Duración mínima de una muestra en segundos (modo riguroso)
+            max_cv (float): Coeficiente de variación máximo antes de repetir la medición
+            max_remeasures (int): Máximo de veces que se duplica el número de muestras
             
         Returns:
             tuple: (tiempo_promedio, desviación_estándar, resultado)
         """
-        times = []
-        result = None
+        previous_runs = previous_runs or []
+        times = [elapsed for elapsed, _ in previous_runs]
+        result = previous_runs[-1][1] if previous_runs else None
         
-        for _ in range(num_runs):
-            start_time = time.perf_counter()
-            result = algorithm_func(n)
-            end_time = time.perf_counter()
-            times.append(end_time - start_time)
+        def sampling_done():
+            if not times:
+                return False
+            
+            if not adaptive:
+                return len(times) >= target_runs
+            
+            if len(times) >= max_runs or sum(times) * loops >= max_time:
+                return True
+            
+            if len(times) >= min_runs:
+                mean = np.mean(times)
+                half_width = (_t_critical(len(times) - 1) * np.std(times, ddof=1)
+                              / np.sqrt(len(times)))
+                return mean > 0 and half_width / mean <= rel_precision
+            
+            return False
+        
+        loops = 1
+        target_runs = num_runs
+        remeasures = 0
+        overhead = 0.0
+        controls = None
+        gc_was_enabled = gc.isenabled()
+        if rigorous:
+            overhead = calibrate_timer_overhead()
+            single_call_time = None
+            for _ in range(max(1, warmup_runs)):
+                start_time = time.perf_counter()
+                result = algorithm_func(n)
+                single_call_time = time.perf_counter() - start_time
+            loops = _batch_size(algorithm_func, n, min_sample_time, single_call_time)
+            controls = (f"warmup={max(1, warmup_runs)};gc=off;"
+                        f"overhead={overhead * 1e9:.0f}ns;loops={loops}")
+            gc.collect()
+            gc.disable()
+        
+        try:
+            while True:
+                while not sampling_done():
+                    if self.cancel_event.is_set():
+                        raise SweepCancelled()
+                    
+                    if loops == 1:
+                        start_time = time.perf_counter()
+                        result = algorithm_func(n)
+                        end_time = time.perf_counter()
+                    else:
+                        start_time = time.perf_counter()
+                        for _ in range(loops):
+                            result = algorithm_func(n)
+                        end_time = time.perf_counter()
+                    times.append(max(0.0, end_time - start_time - overhead) / loops)
+                    
+                    if on_run is not None:
+                        on_run(times[-1], result)
+                    if self.progress is not None:
+                        self.progress.run_done(times[-1])
+                
+                summary = robust_summary(times)
+                if (adaptive or remeasures >= max_remeasures or len(times) < 3
+                        or summary['time_cv'] <= max_cv or sum(times) * loops >= max_time):
+                    break
+                
+                remeasures += 1
+                target_runs = 2 * len(times)
+                if self.progress is not None:
+                    self.progress.extend_runs(target_runs)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
         
         avg_time = np.mean(times)
         std_time = np.std(times)
         
+        self.last_profile = {'num_runs': len(times), 'samples': sample_array(times)}
+        self.last_profile.update(summary, remeasures=remeasures)
+        if controls is not None:
+            self.last_profile['timing_controls'] = controls
+        if self.track_memory:
+            self.last_profile.update(measure_peak_memory(algorithm_func, n))
+        
         return avg_time, std_time, result
     
-    def run_analysis(self, problem_num, n_values=None):
+    def get_default_n_values(self, problem_num):
+        """
+        Obtiene los valores de n por defecto según el problema
+        
+        Args:
+            problem_num (int): Número del problema
+            
+        Returns:
+            list: Lista de valores de n
+        """
+        if problem_num == 1:  # O(n² log n) - más lento
+            return [1, 10, 100, 1000, 10000, 100000]
+        elif problem_num == 2:  # O(n) - rápido
+            return [1, 10, 100, 1000, 10000, 100000, 1000000]
+        elif problem_num == 3:  # O(n²) - moderadamente lento
+            return [1, 10, 100, 1000, 10000, 100000]
+        else:
+            return [1, 10, 100, 1000, 10000, 100000, 1000000]
+    
+    def get_num_runs(self, n):
+        """
+        Ajusta el número de ejecuciones según el tamaño de entrada
+        
+        Args:
+            n (int): Tamaño de entrada
+            
+        Returns:
+            int: Número de ejecuciones
+        """
+        if n <= 1000:
+            return 5
+        elif n <= 100000:
+            return 3
+        else:
+            return 1
+    
+    def build_result(self, problem_num, n, times, operations, backend='python'):
+        """
+        Construye el diccionario de resultado para un valor de n
+        
+        Args:
+            problem_num (int): Número del problema
+            n (int): Tamaño de entrada
+            times (list): Tiempos medidos en segundos
+            operations (int): Operaciones realizadas por el algoritmo
+            backend (str): Backend utilizado
+            
+        Returns:
+            dict: Resultado del análisis para n
+        """
+        avg_time = np.mean(times)
+        
+        return {
+            'n': n,
+            'time_seconds': avg_time,
+            'time_ms': avg_time * 1000,
+            'std_dev': np.std(times),
+            'operations': operations,
+            'theoretical_complexity': Algorithms.get_theoretical_complexity(problem_num, n),
+            'backend': backend,
+            'extrapolated': False,
+            'num_runs': len(times),
+            **robust_summary(times),
+            'samples': sample_array(times)
+        }
+    
+    def complete_sweep(self):
+        """
+        Cierra un barrido: descarta el checkpoint si no hubo interrupciones
+        
+        Si algún análisis desde el último cierre fue interrumpido, el checkpoint
+        se conserva para poder reanudarlo.
+        
+        Returns:
+            bool: True si el checkpoint se descartó
+        """
+        interrupted = self.interrupted
+        self.interrupted = False
+        
+        if self.checkpoint is None or interrupted:
+            return False
+        
+        self.checkpoint.clear()
+        return True
+    
+    def record_result(self, problem_num, results, result_data):
+        """
+        Agrega un resultado a la lista y lo escribe en el flujo de resultados
+        
+        Antes se le agregan las columnas derivadas 'ops_per_second' y 'ns_per_op'
+        (solo si el resultado es medido; en los extrapolados quedan vacías).
+        
+        Args:
+            problem_num (int): Número del problema
+            results (list): Lista de resultados del barrido en curso
+            result_data (dict): Resultado recién obtenido
+        """
+        result_data.update(throughput(result_data))
+        results.append(result_data)
+        
+        if not result_data.get('extrapolated'):
+            key = (problem_num, result_data['backend'])
+            self.session_results.setdefault(key, {})[result_data['n']] = result_data
+        
+        if self.sink is not None:
+            self.sink.write(problem_num, result_data, self.sweep_id)
+    
+    def archive_results(self, problem_num, results):
+        """
+        Anexa los resultados de un barrido terminado al historial
+        
+        Args:
+            problem_num (int): Número del problema
+            results (list): Resultados del barrido
+        """
+        if self.history is not None and results:
+            self.history.append(problem_num, results, self.sweep_id)
+    
+    def get_session_results(self, problem_num, n_values=None, backend='python'):
+        """
+        Obtiene los resultados medidos durante la sesión
+        
+        Args:
+            problem_num (int): Número del problema
+            n_values (list): Valores de n a obtener (None para todos)
+            backend (str): Backend utilizado
+            
+        Returns:
+            list: Resultados disponibles, en el orden de n_values (o de n)
+        """
+        stored = self.session_results.get((problem_num, backend), {})
+        if n_values is None:
+            n_values = sorted(stored)
+        
+        return [stored[n] for n in n_values if n in stored]
+    
+    def results_from_stream(self, problem_num, sweep_id=None):
+        """
+        Reconstruye los resultados de un problema desde el flujo en disco
+        
+        Args:
+            problem_num (int): Número del problema
+            sweep_id (str): Barrido a cargar (None usa el último barrido del problema)
+            
+        Returns:
+            list: Resultados en el formato de run_analysis
+        """
+        if self.sink is None:
+            return []
+        
+        return self.sink.load(problem_num, sweep_id)
+    
+    def predict_time(self, problem_num, n, results):
+        """
+        Predice el tiempo de una ejecución a partir de los resultados medidos
+        
+        Ajusta T(n) = c · f(n), donde f es la forma de get_theoretical_complexity,
+        por mínimos cuadrados relativos sobre los (hasta) tres mayores n medidos,
+        que son los menos afectados por el costo fijo de cada llamada.
+        
+        Args:
+            problem_num (int): Número del problema
+            n (int): Tamaño de entrada a predecir
+            results (list): Resultados ya obtenidos
+            
+        Returns:
+            float: Tiempo estimado en segundos, o None si no hay datos suficientes
+        """
+        measured = [
+            r for r in results
+            if not r.get('extrapolated')
+            and r['time_seconds'] > 0
+            and Algorithms.get_theoretical_complexity(problem_num, r['n']) > 0
+        ]
+        if not measured:
+            return None
+        
+        measured = sorted(measured, key=lambda r: r['n'])[-3:]
+        shape = np.array([Algorithms.get_theoretical_complexity(problem_num, r['n']) for r in measured],
+                         dtype=float)
+        times = np.array([r['time_seconds'] for r in measured], dtype=float)
+        
+        ratios = shape / times
+        scale = np.sum(ratios) / np.sum(ratios ** 2)
+        
+        return float(scale * Algorithms.get_theoretical_complexity(problem_num, n))
+    
+    def build_extrapolated_result(self, problem_num, n, results, backend='python'):
+        """
+        Construye un resultado extrapolado para un n que no se pudo medir
+        
+        Args:
+            problem_num (int): Número del problema
+            n (int): Tamaño de entrada
+            results (list): Resultados medidos hasta el momento
+            backend (str): Backend utilizado
+            
+        Returns:
+            dict: Resultado marcado como extrapolado, o None si no hay datos para ajustar
+        """
+        predicted = self.predict_time(problem_num, n, results)
+        if predicted is None:
+            return None
+        
+        return {
+            'n': n,
+            'time_seconds': predicted,
+            'time_ms': predicted * 1000,
+            'std_dev': float('nan'),
+            'operations': OperationCounter.count(problem_num, n),
+            'theoretical_complexity': Algorithms.get_theoretical_complexity(problem_num, n),
+            'backend': backend,
+            'extrapolated': True,
+            'num_runs': 0
+        }
+    
+    def profile_with_timeout(self, problem_num, n, backend, num_runs, timeout,
+                             previous_runs=None, on_run=None):
+        """
+        Mide un algoritmo en un proceso aparte, deteniéndolo si excede el tiempo
+        
+        Args:
+            problem_num (int): Número del problema
+            n (int): Tamaño de entrada
+            backend (str): Backend a utilizar
+            num_runs (int): Número de ejecuciones
+            timeout (float): Tiempo máximo en segundos para todas las ejecuciones
+            previous_runs (list): Ejecuciones (tiempo, resultado) ya completadas
+            on_run: Función (tiempo, resultado) llamada por cada ejecución nueva
+            
+        Returns:
+            tuple: (tiempo_promedio, desviación_estándar, resultado) o None si se agotó el tiempo
+        """
+        previous_runs = previous_runs or []
+        times = [elapsed for elapsed, _ in previous_runs]
+        result = previous_runs[-1][1] if previous_runs else None
+        remaining_runs = num_runs - len(times)
+        
+        if remaining_runs > 0:
+            pool = multiprocessing.Pool(1)
+            try:
+                new_times, result = pool.apply_async(
+                    _profile_job, (problem_num, n, backend, remaining_runs)
+                ).get(timeout)
+            except multiprocessing.TimeoutError:
+                return None
+            finally:
+                pool.terminate()
+                pool.join()
+            
+            for elapsed in new_times:
+                times.append(elapsed)
+                if on_run is not None:
+                    on_run(elapsed, result)
+        
+        self.last_profile = {'num_runs': len(times), 'samples': sample_array(times)}
+        self.last_profile.update(robust_summary(times))
+        return np.mean(times), np.std(times), result
+    
+    def profile_isolated(self, problem_num, n, backend='python', num_runs=3, previous_runs=None,
+                         on_run=None, **profile_options):
+        """
+        Mide un algoritmo en un intérprete nuevo fijado a self.isolate_core
+        
+        El proceso hijo se crea con el método 'spawn', por lo que no hereda el
+        montículo ni el estado (matplotlib, cachés, objetos de mediciones
+        anteriores) de este proceso. Ejecuta profile_algorithm y devuelve por
+        un pipe su last_profile, con las muestras en el array('d') compacto.
+        
+        Args:
+            problem_num (int): Número del problema
+            n (int): Tamaño de entrada
+            backend (str): Backend a utilizar
+            num_runs (int): Número de ejecuciones
+            previous_runs (list): Ejecuciones (tiempo, resultado) ya completadas
+            on_run: Función (tiempo, resultado) llamada por cada ejecución nueva
+            **profile_options: Argumentos adicionales de profile_algorithm
+                (adaptive, rigorous, ...)
+            
+        Returns:
+            tuple: (tiempo_promedio, desviación_estándar, resultado)
+        """
+        previous_runs = previous_runs or []
+        
+        context = multiprocessing.get_context('spawn')
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_isolated_job,
+            args=(sender, self.results_dir, problem_num, n, backend, num_runs, self.isolate_core,
+                  self.track_memory, dict(profile_options, previous_runs=previous_runs))
+        )
+        process.start()
+        sender.close()
+        
+        try:
+            while not receiver.poll(0.1):
+                if self.cancel_event.is_set():
+                    process.terminate()
+                    raise SweepCancelled()
+            message = receiver.recv()
+        except EOFError:
+            raise RuntimeError(f"el proceso aislado terminó sin enviar muestras "
+                               f"(código {process.exitcode})")
+        except KeyboardInterrupt:
+            process.terminate()
+            raise
+        finally:
+            process.join()
+            receiver.close()
+        
+        if isinstance(message, Exception):
+            raise message
+        
+        profile, result = message
+        times = profile['samples']
+        for elapsed in times[len(previous_runs):]:
+            if on_run is not None:
+                on_run(elapsed, result)
+            if self.progress is not None:
+                self.progress.run_done(elapsed)
+        
+        self.last_profile = dict(profile, isolated_core=self.isolate_core)
+        return np.mean(times), np.std(times), result
+    
+    def run_analysis(self, problem_num, n_values=None, backend='python',
+                     workers=1, pin_cores=False, time_budget=None, sweep_budget=None,
+                     adaptive=False, rigorous=False, grid_budget=None, points_per_decade=4):
         """
         Ejecuta el análisis completo para un problema específico
         
+        Con time_budget o sweep_budget, cada medición se ejecuta en un proceso
+        aparte que se detiene al agotar el presupuesto. Los n que no se pueden
+        medir (o cuyo tiempo estimado ya excede el presupuesto) se completan con
+        un tiempo extrapolado y se marcan con 'extrapolated': True. Esas
+        mediciones no usan los modos adaptativo, riguroso, de memoria ni
+        aislado (se avisa si estaban activos).
+        
+        Con grid_budget y sin n_values, los n se eligen con GridPlanner: una
+        malla logarítmica que cabe en grid_budget segundos y que se recalcula
+        con cada tiempo medido.
+        
         Args:
             problem_num (int): Número del problema (1, 2, o 3)
             n_values (list): Lista de valores de n a analizar
+            backend (str): Implementación a medir ('python' o 'numpy')
+            workers (int): Número de procesos; con más de 1 se usa parallel_sweep
+            pin_cores (bool): Fijar cada proceso a un núcleo distinto
+            time_budget (float): Tiempo máximo en segundos por valor de n
+            sweep_budget (float): Tiempo máximo en segundos para todo el barrido
+            adaptive (bool): Usar muestreo secuencial en profile_algorithm en lugar
+                de los umbrales fijos de get_num_runs
+            rigorous (bool): Usar el modo de medición riguroso de profile_algorithm
+            grid_budget (float): Tiempo total en segundos para elegir los n (si n_values es None)
+            points_per_decade (int): Densidad de la malla de GridPlanner
             
         Returns:
             list: Lista de resultados del análisis
         """
-        if n_values is None:
-            # Valores por defecto según el problema
-            if problem_num == 1:  # O(n² log n) - más lento
-                n_values = [1, 10, 100, 1000, 10000, 100000]
-            elif problem_num == 2:  # O(n) - rápido
-                n_values = [1, 10, 100, 1000, 10000, 100000, 1000000]
-            elif problem_num == 3:  # O(n²) - moderadamente lento
-                n_values = [1, 10, 100, 1000, 10000, 100000]
-            else:
-                n_values = [1, 10, 100, 1000, 10000, 100000, 1000000]
+        planner = None
+        if n_values is None and grid_budget is not None:
+            planner = GridPlanner(self, problem_num, grid_budget, points_per_decade)
+        elif n_values is None:
+            n_values = self.get_default_n_values(problem_num)
         
         problem_info = Algorithms.get_problem_info(problem_num)
         if not problem_info:
             print(f"Problema {problem_num} no encontrado")
             return []
         
-        algorithm_func = problem_info['algorithm_func']
+        if workers > 1:
+            if time_budget is not None or sweep_budget is not None:
+                print("Advertencia: los presupuestos de tiempo no se aplican en modo paralelo")
+            if adaptive:
+                print("Advertencia: el muestreo adaptativo no se aplica en modo paralelo")
+            if rigorous:
+                print("Advertencia: el modo riguroso no se aplica en modo paralelo")
+            if planner is not None:
+                # Sin mediciones previas el plan se fija de antemano
+                n_values = planner.plan([], grid_budget)
+            results = self.parallel_sweep(
+                [problem_num], n_values, backend, workers, pin_cores
+            ).get(problem_num, [])
+            self.results = results
+            self.current_problem = problem_num
+            return results
+        
+        # Con presupuesto de tiempo cada n se mide con profile_with_timeout,
+        # que usa ejecuciones fijas sin los modos de profile_algorithm
+        track_memory, isolate = self.track_memory, self.isolate
+        if time_budget is not None or sweep_budget is not None:
+            ignored = [name for name, enabled in (('adaptativo', adaptive), ('riguroso', rigorous),
+                                                  ('de memoria', track_memory),
+                                                  ('aislado', isolate)) if enabled]
+            if len(ignored) == 1:
+                print(f"Advertencia: el modo {ignored[0]} no se aplica con presupuesto de tiempo")
+            elif ignored:
+                print(f"Advertencia: los modos {', '.join(ignored)} no se aplican con "
+                      f"presupuesto de tiempo")
+            adaptive = rigorous = track_memory = isolate = False
+        
+        # Las gráficas pendientes se terminan antes de medir para no competir por la CPU
+        self.renderer.wait()
+        
+        algorithm_func = Algorithms.get_algorithm(problem_num, backend)
         problem_name = f"Problema {problem_num}: {problem_info['name']} ({problem_info['complexity']})"
         
-        print(f"Ejecutando análisis de rendimiento para {problem_name}")
+        print(f"Ejecutando análisis de rendimiento para {problem_name} [backend: {backend}]")
         print("=" * 70)
         
         results = []
+        cached_n = set()
+        self.sweep_id = new_sweep_id()
+        sweep_start = time.perf_counter()
         
-        for n in n_values:
+        if planner is not None:
+            n_values = planner.iterate(results)
+        else:
+            n_values = list(n_values)
+        
+        for index, n in enumerate(n_values):
             print(f"Procesando n = {n:,}...")
             
             # Ajustar número de ejecuciones según el tamaño
-            if n <= 1000:
-                num_runs = 5
-            elif n <= 100000:
-                num_runs = 3
-            else:
-                num_runs = 1
+            num_runs = self.get_num_runs(n)
+            
+            if self.progress is not None:
+                upcoming = planner.last_plan[1:] if planner is not None else n_values[index + 1:]
+                self.progress.begin_n(problem_num, n, num_runs, upcoming, results)
+            
+            # Presupuesto disponible para este n (None = sin límite)
+            budgets = [b for b in (time_budget,) if b is not None]
+            if sweep_budget is not None:
+                budgets.append(sweep_budget - (time.perf_counter() - sweep_start))
+            budget = min(budgets) if budgets else None
             
             try:
-                avg_time, std_time, operations = self.profile_algorithm(
-                    algorithm_func, n, num_runs
-                )
+                if self.cancel_event.is_set():
+                    raise SweepCancelled()
+                
+                # El modo distingue las mediciones en la caché y en el checkpoint
+                mode = 'adaptive' if adaptive else f'runs={num_runs}'
+                if rigorous:
+                    mode += '+rigorous'
+                if track_memory:
+                    mode += '+memory'
+                if isolate:
+                    mode += '+isolated'
+                
+                cache_key = None
+                cached = None
+                if self.cache is not None:
+                    cache_key = self.cache.make_key(problem_num, n, algorithm_func, backend, mode)
+                    cached = self.cache.get(cache_key)
+                
+                previous_runs = []
+                on_run = None
+                if self.checkpoint is not None and cached is None:
+                    completed = self.checkpoint.completed_runs(problem_num, n, backend, mode)
+                    previous_runs = [completed[run] for run in sorted(completed)]
+                    if previous_runs:
+                        print(f"  Reanudando: {len(previous_runs)} ejecuciones recuperadas del checkpoint")
+                    
+                    def on_run(elapsed, result, n=n, mode=mode):
+                        self.checkpoint.record(problem_num, n, backend, elapsed, result,
+                                               mode=mode)
+                
+                profile_extras = {}
+                if cached is not None:
+                    measured = (cached['time_seconds'], cached['std_dev'], cached['operations'])
+                    num_runs = cached['num_runs']
+                    profile_extras = {key: cached[key] for key in PROFILE_COLUMNS if key in cached}
+                    cached_n.add(n)
+                    print("  Resultado obtenido de la caché")
+                elif budget is None and isolate:
+                    measured = self.profile_isolated(problem_num, n, backend, num_runs,
+                                                     previous_runs, on_run,
+                                                     adaptive=adaptive, rigorous=rigorous)
+                    num_runs = self.last_profile['num_runs']
+                    profile_extras = {key: self.last_profile[key] for key in PROFILE_COLUMNS
+                                      if key in self.last_profile}
+                elif budget is None:
+                    measured = self.profile_algorithm(algorithm_func, n, num_runs,
+                                                      adaptive=adaptive,
+                                                      rigorous=rigorous,
+                                                      previous_runs=previous_runs,
+                                                      on_run=on_run)
+                    num_runs = self.last_profile['num_runs']
+                    profile_extras = {key: self.last_profile[key] for key in PROFILE_COLUMNS
+                                      if key in self.last_profile}
+                else:
+                    predicted = self.predict_time(problem_num, n, results)
+                    if budget <= 0 or (predicted is not None and predicted * num_runs > budget):
+                        measured = None
+                    else:
+                        measured = self.profile_with_timeout(problem_num, n, backend,
+                                                             num_runs, budget,
+                                                             previous_runs, on_run)
+                        if measured is not None:
+                            num_runs = self.last_profile['num_runs']
+                            profile_extras = {key: self.last_profile[key] for key in PROFILE_COLUMNS
+                                              if key in self.last_profile}
+                
+                if measured is None:
+                    result_data = self.build_extrapolated_result(problem_num, n, results, backend)
+                    if result_data is None:
+                        print(f"  Presupuesto agotado en n = {n:,} y sin datos para extrapolar")
+                        continue
+                    
+                    self.record_result(problem_num, results, result_data)
+                    print(f"  Presupuesto de tiempo excedido: tiempo extrapolado "
+                          f"{result_data['time_seconds']:.6f} segundos ({result_data['time_ms']:.3f} ms)")
+                    continue
+                
+                avg_time, std_time, operations = measured
+                
+                if cache_key is not None and cached is None:
+                    self.cache.put(cache_key, {
+                        'time_seconds': float(avg_time),
+                        'std_dev': float(std_time),
+                        'operations': operations,
+                        'num_runs': num_runs,
+                        **profile_extras
+                    })
                 
                 theoretical = Algorithms.get_theoretical_complexity(problem_num, n)
                 
@@ -113,25 +1114,532 @@ class PerformanceAnalyzer:
                     'time_ms': avg_time * 1000,
                     'std_dev': std_time,
                     'operations': operations,
-                    'theoretical_complexity': theoretical
+                    'theoretical_complexity': theoretical,
+                    'backend': backend,
+                    'extrapolated': False,
+                    'num_runs': num_runs,
+                    **profile_extras
                 }
                 
-                results.append(result_data)
+                self.record_result(problem_num, results, result_data)
                 
                 print(f"  Tiempo promedio: {avg_time:.6f} segundos ({avg_time * 1000:.3f} ms)")
-                print(f"  Operaciones: {operations:,}")
+                print(f"  Operaciones: {operations:,} ({num_runs} ejecuciones)")
+                if profile_extras.get('time_median') is not None:
+                    print(f"  Mediana: {profile_extras['time_median'] * 1000:.3f} ms "
+                          f"(p5-p95: {profile_extras['time_p5'] * 1000:.3f}-"
+                          f"{profile_extras['time_p95'] * 1000:.3f} ms, "
+                          f"CV {profile_extras['time_cv']:.1%}, "
+                          f"{profile_extras['outliers']} atípicos descartados)")
+                if profile_extras.get('remeasures'):
+                    print(f"  CV alto: número de muestras duplicado {profile_extras['remeasures']} veces")
+                if profile_extras.get('timing_controls'):
+                    print(f"  Controles de medición: {profile_extras['timing_controls']}")
+                if profile_extras.get('peak_alloc_bytes') is not None:
+                    print(f"  Memoria pico: {profile_extras['peak_alloc_bytes'] / 1024:.1f} KB asignados")
                 
             except KeyboardInterrupt:
                 print(f"\nAnálisis interrumpido en n = {n}")
+                self.interrupted = True
+                break
+            except SweepCancelled:
+                print(f"\nAnálisis cancelado en n = {n:,}")
+                self.interrupted = True
                 break
             except Exception as e:
                 print(f"  Error en n = {n}: {e}")
                 continue
+            finally:
+                if self.progress is not None:
+                    self.progress.n_done()
         
+        if self.cache is not None:
+            self.cache.flush()
+        
+        # Los resultados de la caché ya están en el historial
+        self.archive_results(problem_num, [r for r in results if r['n'] not in cached_n])
         self.results = results
         self.current_problem = problem_num
         return results
     
+    def parallel_sweep(self, problem_numbers, n_values=None, backend='python',
+                       workers=None, pin_cores=False):
+        """
+        Ejecuta un barrido de varios problemas en un pool de procesos
+        
+        Cada ejecución (problema, n, repetición) es un trabajo independiente.
+        Los trabajos se envían del más costoso al menos costoso (según la
+        complejidad teórica) para que el barrido tarde aproximadamente lo
+        mismo que su trabajo más largo, y los resultados se recogen en el
+        orden original.
+        
+        Args:
+            problem_numbers (list): Lista de números de problemas
+            n_values (list): Valores de n (None usa los valores por defecto de cada problema;
+                un dict permite indicar valores distintos por problema)
+            backend (str): Implementación a medir ('python' o 'numpy')
+            workers (int): Número de procesos (None usa todos los núcleos)
+            pin_cores (bool): Fijar cada proceso a un núcleo distinto
+            
+        Returns:
+            dict: Lista de resultados de cada problema indexada por número
+        """
+        if self.track_memory:
+            print("Advertencia: el modo de memoria no se aplica en modo paralelo")
+        if self.isolate:
+            print("Advertencia: el modo aislado no se aplica en modo paralelo")
+        if self.cache is not None:
+            print("Advertencia: la caché de mediciones no se usa en modo paralelo")
+        self.renderer.wait()
+        
+        jobs = []
+        run_indices = []
+        outcomes = []
+        for problem_num in problem_numbers:
+            if not Algorithms.get_problem_info(problem_num):
+                print(f"Problema {problem_num} no encontrado")
+                continue
+            
+            if isinstance(n_values, dict):
+                problem_n_values = n_values.get(problem_num, [])
+            elif n_values is not None:
+                problem_n_values = n_values
+            else:
+                problem_n_values = self.get_default_n_values(problem_num)
+            for n in problem_n_values:
+                num_runs = self.get_num_runs(n)
+                completed = {}
+                if self.checkpoint is not None:
+                    completed = self.checkpoint.completed_runs(problem_num, n, backend,
+                                                               f'runs={num_runs}+parallel')
+                
+                for repetition in range(num_runs):
+                    jobs.append((problem_num, n, backend))
+                    run_indices.append(repetition)
+                    outcomes.append(completed.get(repetition))
+        
+        # Solo se envían al pool las unidades que no están en el checkpoint
+        pending = [i for i, outcome in enumerate(outcomes) if outcome is None]
+        
+        workers = workers or os.cpu_count() or 1
+        print(f"Ejecutando {len(pending)} mediciones en {workers} procesos [backend: {backend}]")
+        if len(pending) < len(jobs):
+            print(f"Reanudando: {len(jobs) - len(pending)} mediciones recuperadas del checkpoint")
+        print("=" * 70)
+        
+        def on_complete(pending_index, outcome):
+            if self.checkpoint is None:
+                return
+            i = pending[pending_index]
+            problem_num, n, _ = jobs[i]
+            self.checkpoint.record(problem_num, n, backend, outcome[0], outcome[1],
+                                   run_index=run_indices[i],
+                                   mode=f'runs={self.get_num_runs(n)}+parallel')
+        
+        try:
+            pending_outcomes = run_jobs_in_pool([jobs[i] for i in pending], workers,
+                                                pin_cores, on_complete)
+        except KeyboardInterrupt:
+            print("\nBarrido paralelo interrumpido")
+            self.interrupted = True
+            return {problem_num: [] for problem_num in problem_numbers}
+        
+        for i, outcome in zip(pending, pending_outcomes):
+            outcomes[i] = outcome
+        self.sweep_id = new_sweep_id()
+        
+        # Agrupar las repeticiones de cada (problema, n) conservando el orden
+        grouped = {}
+        for (problem_num, n, _), outcome in zip(jobs, outcomes):
+            grouped.setdefault((problem_num, n), []).append(outcome)
+        
+        all_results = {problem_num: [] for problem_num in problem_numbers}
+        for (problem_num, n), job_outcomes in grouped.items():
+            errors = [outcome for outcome in job_outcomes if isinstance(outcome, Exception)]
+            if errors:
+                print(f"  Error en problema {problem_num}, n = {n}: {errors[0]}")
+                continue
+            
+            times = [elapsed for elapsed, _ in job_outcomes]
+            operations = job_outcomes[-1][1]
+            result_data = self.build_result(problem_num, n, times, operations, backend)
+            self.record_result(problem_num, all_results[problem_num], result_data)
+            
+            print(f"Problema {problem_num}, n = {n:,}: {result_data['time_seconds']:.6f} segundos "
+                  f"({result_data['time_ms']:.3f} ms), operaciones: {operations:,}")
+        
+        for problem_num, results in all_results.items():
+            self.archive_results(problem_num, results)
+        
+        return all_results
+    
+    def compare_backends(self, problem_num, n_values=None, backends=BACKENDS,
+                         adaptive=False, rigorous=False):
+        """
+        Mide los distintos backends lado a lado para un mismo problema
+        
+        Args:
+            problem_num (int): Número del problema (1, 2, o 3)
+            n_values (list): Lista de valores de n a analizar
+            backends (tuple): Backends a comparar
+            adaptive (bool): Medición adaptativa (ver run_analysis)
+            rigorous (bool): Medición rigurosa (ver run_analysis)
+            
+        Returns:
+            dict: Resultados de cada backend indexados por nombre
+        """
+        backend_results = {}
+        for backend in backends:
+            backend_results[backend] = self.run_analysis(problem_num, n_values, backend,
+                                                         adaptive=adaptive, rigorous=rigorous)
+        
+        reference = backend_results[backends[0]]
+        if not reference:
+            return backend_results
+        
+        table_data = []
+        for base in reference:
+            row = [f"{base['n']:,}"]
+            for backend in backends:
+                match = next((r for r in backend_results[backend] if r['n'] == base['n']), None)
+                row.append(f"{match['time_ms']:.3f}" if match else "-")
+            
+            for backend in backends[1:]:
+                match = next((r for r in backend_results[backend] if r['n'] == base['n']), None)
+                if match is None:
+                    row.append("-")
+                    continue
+                if match['operations'] != base['operations']:
+                    print(f"  Advertencia: {backend} obtuvo {match['operations']:,} operaciones "
+                          f"en n = {base['n']:,} (esperado {base['operations']:,})")
+                speedup = base['time_ms'] / match['time_ms'] if match['time_ms'] > 0 else float('inf')
+                row.append(f"{speedup:.1f}x")
+            
+            table_data.append(row)
+        
+        headers = ["Tamaño de Input (n)"]
+        headers += [f"Tiempo {backend} (ms)" for backend in backends]
+        headers += [f"Aceleración {backend}" for backend in backends[1:]]
+        
+        print("\n" + "=" * 80)
+        print(f"COMPARACIÓN DE BACKENDS - PROBLEMA {problem_num}")
+        print("=" * 80)
+        from tabulate import tabulate
+        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+        
+        return backend_results
+    
+    def compare_isolation(self, problem_num, n_values=None, backend='python', min_runs=5):
+        """
+        Compara la variabilidad de las mediciones en proceso y aisladas
+        
+        Cada n se mide primero en este proceso (que conserva el estado de los
+        n anteriores, como en un barrido normal) y luego con profile_isolated.
+        Sin repetición por CV alto, para comparar muestras del mismo tamaño.
+        
+        Args:
+            problem_num (int): Número del problema
+            n_values (list): Valores de n (None usa los valores por defecto hasta 10000)
+            backend (str): Backend a utilizar
+            min_runs (int): Mínimo de ejecuciones por modo
+            
+        Returns:
+            list: Por cada n, estadísticos de ambos modos y la razón de varianzas
+                (calculadas sin los valores atípicos, como el CV)
+        """
+        if n_values is None:
+            n_values = [n for n in self.get_default_n_values(problem_num) if n <= 10000]
+        
+        algorithm_func = Algorithms.get_algorithm(problem_num, backend)
+        core = 'sin fijar' if self.isolate_core is None else f'núcleo {self.isolate_core}'
+        print(f"Comparando mediciones en proceso y aisladas ({core}) "
+              f"para el problema {problem_num} [backend: {backend}]")
+        
+        comparison = []
+        for n in n_values:
+            num_runs = max(min_runs, self.get_num_runs(n))
+            
+            self.profile_algorithm(algorithm_func, n, num_runs, max_remeasures=0)
+            in_process = self.last_profile
+            self.profile_isolated(problem_num, n, backend, num_runs, max_remeasures=0)
+            isolated = self.last_profile
+            
+            # Sin atípicos, igual que el CV de cada modo
+            var_in_process = np.var(reject_outliers(in_process['samples'])[0], ddof=1)
+            var_isolated = np.var(reject_outliers(isolated['samples'])[0], ddof=1)
+            comparison.append({
+                'n': n,
+                'num_runs': num_runs,
+                'in_process_median': in_process['time_median'],
+                'isolated_median': isolated['time_median'],
+                'in_process_cv': in_process['time_cv'],
+                'isolated_cv': isolated['time_cv'],
+                'variance_ratio': (var_in_process / var_isolated if var_isolated > 0
+                                   else float('inf'))
+            })
+        
+        table_data = [[
+            f"{c['n']:,}",
+            c['num_runs'],
+            f"{c['in_process_median'] * 1000:.3f}",
+            f"{c['isolated_median'] * 1000:.3f}",
+            f"{c['in_process_cv']:.1%}",
+            f"{c['isolated_cv']:.1%}",
+            f"{c['variance_ratio']:.2f}"
+        ] for c in comparison]
+        headers = ["Tamaño de Input (n)", "Ejecuciones", "Mediana en proceso (ms)",
+                   "Mediana aislada (ms)", "CV en proceso", "CV aislado",
+                   "Varianza proceso/aislada"]
+        
+        print("\n" + "=" * 80)
+        print(f"AISLAMIENTO DE MEDICIONES - PROBLEMA {problem_num}")
+        print("=" * 80)
+        from tabulate import tabulate
+        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+        
+        noisier = [c['n'] for c in comparison if c['variance_ratio'] > 2]
+        if noisier:
+            print(f"Varianza en proceso más del doble que aislada en n = "
+                  f"{', '.join(f'{n:,}' for n in noisier)}")
+        
+        return comparison
+    
+    def benchmark_partitioned(self, problem_num, n_values, workers_list=None, pin_cores=False):
+        """
+        Compara la ejecución serial contra la particionada del bucle externo
+        
+        Para cada n mide una llamada serial y una particionada por cada número
+        de procesos, y reporta la aceleración y la eficiencia de escalado
+        (aceleración / procesos).
+        
+        Args:
+            problem_num (int): Número del problema (1 o 3)
+            n_values (list): Lista de valores de n a medir
+            workers_list (list): Números de procesos a probar (por defecto 2 y os.cpu_count())
+            pin_cores (bool): Fijar cada proceso a un núcleo distinto
+            
+        Returns:
+            list: Lista de diccionarios con n, workers, tiempos, aceleración y eficiencia
+        """
+        if PartitionedAlgorithms.get_chunk_func(problem_num) is None:
+            print(f"El Problema {problem_num} no admite ejecución particionada")
+            return []
+        
+        if workers_list is None:
+            workers_list = sorted({2, os.cpu_count() or 1})
+        
+        algorithm_func = Algorithms.get_algorithm(problem_num)
+        rows = []
+        table_data = []
+        
+        for n in n_values:
+            serial_time, _, serial_result = self.profile_algorithm(algorithm_func, n, num_runs=1)
+            serial_time = float(serial_time)
+            
+            for workers in workers_list:
+                elapsed, result = run_partitioned(problem_num, n, workers, pin_cores=pin_cores)
+                if result != serial_result:
+                    print(f"  Advertencia: la ejecución particionada obtuvo {result:,} operaciones "
+                          f"en n = {n:,} (esperado {serial_result:,})")
+                
+                speedup = serial_time / elapsed if elapsed > 0 else float('inf')
+                efficiency = speedup / workers
+                rows.append({
+                    'n': n,
+                    'workers': workers,
+                    'serial_seconds': serial_time,
+                    'partitioned_seconds': elapsed,
+                    'speedup': speedup,
+                    'efficiency': efficiency,
+                    'operations': result
+                })
+                table_data.append([
+                    f"{n:,}", workers, f"{serial_time * 1000:.3f}", f"{elapsed * 1000:.3f}",
+                    f"{speedup:.2f}x", f"{efficiency:.0%}"
+                ])
+        
+        headers = ["Tamaño de Input (n)", "Procesos", "Serial (ms)", "Particionado (ms)",
+                   "Aceleración", "Eficiencia"]
+        
+        print("\n" + "=" * 80)
+        print(f"EJECUCIÓN PARTICIONADA - PROBLEMA {problem_num}")
+        print("=" * 80)
+        from tabulate import tabulate
+        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+        
+        return rows
+    
+    def count_analysis(self, problem_num, n_values):
+        """
+        Calcula operaciones y complejidad teórica sin ejecutar los bucles
+        
+        Usa el conteo en forma cerrada de OperationCounter, por lo que
+        funciona para cualquier n (incluso n = 10^12) de forma instantánea.
+        
+        Args:
+            problem_num (int): Número del problema (1, 2, o 3)
+            n_values (list): Lista de valores de n a calcular
+        
+        Returns:
+            list: Lista de diccionarios con n, operaciones y complejidad teórica
+        """
+        if not Algorithms.get_problem_info(problem_num):
+            print(f"Problema {problem_num} no encontrado")
+            return []
+        
+        return [
+            {
+                'n': n,
+                'operations': OperationCounter.count(problem_num, n),
+                'theoretical_complexity': Algorithms.get_theoretical_complexity(problem_num, n)
+            }
+            for n in n_values
+        ]
+    
+    def verify_counts(self, problem_num, n_max=50):
+        """
+        Verifica el conteo en forma cerrada contra los bucles reales para n pequeños
+        
+        Args:
+            problem_num (int): Número del problema (1, 2, o 3)
+            n_max (int): Mayor n verificado (se verifican 0..n_max)
+        
+        Returns:
+            list: Tuplas (n, esperado, obtenido) que no coinciden (de OperationCounter.verify)
+        """
+        if not Algorithms.get_problem_info(problem_num):
+            print(f"Problema {problem_num} no encontrado")
+            return []
+        
+        mismatches = OperationCounter.verify(problem_num, range(n_max + 1))
+        if not mismatches:
+            largest = self.count_analysis(problem_num, [10 ** 12])[0]
+            print(f"Problema {problem_num}: el conteo en forma cerrada coincide con los bucles "
+                  f"para n = 0..{n_max} (n = 10^12: {largest['operations']:,} operaciones)")
+            return mismatches
+        
+        print(f"Problema {problem_num}: {len(mismatches)} valores de n no coinciden")
+        for n, expected, obtained in mismatches:
+            print(f"  n = {n}: bucles {expected:,}, forma cerrada {obtained:,}")
+        return mismatches
+    
+    def doubling_experiment(self, problem_num, n_start=8, backend='python', max_time=60.0,
+                            min_time=1e-3, settle_count=3, tolerance=0.1, max_doublings=30,
+                            rigorous=False):
+        """
+        Experimento de duplicación: mide T(n), T(2n), T(4n), ... hasta que el exponente se estabiliza
+        
+        El exponente estimado es b = log2(T(2n) / T(n)); para T(n) ≈ c·n^b
+        tiende a b (los factores logarítmicos lo acercan lentamente al entero).
+        Las parejas cuyo tiempo menor es inferior a min_time se reportan pero
+        no cuentan, porque en ellas domina el costo fijo de cada llamada. El
+        experimento termina cuando los últimos settle_count exponentes difieren
+        en menos de tolerance, o cuando la siguiente medición (estimada con el
+        último cociente) no cabe en max_time.
+        
+        Args:
+            problem_num (int): Número del problema (1, 2, o 3)
+            n_start (int): Primer valor de n
+            backend (str): Implementación a medir ('python' o 'numpy')
+            max_time (float): Tiempo total máximo del experimento en segundos
+            min_time (float): Tiempo mínimo para que un cociente cuente
+            settle_count (int): Exponentes consecutivos que deben coincidir
+            tolerance (float): Diferencia máxima entre esos exponentes
+            max_doublings (int): Máximo de duplicaciones
+            rigorous (bool): Usar el modo de medición riguroso de profile_algorithm
+            
+        Returns:
+            dict: 'results' (formato de run_analysis), 'doublings' (n, cociente y
+                exponente de cada pareja), 'exponent' (estimación final o None) y
+                'settled' (si el exponente se estabilizó)
+        """
+        problem_info = Algorithms.get_problem_info(problem_num)
+        if not problem_info:
+            print(f"Problema {problem_num} no encontrado")
+            return {'results': [], 'doublings': [], 'exponent': None, 'settled': False}
+        
+        algorithm_func = Algorithms.get_algorithm(problem_num, backend)
+        print(f"Experimento de duplicación para Problema {problem_num}: {problem_info['name']} "
+              f"({problem_info['complexity']}) [backend: {backend}]")
+        print("=" * 70)
+        
+        results = []
+        doublings = []
+        counted = []
+        settled = False
+        self.sweep_id = new_sweep_id()
+        start_time = time.perf_counter()
+        n = max(1, n_start)
+        
+        try:
+            for _ in range(max_doublings + 1):
+                num_runs = self.get_num_runs(n)
+                avg_time, _, operations = self.profile_algorithm(
+                    algorithm_func, n, num_runs, rigorous=rigorous
+                )
+                result_data = self.build_result(problem_num, n, self.last_profile['samples'],
+                                                operations, backend)
+                result_data.update({key: self.last_profile[key] for key in PROFILE_COLUMNS
+                                    if key in self.last_profile})
+                self.record_result(problem_num, results, result_data)
+                
+                if len(results) > 1:
+                    previous = results[-2]['time_seconds']
+                    ratio = avg_time / previous if previous > 0 else float('inf')
+                    exponent = float(np.log2(ratio)) if 0 < ratio < float('inf') else float('nan')
+                    reliable = previous >= min_time
+                    doublings.append({'n': n, 'ratio': float(ratio), 'exponent': exponent,
+                                      'reliable': reliable})
+                    if reliable:
+                        counted.append(exponent)
+                    print(f"n = {n:,}: {avg_time * 1000:.3f} ms, T(n)/T(n/2) = {ratio:.3f}, "
+                          f"exponente = {exponent:.3f}" + ("" if reliable else " (costo fijo)"))
+                else:
+                    ratio = None
+                    print(f"n = {n:,}: {avg_time * 1000:.3f} ms")
+                
+                recent = counted[-settle_count:]
+                if len(recent) == settle_count and max(recent) - min(recent) < tolerance:
+                    settled = True
+                    break
+                
+                # Estimar la siguiente medición con el último cociente (2^3 si aún no hay)
+                growth = ratio if ratio is not None and ratio > 1 else 8.0
+                remaining = max_time - (time.perf_counter() - start_time)
+                if avg_time * growth * self.get_num_runs(2 * n) > remaining:
+                    print("Tiempo máximo alcanzado antes de estabilizar el exponente")
+                    break
+                
+                n *= 2
+        except KeyboardInterrupt:
+            print(f"\nExperimento interrumpido en n = {n:,}")
+            self.interrupted = True
+        
+        exponent = float(np.mean(counted[-settle_count:])) if counted else None
+        self.archive_results(problem_num, results)
+        self.results = results
+        self.current_problem = problem_num
+        
+        if doublings:
+            table_data = [
+                [f"{d['n'] // 2:,} → {d['n']:,}", f"{d['ratio']:.3f}", f"{d['exponent']:.3f}",
+                 "sí" if d['reliable'] else "no (costo fijo)"]
+                for d in doublings
+            ]
+            print("\n" + "=" * 80)
+            print(f"EXPERIMENTO DE DUPLICACIÓN - PROBLEMA {problem_num}")
+            print("=" * 80)
+            from tabulate import tabulate
+            print(tabulate(table_data, headers=["Duplicación", "T(2n)/T(n)", "log2 del cociente",
+                                                "Cuenta"], tablefmt="grid"))
+        
+        if exponent is not None:
+            state = "estable" if settled else "sin estabilizar"
+            print(f"Exponente estimado: {exponent:.3f} ({state}) → T(n) ≈ c·n^{exponent:.2f}; "
+                  f"complejidad declarada {problem_info['complexity']}")
+        
+        return {'results': results, 'doublings': doublings, 'exponent': exponent, 'settled': settled}
+    
     def create_results_table(self, results, problem_num):
         """
         Crea y muestra la tabla de resultados
@@ -147,23 +1655,50 @@ class PerformanceAnalyzer:
             print("No hay resultados para mostrar")
             return [], []
         
+        has_extrapolated = any(r.get('extrapolated') for r in results)
+        has_memory = any(r.get('peak_alloc_bytes') is not None for r in results)
+        has_robust = any(r.get('time_median') is not None for r in results)
+        
         table_data = []
         for result in results:
-            table_data.append([
+            rates = throughput(result)
+            row = [
                 f"{result['n']:,}",
                 f"{result['time_seconds']:.6f}",
                 f"{result['time_ms']:.3f}",
                 f"{result['operations']:,}",
-                f"{result['theoretical_complexity']:.0f}"
-            ])
+                f"{result['theoretical_complexity']:.0f}",
+                f"{rates['ops_per_second']:.3e}" if rates else "-",
+                f"{rates['ns_per_op']:.1f}" if rates else "-"
+            ]
+            if has_robust:
+                if result.get('time_median') is not None:
+                    row.append(f"{result['time_median'] * 1000:.3f}")
+                    row.append(f"{result['time_p5'] * 1000:.3f}–{result['time_p95'] * 1000:.3f}")
+                else:
+                    row += ["-", "-"]
+            if has_memory:
+                row.append(_format_bytes(result.get('peak_alloc_bytes')))
+                row.append(_format_bytes(result.get('peak_rss_bytes')))
+            if has_extrapolated:
+                row.append("EXTRAPOLADO" if result.get('extrapolated') else "medido")
+            table_data.append(row)
         
         headers = [
             "Tamaño de Input (n)", 
             "Tiempo (segundos)", 
             "Tiempo (ms)", 
             "Operaciones", 
-            "Complejidad Teórica"
+            "Complejidad Teórica",
+            "Ops/s",
+            "ns/op"
         ]
+        if has_robust:
+            headers += ["Mediana (ms)", "p5–p95 (ms)"]
+        if has_memory:
+            headers += ["Memoria Pico", "Aumento RSS"]
+        if has_extrapolated:
+            headers.append("Estado")
         
         problem_info = Algorithms.get_problem_info(problem_num)
         
@@ -171,6 +1706,7 @@ class PerformanceAnalyzer:
         print(f"TABLA DE RESULTADOS - PROBLEMA {problem_num}")
         print(f"{problem_info['name']} - {problem_info['complexity']}")
         print("=" * 80)
+        from tabulate import tabulate
         print(tabulate(table_data, headers=headers, tablefmt="grid"))
         
         return table_data, headers
@@ -179,6 +1715,12 @@ class PerformanceAnalyzer:
         """
         Crea la visualización gráfica de los resultados
         
+        Genera la gráfica de tiempo contra n y la de costo por operación
+        (ns/op y operaciones por segundo contra n). Sin gráficas en pantalla,
+        las figuras se dibujan con self.renderer (figuras reutilizadas y, si el
+        renderizador es en segundo plano, sin esperar a que terminen). Con
+        gráficas en pantalla se usa pyplot, reutilizando las ventanas del problema.
+        
         Args:
             results (list): Lista de resultados
             problem_num (int): Número del problema
@@ -187,34 +1729,24 @@ class PerformanceAnalyzer:
             print("No hay resultados para graficar")
             return
         
-        n_values = [r['n'] for r in results]
-        times_ms = [r['time_ms'] for r in results]
-        
-        problem_info = Algorithms.get_problem_info(problem_num)
-        
-        # Crear la gráfica
-        plt.figure(figsize=(12, 7))
-        
-        plt.plot(n_values, times_ms, 'bo-', linewidth=2, markersize=8, 
-                label=f'Tiempo medido - {problem_info["complexity"]}')
-        plt.xlabel('Tamaño de Input (n)', fontsize=12)
-        plt.ylabel('Tiempo de Ejecución (ms)', fontsize=12)
-        plt.title(f'Problema {problem_num}: {problem_info["name"]}\n'
-                 f'Tiempo de Ejecución vs Tamaño de Input', 
-                 fontsize=14, fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.legend(fontsize=11)
-        
-        # Formatear para mejor apariencia
-        plt.tight_layout()
+        if not self.show_plots:
+            for rendered in (self.renderer.render_problem(results, problem_num),
+                             self.renderer.render_throughput(results, problem_num)):
+                if isinstance(rendered, str):
+                    print(f"Gráfica guardada en: {rendered}")
+            return
         
-        # Guardar la gráfica
-        filename = f'performance_analysis_problem_{problem_num}.png'
-        filepath = os.path.join(self.results_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.show()
+        plt = load_pyplot()
+        fig = plt.figure(num=f'Problema {problem_num}', figsize=PROBLEM_FIGSIZE, clear=True)
+        draw_problem(fig, results, problem_num)
+        filepath = self.renderer.save(fig, f'performance_analysis_problem_{problem_num}')
+        print(f"Gráfica guardada en: {filepath}")
         
+        fig = plt.figure(num=f'Problema {problem_num} (ns/op)', figsize=PROBLEM_FIGSIZE, clear=True)
+        draw_throughput(fig, results, problem_num)
+        filepath = self.renderer.save(fig, f'performance_throughput_problem_{problem_num}')
         print(f"Gráfica guardada en: {filepath}")
+        plt.show()
     
     def save_results_to_csv(self, results, problem_num):
         """
@@ -228,7 +1760,10 @@ class PerformanceAnalyzer:
             print("No hay resultados para guardar")
             return
         
-        df = pd.DataFrame(results)
+        import pandas as pd
+        # Las muestras crudas quedan en el flujo JSONL y en la caché
+        df = pd.DataFrame([{key: value for key, value in r.items() if key != 'samples'}
+                           for r in results])
         filename = f'performance_results_problem_{problem_num}.csv'
         filepath = os.path.join(self.results_dir, filename)
         df.to_csv(filepath, index=False)
@@ -255,10 +1790,48 @@ class PerformanceAnalyzer:
         print("=" * 80)
         print(f"• Complejidad teórica: {problem_info['complexity']}")
         print(f"• Descripción: {problem_info['description']}")
+        
+        try:
+            nest = analyze_problem(problem_num)
+            print(f"• Complejidad derivada del código C: {nest.big_o()} "
+                  f"(término dominante {nest.leading_term()})")
+            if nest.big_o() != problem_info['complexity']:
+                print(f"  Advertencia: difiere de la complejidad declarada {problem_info['complexity']}")
+        except ValueError as e:
+            print(f"• Complejidad derivada del código C: no disponible ({e})")
         print(f"• Valores de n analizados: {len(results)}")
+        
+        extrapolated = [r['n'] for r in results if r.get('extrapolated')]
+        if extrapolated:
+            print(f"• Valores extrapolados (presupuesto excedido): {', '.join(f'{n:,}' for n in extrapolated)}")
         print(f"• Tiempo mínimo: {min(r['time_ms'] for r in results):.3f} ms")
         print(f"• Tiempo máximo: {max(r['time_ms'] for r in results):.3f} ms")
         
+        controls = [r['timing_controls'] for r in results if isinstance(r.get('timing_controls'), str)]
+        if controls:
+            parts = [part for part in controls[0].split(';') if not part.startswith('loops=')]
+            loops = [int(part[len('loops='):]) for c in controls for part in c.split(';')
+                     if part.startswith('loops=')]
+            print(f"• Medición rigurosa: {', '.join(parts)}, "
+                  f"{min(loops):,}–{max(loops):,} llamadas por muestra")
+        
+        with_robust = [r for r in results if r.get('time_median') is not None]
+        if with_robust:
+            noisiest = max(with_robust, key=lambda r: r['time_cv'])
+            print(f"• Atípicos descartados: {sum(r['outliers'] for r in with_robust)} muestras; "
+                  f"mayor CV = {noisiest['time_cv']:.1%} (n = {noisiest['n']:,})")
+            remeasured = [r['n'] for r in with_robust if r.get('remeasures')]
+            if remeasured:
+                print(f"• Remedidos por CV > {MAX_CV:.0%}: {', '.join(f'{n:,}' for n in remeasured)}")
+        
+        with_memory = [r for r in results if r.get('peak_alloc_bytes') is not None]
+        if with_memory:
+            print(f"• Memoria pico asignada: "
+                  f"{_format_bytes(max(r['peak_alloc_bytes'] for r in with_memory))}")
+            rss_values = [r['peak_rss_bytes'] for r in with_memory if r.get('peak_rss_bytes') is not None]
+            if rss_values:
+                print(f"• Aumento máximo del RSS: {_format_bytes(max(rss_values))}")
+        
         # Calcular factor de crecimiento
         if len(results) > 1:
             first_time = results[0]['time_ms']
@@ -267,52 +1840,190 @@ class PerformanceAnalyzer:
                 growth_factor = last_time / first_time
                 print(f"• Factor de crecimiento total: {growth_factor:.2f}x")
         
+        # Ajuste empírico de complejidad
+        fits = self.fit_complexity(results, problem_num)
+        for column, label in (('time_seconds', 'tiempo'), ('operations', 'operaciones')):
+            fit = fits.get(column)
+            if fit is None:
+                continue
+            
+            best = fit['best']
+            power_law = fit['power_law']
+            max_residual = max(abs(residual) for residual in best['residuals'])
+            print(f"• Clase empírica ({label}): {best['model']} "
+                  f"[c = {best['scale']:.3e}, constante = {best['intercept']:.3e}, "
+                  f"R² = {best['r_squared']:.4f}, residuo máx. = {max_residual:.1%}]")
+            print(f"  Ley de potencias: {label} ≈ {power_law['coefficient']:.3e} · "
+                  f"n^{power_law['exponent']:.3f} (R² = {power_law['r_squared']:.4f})")
+            if fit['disagrees']:
+                print(f"  Advertencia: difiere de la complejidad declarada {fit['declared']}")
+        
+        overhead = fits.get('call_overhead')
+        if overhead is not None:
+            costs = [(r['n'], throughput(r)['ns_per_op']) for r in results if throughput(r)]
+            print(f"• Costo por operación: {costs[0][1]:.1f} ns/op (n = {costs[0][0]:,}) → "
+                  f"{costs[-1][1]:.1f} ns/op (n = {costs[-1][0]:,})")
+            print(f"• Costo fijo por llamada: {overhead['overhead_seconds'] * 1e6:.2f} µs + "
+                  f"{overhead['ns_per_op']:.1f} ns/op (T = t0 + c·operaciones, "
+                  f"R² = {overhead['r_squared']:.4f})")
+        
+        ratio = fits.get('theoretical_ratio')
+        if ratio is not None and not 0.5 <= ratio <= 2:
+            print(f"• Advertencia: operaciones ≈ {ratio:.3f} × complejidad teórica "
+                  f"(la fórmula teórica omite constantes)")
+        
         print("=" * 80)
     
-    def compare_problems(self, problem_numbers, n_values=None):
+    def fit_complexity(self, results, problem_num):
+        """
+        Ajusta los resultados a los modelos de complejidad candidatos
+        
+        Args:
+            results (list): Lista de resultados
+            problem_num (int): Número del problema
+            
+        Returns:
+            dict: Ajustes de 'time_seconds' y 'operations' (ver complexity_fit.classify),
+                'theoretical_ratio' (operaciones / complejidad teórica) y
+                'call_overhead' (ver complexity_fit.fit_call_overhead)
+        """
+        declared = Algorithms.get_problem_info(problem_num).get('complexity')
+        
+        return {
+            'time_seconds': classify(results, declared, 'time_seconds'),
+            'operations': classify(results, declared, 'operations'),
+            'theoretical_ratio': theoretical_ratio(results),
+            'call_overhead': fit_call_overhead(results)
+        }
+    
+    def compare_problems(self, problem_numbers, n_values=None, workers=1, pin_cores=False,
+                         backend='python', grid_budget=None, points_per_decade=4):
         """
         Compara múltiples problemas en una sola gráfica
         
         Args:
             problem_numbers (list): Lista de números de problemas a comparar
             n_values (list): Lista de valores de n a analizar
+            workers (int): Número de procesos; con más de 1 todos los problemas
+                se miden juntos en un solo pool
+            pin_cores (bool): Fijar cada proceso a un núcleo distinto
+            backend (str): Implementación a medir ('python' o 'numpy')
+            grid_budget (float): Tiempo total en segundos, repartido entre los
+                problemas, para elegir los n con GridPlanner (si n_values es None)
+            points_per_decade (int): Densidad de la malla de GridPlanner
+        
+        Los pares (problema, n) ya medidos en la sesión se reutilizan; solo se
+        miden los que faltan.
+        
+        Returns:
+            dict: Resultados de cada problema indexados por número
+        """
+        problem_n_values = self.measure_comparison(problem_numbers, n_values, workers, pin_cores,
+                                                   backend, grid_budget, points_per_decade)
+        return self.plot_comparison(problem_numbers, problem_n_values, backend)
+    
+    def measure_comparison(self, problem_numbers, n_values=None, workers=1, pin_cores=False,
+                           backend='python', grid_budget=None, points_per_decade=4):
+        """
+        Mide los pares (problema, n) de una comparación que faltan en la sesión
+        
+        Con grid_budget, los problemas sin resultados en la sesión se miden con
+        la malla adaptativa de run_analysis; los que ya tienen resultados
+        planifican la malla con esos tiempos y solo miden los n que faltan.
+        
+        Args:
+            problem_numbers (list): Lista de números de problemas a comparar
+            n_values (list): Lista de valores de n a analizar
+            workers (int): Número de procesos
+            pin_cores (bool): Fijar cada proceso a un núcleo distinto
+            backend (str): Implementación a medir ('python' o 'numpy')
+            grid_budget (float): Tiempo total en segundos para elegir los n (si n_values es None)
+            points_per_decade (int): Densidad de la malla de GridPlanner
+        
+        Returns:
+            dict: Valores de n de cada problema indexados por número
         """
-        if n_values is None:
-            n_values = [1, 10, 100, 1000, 10000, 100000, 1000000]  # Valores completos para comparación
+        problem_n_values = {}
+        measured_now = set()
+        if n_values is None and grid_budget is not None:
+            share = grid_budget / len(problem_numbers)
+            for problem_num in problem_numbers:
+                if self.cancel_event.is_set():
+                    break
+                stored = self.session_results.get((problem_num, backend), {})
+                known = [r for r in stored.values() if not r.get('extrapolated')]
+                if known:
+                    # Con tiempos de la sesión el plan se fija de antemano y los
+                    # n ya medidos no consumen presupuesto
+                    planner = GridPlanner(self, problem_num, share, points_per_decade)
+                    problem_n_values[problem_num] = planner.plan(known, share,
+                                                                 measured={r['n'] for r in known})
+                    continue
+                
+                print(f"\nAnalizando Problema {problem_num} para comparación "
+                      f"(presupuesto {share:.1f} s)...")
+                results = self.run_analysis(problem_num, backend=backend, workers=workers,
+                                            pin_cores=pin_cores, grid_budget=share,
+                                            points_per_decade=points_per_decade)
+                problem_n_values[problem_num] = [r['n'] for r in results if not r.get('extrapolated')]
+                measured_now.add(problem_num)
+        else:
+            if n_values is None:
+                n_values = [1, 10, 100, 1000, 10000, 100000, 1000000]  # Valores completos para comparación
+            problem_n_values = {problem_num: n_values for problem_num in problem_numbers}
         
-        plt.figure(figsize=(12, 8))
-        colors = ['blue', 'red', 'green', 'orange', 'purple']
+        # Medir solo los pares (problema, n) que no están en la sesión
+        missing = {}
+        for problem_num, n_values in problem_n_values.items():
+            stored = self.session_results.get((problem_num, backend), {})
+            missing_n = [n for n in n_values if n not in stored]
+            if missing_n:
+                missing[problem_num] = missing_n
+            if len(missing_n) < len(n_values) and problem_num not in measured_now:
+                print(f"Problema {problem_num}: {len(n_values) - len(missing_n)} valores de n "
+                      f"reutilizados de la sesión")
         
-        all_results = {}
+        if workers > 1 and missing:
+            self.parallel_sweep(list(missing), missing, backend, workers, pin_cores)
+        else:
+            for problem_num, missing_n in missing.items():
+                if self.cancel_event.is_set():
+                    break
+                print(f"\nAnalizando Problema {problem_num} para comparación...")
+                self.run_analysis(problem_num, missing_n, backend)
         
-        for i, problem_num in enumerate(problem_numbers):
-            print(f"\nAnalizando Problema {problem_num} para comparación...")
-            results = self.run_analysis(problem_num, n_values)
-            
+        return problem_n_values
+    
+    def plot_comparison(self, problem_numbers, problem_n_values, backend='python'):
+        """
+        Grafica juntos los resultados de la sesión de varios problemas
+        
+        Args:
+            problem_numbers (list): Lista de números de problemas
+            problem_n_values (dict): Valores de n de cada problema (de measure_comparison)
+            backend (str): Backend cuyos resultados graficar
+        
+        Returns:
+            dict: Resultados de cada problema indexados por número
+        """
+        all_results = {}
+        for problem_num in problem_numbers:
+            results = self.get_session_results(problem_num, problem_n_values.get(problem_num, []),
+                                               backend)
             if results:
                 all_results[problem_num] = results
-                n_vals = [r['n'] for r in results]
-                times_ms = [r['time_ms'] for r in results]
-                
-                problem_info = Algorithms.get_problem_info(problem_num)
-                label = f'Problema {problem_num}: {problem_info["complexity"]}'
-                
-                plt.plot(n_vals, times_ms, f'{colors[i % len(colors)]}o-', 
-                        linewidth=2, markersize=8, label=label)
-        
-        plt.xlabel('Tamaño de Input (n)', fontsize=12)
-        plt.ylabel('Tiempo de Ejecución (ms)', fontsize=12)
-        plt.title('Comparación de Complejidades Temporales', fontsize=14, fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.legend(fontsize=11)
-        plt.yscale('log')  # Escala logarítmica para mejor comparación
-        plt.tight_layout()
-        
-        # Guardar comparación
-        comparison_path = os.path.join(self.results_dir, 'comparison_all_problems.png')
-        plt.savefig(comparison_path, dpi=300, bbox_inches='tight')
-        plt.show()
         
+        if not self.show_plots:
+            rendered = self.renderer.render_comparison(all_results, problem_numbers)
+            if isinstance(rendered, str):
+                print(f"\nGráfica de comparación guardada en: {rendered}")
+            return all_results
+        
+        plt = load_pyplot()
+        fig = plt.figure(num='Comparación', figsize=COMPARISON_FIGSIZE, clear=True)
+        draw_comparison(fig, all_results, problem_numbers)
+        comparison_path = self.renderer.save(fig, 'comparison_all_problems')
         print(f"\nGráfica de comparación guardada en: {comparison_path}")
+        plt.show()
         
         return all_results
\ No newline at end of file
@@ -0,0 +1,365 @@
+"""
+Módulo de Ejecución en Segundo Plano
+Ejecuta barridos en un hilo aparte con barra de progreso, tiempo estimado y cancelación.
+"""
+
+import io
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+from algorithms import Algorithms
+from grid_planner import DEFAULT_SECONDS_PER_UNIT
+
+
+class SweepCancelled(Exception):
+    """El barrido se canceló a pedido del usuario"""
+
+
+def _format_duration(seconds):
+    """
+    Formatea una duración como h:mm:ss o m:ss
+    
+    Args:
+        seconds (float): Duración en segundos (None si se desconoce)
+    
+    Returns:
+        str: Duración formateada
+    """
+    if seconds is None:
+        return "?"
+    
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+class SweepProgress:
+    """
+    Progreso de un barrido y estimación del tiempo restante
+    
+    run_analysis informa cada n que empieza (con los n que faltan) y
+    profile_algorithm cada ejecución terminada. El tiempo restante suma:
+    
+    - el n en curso: el promedio de sus ejecuciones ya medidas, o la
+      predicción si aún no terminó ninguna, por las ejecuciones que faltan
+      (descontando lo que lleva la ejecución en curso)
+    - los n siguientes: get_num_runs(n) × T(n), con T(n) de predict_time
+      (c · f(n) ajustado a los tiempos medidos, con f de
+      get_theoretical_complexity) o DEFAULT_SECONDS_PER_UNIT · f(n) sin datos
+    
+    La fracción de la barra es transcurrido / (transcurrido + restante), por
+    lo que avanza según el tiempo y no según la cantidad de n.
+    """
+    
+    def __init__(self, analyzer):
+        """
+        Inicializa el progreso
+        
+        Args:
+            analyzer (PerformanceAnalyzer): Analizador que aporta predict_time y get_num_runs
+        """
+        self.analyzer = analyzer
+        self.lock = threading.Lock()
+        self.start_time = time.perf_counter()
+        self.problem_num = None
+        self.n = None
+        self.num_runs = 0
+        self.run_times = []
+        self.run_start = self.start_time
+        self.upcoming = []
+        self.results = []
+        self.completed = 0
+    
+    def begin_n(self, problem_num, n, num_runs, upcoming, results):
+        """
+        Registra el inicio de la medición de un n
+        
+        Args:
+            problem_num (int): Número del problema
+            n (int): Tamaño de entrada que empieza
+            num_runs (int): Ejecuciones previstas
+            upcoming (list): n que faltan después de este
+            results (list): Resultados ya medidos del problema
+        """
+        with self.lock:
+            self.problem_num = problem_num
+            self.n = n
+            self.num_runs = num_runs
+            self.run_times = []
+            self.run_start = time.perf_counter()
+            self.upcoming = list(upcoming)
+            self.results = results
+    
+    def run_done(self, elapsed):
+        """
+        Registra una ejecución terminada del n en curso
+        
+        Args:
+            elapsed (float): Tiempo de la ejecución en segundos
+        """
+        with self.lock:
+            self.run_times.append(elapsed)
+            self.run_start = time.perf_counter()
+    
+    def extend_runs(self, num_runs):
+        """
+        Actualiza las ejecuciones previstas del n en curso (al repetir la medición)
+        
+        Args:
+            num_runs (int): Nuevo total de ejecuciones
+        """
+        with self.lock:
+            self.num_runs = num_runs
+    
+    def n_done(self):
+        """Registra que el n en curso terminó"""
+        with self.lock:
+            self.completed += 1
+            self.n = None
+    
+    def _predict(self, problem_num, n, results):
+        """Tiempo estimado de una ejecución de n"""
+        predicted = self.analyzer.predict_time(problem_num, n, results)
+        if predicted is None:
+            predicted = DEFAULT_SECONDS_PER_UNIT * Algorithms.get_theoretical_complexity(problem_num, n)
+        return predicted
+    
+    def remaining(self):
+        """
+        Estima el tiempo que falta para terminar el barrido
+        
+        Returns:
+            float: Segundos restantes (None si aún no empezó ningún n)
+        """
+        with self.lock:
+            if self.problem_num is None:
+                return None
+            problem_num, n, num_runs = self.problem_num, self.n, self.num_runs
+            run_times = list(self.run_times)
+            in_flight = time.perf_counter() - self.run_start
+            upcoming = list(self.upcoming)
+            results = list(self.results)
+        
+        remaining = 0.0
+        if n is not None:
+            per_run = np.mean(run_times) if run_times else self._predict(problem_num, n, results)
+            remaining += max(num_runs - len(run_times), 0) * per_run
+            remaining = max(remaining - in_flight, 0.0)
+        
+        for upcoming_n in upcoming:
+            remaining += self.analyzer.get_num_runs(upcoming_n) * self._predict(problem_num, upcoming_n,
+                                                                                results)
+        
+        return remaining
+    
+    def render(self, width=30):
+        """
+        Construye la línea de la barra de progreso
+        
+        Args:
+            width (int): Ancho de la barra en caracteres
+        
+        Returns:
+            str: Barra, porcentaje, punto en curso, tiempo transcurrido y restante
+        """
+        elapsed = time.perf_counter() - self.start_time
+        remaining = self.remaining()
+        fraction = 0.0
+        if remaining is not None and elapsed + remaining > 0:
+            fraction = elapsed / (elapsed + remaining)
+        
+        filled = int(round(fraction * width))
+        bar = '#' * filled + '-' * (width - filled)
+        
+        with self.lock:
+            if self.n is not None:
+                point = (f"Problema {self.problem_num}, n = {self.n:,} "
+                         f"({len(self.run_times)}/{self.num_runs})")
+            else:
+                point = f"{self.completed} valores de n completados"
+        
+        return (f"[{bar}] {fraction:4.0%}  {point}  "
+                f"transcurrido {_format_duration(elapsed)}  ETA {_format_duration(remaining)}")
+
+
+class _ThreadOutput(io.TextIOBase):
+    """
+    Salida estándar que separa lo que escribe el hilo del barrido
+    
+    Las líneas del hilo del barrido se guardan hasta que el menú las pide;
+    las de los demás hilos pasan directamente a la salida original.
+    """
+    
+    def __init__(self, original, thread):
+        """
+        Inicializa la salida
+        
+        Args:
+            original: Salida estándar original
+            thread (threading.Thread): Hilo del barrido
+        """
+        self.original = original
+        self.thread = thread
+        self.lock = threading.Lock()
+        self.pending = ''
+        self.lines = []
+    
+    def write(self, text):
+        """Escribe el texto o lo guarda si viene del hilo del barrido"""
+        if threading.current_thread() is not self.thread:
+            return self.original.write(text)
+        
+        with self.lock:
+            self.pending += text
+            *complete, self.pending = self.pending.split('\n')
+            self.lines.extend(complete)
+        return len(text)
+    
+    def flush(self):
+        """Vacía la salida original"""
+        self.original.flush()
+    
+    def drain(self, final=False):
+        """
+        Entrega las líneas completas escritas por el hilo del barrido
+        
+        Args:
+            final (bool): Incluir también la última línea incompleta
+        
+        Returns:
+            list: Líneas sin el salto de línea final
+        """
+        with self.lock:
+            lines, self.lines = self.lines, []
+            if final and self.pending:
+                lines.append(self.pending)
+                self.pending = ''
+        return lines
+
+
+class BackgroundSweep:
+    """
+    Barrido ejecutado en un hilo aparte
+    
+    El hilo solo mide; las tablas, gráficas y CSV se generan con on_finish
+    en el hilo principal (finish), porque las gráficas en pantalla no pueden
+    mostrarse desde otro hilo. La cancelación se comprueba antes de cada
+    ejecución, por lo que una ejecución ya iniciada termina antes de detener
+    el barrido (salvo en el modo aislado, donde se detiene el proceso hijo).
+    """
+    
+    def __init__(self, analyzer, description, target, on_finish=None):
+        """
+        Inicializa el barrido
+        
+        Args:
+            analyzer (PerformanceAnalyzer): Analizador que realiza las mediciones
+            description (str): Descripción para mostrar en el menú
+            target: Función sin argumentos que ejecuta las mediciones
+            on_finish: Función (resultado de target) llamada por finish en el hilo principal
+        """
+        self.analyzer = analyzer
+        self.description = description
+        self.target = target
+        self.on_finish = on_finish
+        self.thread = threading.Thread(target=self._run, name='sweep', daemon=True)
+        self.output = None
+        self.outcome = None
+        self.error = None
+    
+    def _run(self):
+        """Cuerpo del hilo: ejecuta target y guarda su resultado o su error"""
+        try:
+            self.outcome = self.target()
+        except Exception as e:
+            self.error = e
+    
+    def start(self):
+        """Empieza el barrido en segundo plano"""
+        self.analyzer.cancel_event.clear()
+        self.analyzer.progress = SweepProgress(self.analyzer)
+        self.output = _ThreadOutput(sys.stdout, self.thread)
+        sys.stdout = self.output
+        self.thread.start()
+    
+    def running(self):
+        """Indica si el hilo del barrido sigue activo"""
+        return self.thread.is_alive()
+    
+    def cancel(self):
+        """Pide detener el barrido tras la ejecución en curso"""
+        self.analyzer.cancel_event.set()
+    
+    def cancelled(self):
+        """Indica si se pidió cancelar el barrido"""
+        return self.analyzer.cancel_event.is_set()
+    
+    def drain_output(self):
+        """
+        Obtiene las líneas escritas por el barrido desde la última llamada
+        
+        Returns:
+            list: Líneas pendientes
+        """
+        return self.output.drain(final=not self.running())
+    
+    def render(self):
+        """
+        Línea de progreso del barrido
+        
+        Returns:
+            str: Barra de progreso de SweepProgress
+        """
+        return self.analyzer.progress.render()
+    
+    def finish(self, report=True):
+        """
+        Cierra el barrido terminado, muestra sus líneas pendientes y llama a on_finish
+        
+        Args:
+            report (bool): Llamar a on_finish (False al salir del programa)
+        """
+        self.thread.join()
+        lines = self.output.drain(final=True)
+        sys.stdout = self.output.original
+        self.analyzer.progress = None
+        
+        for line in lines:
+            print(line)
+        if self.error is not None:
+            print(f"Error en el análisis en segundo plano: {self.error}")
+        elif report and self.on_finish is not None:
+            self.on_finish(self.outcome)
+
+
+def read_line(timeout):
+    """
+    Lee una línea de la entrada estándar sin bloquear más de timeout segundos
+    
+    Args:
+        timeout (float): Espera máxima en segundos
+    
+    Returns:
+        str: Línea sin espacios extremos, o None si no se escribió nada
+    """
+    if os.name == 'nt':
+        import msvcrt
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                return input().strip()
+            time.sleep(0.05)
+        return None
+    
+    import select
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if not ready:
+        return None
+    return sys.stdin.readline().strip()
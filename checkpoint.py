@@ -0,0 +1,93 @@
+"""
+Módulo de Checkpoints
+Registra las ejecuciones (problema, n, modo, repetición) completadas para poder reanudar barridos.
+"""
+
+import os
+
+from result_sink import append_json_line, read_json_lines
+
+
+class SweepCheckpoint:
+    """
+    Registro en disco de las unidades de trabajo completadas
+    
+    Cada unidad es una ejecución (problema, n, backend, modo, repetición) con
+    su tiempo y resultado. Se anexa al archivo en cuanto termina (con fsync),
+    por lo que al reanudar solo se repite la ejecución que estaba en curso.
+    
+    El modo de medición forma parte de la clave, igual que en
+    MeasurementCache: un barrido reanudado con otras opciones (adaptativo,
+    riguroso, aislado, paralelo...) no reutiliza ejecuciones medidas de otra
+    forma. Los registros sin modo (formato anterior) no se reutilizan.
+    """
+    
+    def __init__(self, filepath=os.path.join("results", "checkpoint.jsonl")):
+        """
+        Inicializa el checkpoint cargando las unidades ya registradas
+        
+        Args:
+            filepath (str): Archivo del checkpoint
+        """
+        self.filepath = filepath
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.units = {}
+        for record in read_json_lines(filepath):
+            key = (record['problem'], record['n'], record['backend'], record.get('mode'))
+            self.units.setdefault(key, {})[record['run']] = (record['elapsed'], record['result'])
+    
+    def __len__(self):
+        """Número de ejecuciones registradas"""
+        return sum(len(runs) for runs in self.units.values())
+    
+    def completed_runs(self, problem_num, n, backend='python', mode=''):
+        """
+        Obtiene las ejecuciones completadas de un (problema, n, backend, modo)
+        
+        Args:
+            problem_num (int): Número del problema
+            n (int): Tamaño de entrada
+            backend (str): Backend utilizado
+            mode (str): Descripción del modo de medición (ej. 'runs=3', 'adaptive')
+        
+        Returns:
+            dict: Tuplas (tiempo, resultado) indexadas por número de repetición
+        """
+        return dict(self.units.get((problem_num, n, backend, mode), {}))
+    
+    def record(self, problem_num, n, backend, elapsed, result, run_index=None, mode=''):
+        """
+        Registra una ejecución completada
+        
+        Args:
+            problem_num (int): Número del problema
+            n (int): Tamaño de entrada
+            backend (str): Backend utilizado
+            elapsed (float): Tiempo de la ejecución en segundos
+            result (int): Resultado del algoritmo
+            run_index (int): Número de repetición (None usa el siguiente libre)
+            mode (str): Descripción del modo de medición
+        """
+        runs = self.units.setdefault((problem_num, n, backend, mode), {})
+        if run_index is None:
+            run_index = max(runs) + 1 if runs else 0
+        
+        runs[run_index] = (elapsed, result)
+        append_json_line(self.filepath, {
+            'problem': problem_num,
+            'n': n,
+            'backend': backend,
+            'mode': mode,
+            'run': run_index,
+            'elapsed': elapsed,
+            'result': result
+        })
+    
+    def clear(self):
+        """Elimina todas las unidades registradas"""
+        self.units = {}
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
@@ -0,0 +1,322 @@
+"""
+Módulo de Línea de Comandos
+Ejecuta barridos de análisis sin interacción, para CI o ejecuciones programadas.
+
+Ejemplo:
+    python cli.py --problems 1 3 --n-values 10,100,1000 --backend numpy --formats csv,png
+    python cli.py --problems 2 --compare-backends
+"""
+
+import argparse
+import os
+import sys
+
+from algorithms import Algorithms, BACKENDS
+from analyzer import PerformanceAnalyzer
+from measurement_cache import MeasurementCache
+from result_sink import ResultSink
+from checkpoint import SweepCheckpoint
+from result_history import ResultHistory
+from plot_renderer import PlotRenderer, PLOT_FORMATS, DEFAULT_DPI
+from grid_planner import GridPlanner
+
+# Formatos de salida disponibles
+OUTPUT_FORMATS = ('table', 'csv', 'png', 'summary')
+
+
+def parse_n_values(text):
+    """
+    Convierte una lista separada por comas en valores de n
+    
+    Args:
+        text (str): Valores separados por comas (ej: "1,10,100")
+    
+    Returns:
+        list: Valores de n ordenados y sin duplicados
+    """
+    try:
+        n_values = sorted(set(int(x.strip()) for x in text.split(',') if x.strip()))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Valores de n inválidos: {text}")
+    
+    if not n_values:
+        raise argparse.ArgumentTypeError("Debe indicar al menos un valor de n")
+    
+    return n_values
+
+
+def parse_formats(text):
+    """
+    Convierte una lista separada por comas en formatos de salida
+    
+    Args:
+        text (str): Formatos separados por comas (ej: "table,csv")
+    
+    Returns:
+        list: Formatos de salida
+    """
+    formats = [x.strip() for x in text.split(',') if x.strip()]
+    invalid = [x for x in formats if x not in OUTPUT_FORMATS]
+    if invalid:
+        raise argparse.ArgumentTypeError(
+            f"Formatos desconocidos: {', '.join(invalid)} (opciones: {', '.join(OUTPUT_FORMATS)})"
+        )
+    
+    return formats
+
+
+def build_parser():
+    """
+    Construye el analizador de argumentos
+    
+    Returns:
+        argparse.ArgumentParser: Parser de la línea de comandos
+    """
+    parser = argparse.ArgumentParser(
+        description="Analizador de complejidad de algoritmos (modo no interactivo)"
+    )
+    parser.add_argument('--problems', type=int, nargs='+', default=[1, 2, 3],
+                        choices=sorted(Algorithms.get_all_problems()),
+                        help="Problemas a analizar (por defecto: todos)")
+    parser.add_argument('--n-values', type=parse_n_values, default=None,
+                        help="Valores de n separados por comas (por defecto: los de cada problema)")
+    parser.add_argument('--backend', choices=BACKENDS, default='python',
+                        help="Implementación a medir")
+    parser.add_argument('--compare-backends', action='store_true',
+                        help="Medir cada problema con todos los backends (" + ', '.join(BACKENDS) +
+                             ") y mostrar la aceleración; ignora --backend y --formats")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Número de procesos para medir en paralelo")
+    parser.add_argument('--pin-cores', action='store_true',
+                        help="Fijar cada proceso a un núcleo distinto")
+    parser.add_argument('--adaptive', action='store_true',
+                        help="Repetir cada medición hasta que el intervalo de confianza sea estrecho")
+    parser.add_argument('--rigorous', action='store_true',
+                        help="Medición rigurosa: calentamiento, gc desactivado, resta del costo "
+                             "del temporizador y agrupación de llamadas cortas")
+    parser.add_argument('--grid-budget', type=float, default=None,
+                        help="Sin --n-values: tiempo total en segundos por problema para elegir "
+                             "una malla logarítmica de n (con --workers > 1 el plan se fija "
+                             "antes de medir)")
+    parser.add_argument('--density', type=int, default=4,
+                        help="Puntos por década de la malla de --grid-budget")
+    parser.add_argument('--time-budget', type=float, default=None,
+                        help="Tiempo máximo en segundos por valor de n")
+    parser.add_argument('--sweep-budget', type=float, default=None,
+                        help="Tiempo máximo en segundos por problema")
+    parser.add_argument('--formats', type=parse_formats, default=list(OUTPUT_FORMATS),
+                        help="Salidas separadas por comas: " + ', '.join(OUTPUT_FORMATS))
+    parser.add_argument('--plot-format', choices=PLOT_FORMATS, default='png',
+                        help="Formato de las gráficas (svg y pdf son vectoriales)")
+    parser.add_argument('--dpi', type=int, default=DEFAULT_DPI,
+                        help="Resolución de las gráficas PNG")
+    parser.add_argument('--background-render', action='store_true',
+                        help="Renderizar las gráficas en un hilo aparte mientras se generan "
+                             "las demás salidas")
+    parser.add_argument('--compare', action='store_true',
+                        help="Generar además la gráfica de comparación de los problemas")
+    parser.add_argument('--memory', action='store_true',
+                        help="Registrar el pico de memoria asignada y el aumento del RSS de "
+                             "cada medición (una ejecución adicional por n, fuera del cronómetro)")
+    parser.add_argument('--doubling', type=float, nargs='?', const=60.0, default=None,
+                        metavar='SEGUNDOS',
+                        help="Experimento de duplicación (T(2n)/T(n)) por problema, con un "
+                             "tiempo máximo por problema (por defecto 60 s)")
+    parser.add_argument('--isolate', action='store_true',
+                        help="Medir cada (problema, n) en un intérprete nuevo fijado a un núcleo")
+    parser.add_argument('--core', type=int, default=None,
+                        help="Núcleo para las mediciones aisladas (por defecto: el último)")
+    parser.add_argument('--isolation-report', action='store_true',
+                        help="Comparar la varianza de las mediciones en proceso y aisladas")
+    parser.add_argument('--partitioned', action='store_true',
+                        help="Medir la ejecución particionada del bucle externo (problemas 1 y 3) "
+                             "contra la serial y reportar la eficiencia de escalado")
+    parser.add_argument('--verify-counts', type=int, nargs='?', const=50, default=None,
+                        metavar='N_MAX',
+                        help="No medir: verificar el conteo de operaciones en forma cerrada "
+                             "contra los bucles para n = 0..N_MAX (por defecto 50)")
+    parser.add_argument('--results-dir', default="results",
+                        help="Directorio donde guardar los resultados")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="No usar la caché persistente de mediciones")
+    parser.add_argument('--no-history', action='store_true',
+                        help="No anexar los resultados al historial (results/history/)")
+    parser.add_argument('--resume', action='store_true',
+                        help="Reanudar un barrido interrumpido, omitiendo las ejecuciones "
+                             "ya registradas en el checkpoint")
+    parser.add_argument('--from-stream', action='store_true',
+                        help="No medir: reconstruir las salidas desde el último barrido "
+                             "guardado en el flujo de resultados")
+    
+    return parser
+
+
+def run_batch(args):
+    """
+    Ejecuta el barrido descrito por los argumentos
+    
+    Las gráficas se dibujan con PlotRenderer sobre un lienzo Agg (sin GUI),
+    por lo que nunca bloquean en nodos sin pantalla; con --background-render
+    se dibujan en un hilo aparte y se esperan al terminar.
+    
+    Args:
+        args (argparse.Namespace): Argumentos de la línea de comandos
+    
+    Returns:
+        int: Código de salida (0 si todos los problemas produjeron resultados)
+    """
+    cache = None if args.no_cache else MeasurementCache(os.path.join(args.results_dir, '.cache'))
+    sink = ResultSink(os.path.join(args.results_dir, 'results_stream.jsonl'))
+    checkpoint = SweepCheckpoint(os.path.join(args.results_dir, 'checkpoint.jsonl'))
+    if not args.resume:
+        checkpoint.clear()
+    elif len(checkpoint):
+        print(f"Reanudando barrido: {len(checkpoint)} ejecuciones ya completadas")
+    
+    history = None if args.no_history else ResultHistory(os.path.join(args.results_dir, 'history'))
+    renderer = PlotRenderer(args.results_dir, args.plot_format, args.dpi, args.background_render)
+    
+    analyzer = PerformanceAnalyzer(args.results_dir, cache=cache, show_plots=False, sink=sink,
+                                   checkpoint=checkpoint, track_memory=args.memory,
+                                   history=history, isolate=args.isolate,
+                                   isolate_core=args.core, renderer=renderer)
+    
+    try:
+        return run_outputs(args, analyzer)
+    finally:
+        renderer.close()
+
+
+def run_outputs(args, analyzer):
+    """
+    Mide (o recupera del flujo) los resultados y genera las salidas pedidas
+    
+    Args:
+        args (argparse.Namespace): Argumentos de la línea de comandos
+        analyzer (PerformanceAnalyzer): Analizador configurado por run_batch
+    
+    Returns:
+        int: Código de salida
+    """
+    
+    if args.partitioned:
+        workers_list = [args.workers] if args.workers > 1 else None
+        for problem_num in args.problems:
+            n_values = args.n_values or analyzer.get_default_n_values(problem_num)
+            analyzer.benchmark_partitioned(problem_num, n_values, workers_list, args.pin_cores)
+        return 0
+    
+    if args.isolation_report:
+        for problem_num in args.problems:
+            analyzer.compare_isolation(problem_num, args.n_values, args.backend)
+        return 0
+    
+    if args.doubling is not None:
+        for problem_num in args.problems:
+            analyzer.doubling_experiment(problem_num, backend=args.backend, max_time=args.doubling,
+                                         rigorous=args.rigorous)
+        return 0 if analyzer.complete_sweep() else 1
+    
+    if args.compare_backends:
+        for problem_num in args.problems:
+            analyzer.compare_backends(problem_num, args.n_values,
+                                      adaptive=args.adaptive, rigorous=args.rigorous)
+        return 0 if analyzer.complete_sweep() else 1
+    
+    if args.from_stream:
+        all_results = {p: analyzer.results_from_stream(p) for p in args.problems}
+    elif args.workers > 1:
+        n_values = args.n_values
+        if n_values is None and args.grid_budget is not None:
+            # Sin mediciones previas el plan de cada problema se fija de antemano
+            n_values = {problem_num: GridPlanner(analyzer, problem_num, args.grid_budget,
+                                                 args.density).plan([], args.grid_budget)
+                        for problem_num in args.problems}
+        analyzer.parallel_sweep(args.problems, n_values, args.backend,
+                                args.workers, args.pin_cores)
+        all_results = {p: analyzer.results_from_stream(p, analyzer.sweep_id) for p in args.problems}
+    else:
+        all_results = {}
+        for problem_num in args.problems:
+            analyzer.run_analysis(
+                problem_num, args.n_values, args.backend,
+                time_budget=args.time_budget, sweep_budget=args.sweep_budget,
+                adaptive=args.adaptive, rigorous=args.rigorous,
+                grid_budget=args.grid_budget, points_per_decade=args.density
+            )
+            all_results[problem_num] = analyzer.results_from_stream(problem_num, analyzer.sweep_id)
+    
+    exit_code = 0
+    for problem_num, results in all_results.items():
+        if not results:
+            print(f"Problema {problem_num}: no se obtuvieron resultados")
+            exit_code = 1
+            continue
+        
+        if 'table' in args.formats:
+            analyzer.create_results_table(results, problem_num)
+        if 'png' in args.formats:
+            analyzer.create_visualization(results, problem_num)
+        if 'csv' in args.formats:
+            analyzer.save_results_to_csv(results, problem_num)
+        if 'summary' in args.formats:
+            analyzer.display_summary(results, problem_num)
+    
+    if args.compare:
+        grid_budget = args.grid_budget * len(args.problems) if args.grid_budget else None
+        analyzer.compare_problems(args.problems, args.n_values, args.workers, args.pin_cores,
+                                  args.backend, grid_budget, args.density)
+    
+    if not analyzer.complete_sweep():
+        print("Barrido incompleto: use --resume para continuar desde el checkpoint")
+        exit_code = 1
+    
+    return exit_code
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos
+    
+    Args:
+        argv (list): Argumentos (None usa sys.argv)
+    
+    Returns:
+        int: Código de salida
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    
+    # En un barrido, parallel_sweep y profile_with_timeout ignorarían estas opciones
+    sweep = not (args.partitioned or args.isolation_report or args.doubling is not None
+                 or args.from_stream or args.verify_counts is not None)
+    budgeted = args.time_budget is not None or args.sweep_budget is not None
+    modes = [name for name, enabled in (('--adaptive', args.adaptive), ('--rigorous', args.rigorous),
+                                        ('--memory', args.memory), ('--isolate', args.isolate))
+             if enabled]
+    if sweep and args.workers > 1 and (modes or budgeted):
+        ignored = modes + (['--time-budget/--sweep-budget'] if budgeted else [])
+        parser.error(f"{', '.join(ignored)}: no se aplica{'n' if len(ignored) > 1 else ''} "
+                     f"con --workers > 1")
+    if sweep and budgeted and modes:
+        parser.error(f"{', '.join(modes)}: no se aplica{'n' if len(modes) > 1 else ''} "
+                     f"con --time-budget/--sweep-budget")
+    if args.compare_backends and (args.workers > 1 or budgeted or args.grid_budget is not None):
+        parser.error("--compare-backends mide en serie y sin presupuestos: no admite "
+                     "--workers > 1, --time-budget, --sweep-budget ni --grid-budget")
+    
+    if args.verify_counts is not None:
+        analyzer = PerformanceAnalyzer(args.results_dir, show_plots=False)
+        mismatches = [analyzer.verify_counts(problem_num, args.verify_counts)
+                      for problem_num in args.problems]
+        return 1 if any(mismatches) else 0
+    
+    try:
+        return run_batch(args)
+    except KeyboardInterrupt:
+        print("\nEjecución interrumpida por el usuario.")
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+Módulo de Ajuste Empírico de Complejidad
+Ajusta los tiempos u operaciones medidos a modelos candidatos y clasifica su orden de crecimiento.
+"""
+
+import numpy as np
+
+# Modelos candidatos: nombre en notación O(·) -> forma f(n)
+CANDIDATE_MODELS = {
+    'O(1)': lambda n: np.ones_like(n),
+    'O(log n)': lambda n: np.log2(n),
+    'O(n)': lambda n: n,
+    'O(n log n)': lambda n: n * np.log2(n),
+    'O(n²)': lambda n: n ** 2,
+    'O(n² log n)': lambda n: n ** 2 * np.log2(n),
+    'O(n³)': lambda n: n ** 3
+}
+
+
+def _log_r_squared(y, predicted):
+    """
+    Coeficiente de determinación calculado en escala logarítmica
+    
+    Los tiempos abarcan varios órdenes de magnitud; medir el error en escala
+    logarítmica evita que los n grandes dominen la comparación.
+    
+    Args:
+        y (np.ndarray): Valores medidos (positivos)
+        predicted (np.ndarray): Valores predichos
+    
+    Returns:
+        float: R² (−inf si alguna predicción no es positiva)
+    """
+    if np.any(predicted <= 0):
+        return float('-inf')
+    
+    log_y = np.log(y)
+    ss_res = np.sum((log_y - np.log(predicted)) ** 2)
+    ss_tot = np.sum((log_y - np.mean(log_y)) ** 2)
+    if ss_tot == 0:
+        return 1.0 if ss_res == 0 else 0.0
+    
+    return float(1 - ss_res / ss_tot)
+
+
+def _weighted_fit(f, y, weights, use_intercept):
+    """
+    Resuelve y ≈ a + c·f por mínimos cuadrados ponderados
+    
+    Args:
+        f (np.ndarray): Forma del modelo evaluada en cada n
+        y (np.ndarray): Valores medidos
+        weights (np.ndarray): Peso de cada punto
+        use_intercept (bool): Incluir el término constante a
+    
+    Returns:
+        tuple: (a, c)
+    """
+    if use_intercept:
+        design = np.column_stack([np.ones_like(f), f])
+    else:
+        design = f[:, None]
+    
+    coefficients = np.linalg.lstsq(design * weights[:, None], y * weights, rcond=None)[0]
+    if use_intercept:
+        return float(coefficients[0]), float(coefficients[1])
+    
+    return 0.0, float(coefficients[0])
+
+
+def fit_models(n_values, y_values, with_intercept=True):
+    """
+    Ajusta y ≈ a + c·f(n) para cada modelo candidato
+    
+    El ajuste es por mínimos cuadrados relativos (pesos 1/y); el término
+    constante a absorbe el costo fijo de cada llamada en los n pequeños.
+    
+    Args:
+        n_values (list): Tamaños de entrada (n >= 2)
+        y_values (list): Tiempos u operaciones medidos (positivos)
+        with_intercept (bool): Incluir el término constante a
+    
+    Returns:
+        list: Ajustes ordenados del mejor al peor, cada uno con
+            'model', 'scale', 'intercept', 'r_squared' y 'residuals' (relativos)
+    """
+    n = np.asarray(n_values, dtype=float)
+    y = np.asarray(y_values, dtype=float)
+    weights = 1.0 / y
+    
+    fits = []
+    for name, shape in CANDIDATE_MODELS.items():
+        f = shape(n)
+        
+        use_intercept = with_intercept and name != 'O(1)'
+        intercept, scale = _weighted_fit(f, y, weights, use_intercept)
+        if use_intercept and intercept < 0:
+            # Un término constante negativo no tiene sentido físico: ajustar sin él
+            intercept, scale = _weighted_fit(f, y, weights, False)
+        
+        if scale <= 0:
+            continue
+        
+        predicted = intercept + scale * f
+        fits.append({
+            'model': name,
+            'scale': float(scale),
+            'intercept': float(intercept),
+            'r_squared': _log_r_squared(y, predicted),
+            'residuals': ((y - predicted) / predicted).tolist()
+        })
+    
+    fits.sort(key=lambda fit: fit['r_squared'], reverse=True)
+    return fits
+
+
+def fit_power_law(n_values, y_values):
+    """
+    Ajusta una ley de potencias y = a·n^b en escala log-log
+    
+    Args:
+        n_values (list): Tamaños de entrada
+        y_values (list): Tiempos u operaciones medidos (positivos)
+    
+    Returns:
+        dict: 'coefficient' (a), 'exponent' (b) y 'r_squared'
+    """
+    log_n = np.log(np.asarray(n_values, dtype=float))
+    log_y = np.log(np.asarray(y_values, dtype=float))
+    
+    exponent, log_coefficient = np.polyfit(log_n, log_y, 1)
+    predicted = np.exp(log_coefficient) * np.exp(log_n) ** exponent
+    
+    return {
+        'coefficient': float(np.exp(log_coefficient)),
+        'exponent': float(exponent),
+        'r_squared': _log_r_squared(np.exp(log_y), predicted)
+    }
+
+
+def classify(results, declared_complexity, column='time_seconds'):
+    """
+    Clasifica empíricamente el orden de crecimiento de una columna de resultados
+    
+    Args:
+        results (list): Resultados de run_analysis
+        declared_complexity (str): Complejidad declarada (ej. 'O(n² log n)')
+        column (str): Columna a ajustar ('time_seconds' u 'operations')
+    
+    Returns:
+        dict: Mejor ajuste ('best'), todos los ajustes ('fits'), ley de potencias
+            ('power_law') y si la clase difiere de la declarada ('disagrees');
+            None si hay menos de 3 puntos válidos
+    """
+    points = [
+        (r['n'], r[column]) for r in results
+        if not r.get('extrapolated') and r['n'] >= 2 and r[column] > 0
+    ]
+    if len(points) < 3:
+        return None
+    
+    n_values, y_values = zip(*points)
+    fits = fit_models(n_values, y_values)
+    if not fits:
+        return None
+    
+    best = fits[0]
+    return {
+        'column': column,
+        'best': best,
+        'fits': fits,
+        'power_law': fit_power_law(n_values, y_values),
+        'declared': declared_complexity,
+        'disagrees': best['model'] != declared_complexity
+    }
+
+
+def theoretical_ratio(results):
+    """
+    Razón entre las operaciones medidas y la complejidad teórica
+    
+    Args:
+        results (list): Resultados de run_analysis
+    
+    Returns:
+        float: Mediana de operations / theoretical_complexity (None sin datos)
+    """
+    ratios = [
+        r['operations'] / r['theoretical_complexity'] for r in results
+        if r['n'] >= 2 and r['theoretical_complexity'] > 0 and r['operations'] > 0
+    ]
+    if not ratios:
+        return None
+    
+    return float(np.median(ratios))
+
+
+# Columnas derivadas que agrega throughput a cada resultado
+THROUGHPUT_COLUMNS = ('ops_per_second', 'ns_per_op')
+
+
+def throughput(result):
+    """
+    Rendimiento por operación de un resultado medido
+    
+    Los resultados extrapolados no tienen rendimiento: su tiempo sale del
+    ajuste y no de una medición.
+    
+    Args:
+        result (dict): Resultado con 'operations' y 'time_seconds'
+    
+    Returns:
+        dict: 'ops_per_second' y 'ns_per_op' (vacío si el resultado es
+            extrapolado o no hay operaciones o tiempo)
+    """
+    operations = result.get('operations') or 0
+    time_seconds = result.get('time_seconds') or 0
+    if result.get('extrapolated') or operations <= 0 or not time_seconds > 0:
+        return {}
+    
+    return {
+        'ops_per_second': float(operations / time_seconds),
+        'ns_per_op': float(time_seconds / operations * 1e9)
+    }
+
+
+def fit_call_overhead(results):
+    """
+    Separa el costo fijo por llamada del costo por operación
+    
+    Ajusta T = t0 + c·ops por mínimos cuadrados relativos (pesos 1/T), como
+    fit_models pero con el conteo exacto de operaciones en lugar de f(n):
+    t0 es el costo fijo de cada llamada (intérprete, llamada a la función,
+    preparación de los bucles) y c el costo marginal de una operación.
+    
+    Args:
+        results (list): Resultados de run_analysis
+    
+    Returns:
+        dict: 'overhead_seconds' (t0), 'ns_per_op' (c en ns), 'r_squared' y
+            'residuals' (relativos); None si hay menos de 3 puntos medidos
+    """
+    points = [
+        (r['operations'], r['time_seconds']) for r in results
+        if not r.get('extrapolated') and r['operations'] > 0 and r['time_seconds'] > 0
+    ]
+    if len(points) < 3:
+        return None
+    
+    operations, times = (np.asarray(values, dtype=float) for values in zip(*points))
+    weights = 1.0 / times
+    
+    overhead, scale = _weighted_fit(operations, times, weights, True)
+    if overhead < 0:
+        # Un costo fijo negativo no tiene sentido físico: ajustar sin él
+        overhead, scale = _weighted_fit(operations, times, weights, False)
+    
+    predicted = overhead + scale * operations
+    return {
+        'overhead_seconds': float(overhead),
+        'ns_per_op': float(scale * 1e9),
+        'r_squared': _log_r_squared(times, predicted),
+        'residuals': ((times - predicted) / predicted).tolist()
+    }
@@ -0,0 +1,143 @@
+"""
+Módulo de Planificación de Valores de n
+Elige una malla logarítmica de n que cabe en un presupuesto de tiempo total.
+"""
+
+import time
+
+import numpy as np
+
+from algorithms import Algorithms
+
+# Segundos por unidad de complejidad teórica antes de tener mediciones
+# (conservador: un bucle de Python tarda unas decenas de ns por iteración)
+DEFAULT_SECONDS_PER_UNIT = 1e-7
+
+
+class GridPlanner:
+    """
+    Planificador de una malla de n con presupuesto de tiempo total
+    
+    Los candidatos son n espaciados logarítmicamente (points_per_decade por
+    década) entre n_min y n_max. El costo de cada candidato es
+    get_num_runs(n) × T(n), con T(n) = c · f(n), donde f es la forma de
+    get_theoretical_complexity; c se toma de DEFAULT_SECONDS_PER_UNIT hasta
+    que hay tiempos medidos y luego de PerformanceAnalyzer.predict_time.
+    El plan es el prefijo de candidatos (en orden creciente de n) cuyo costo
+    acumulado cabe en el presupuesto restante, y se recalcula tras cada punto.
+    """
+    
+    def __init__(self, analyzer, problem_num, budget, points_per_decade=4, n_min=1, n_max=10 ** 7):
+        """
+        Inicializa el planificador
+        
+        Args:
+            analyzer (PerformanceAnalyzer): Analizador que aporta predict_time y get_num_runs
+            problem_num (int): Número del problema
+            budget (float): Tiempo total disponible en segundos
+            points_per_decade (int): Densidad de la malla
+            n_min (int): Menor n candidato
+            n_max (int): Mayor n candidato
+        """
+        self.analyzer = analyzer
+        self.problem_num = problem_num
+        self.budget = budget
+        self.grid = self.log_grid(n_min, n_max, points_per_decade)
+        self.last_plan = []
+    
+    @staticmethod
+    def log_grid(n_min, n_max, points_per_decade):
+        """
+        Construye una malla de enteros espaciados logarítmicamente
+        
+        Args:
+            n_min (int): Menor valor
+            n_max (int): Mayor valor
+            points_per_decade (int): Puntos por década
+        
+        Returns:
+            list: Valores de n crecientes y sin duplicados
+        """
+        n_min = max(1, int(n_min))
+        decades = np.log10(n_max) - np.log10(n_min)
+        num_points = max(2, int(round(decades * points_per_decade)) + 1)
+        grid = np.unique(np.round(np.logspace(np.log10(n_min), np.log10(n_max), num_points)))
+        return [int(n) for n in grid]
+    
+    def predict_cost(self, n, results):
+        """
+        Predice el costo de medir un n con todas sus repeticiones
+        
+        Args:
+            n (int): Tamaño de entrada
+            results (list): Resultados ya medidos del problema
+        
+        Returns:
+            float: Segundos estimados
+        """
+        predicted = self.analyzer.predict_time(self.problem_num, n, results)
+        if predicted is None:
+            predicted = DEFAULT_SECONDS_PER_UNIT * Algorithms.get_theoretical_complexity(self.problem_num, n)
+        
+        return self.analyzer.get_num_runs(n) * predicted
+    
+    def plan(self, results, remaining_budget, candidates=None, measured=()):
+        """
+        Elige los n que caben en el presupuesto restante
+        
+        Args:
+            results (list): Resultados ya medidos del problema
+            remaining_budget (float): Segundos disponibles
+            candidates (list): n aún no medidos (None usa toda la malla)
+            measured: n que ya tienen resultado y no consumen presupuesto
+        
+        Returns:
+            list: Prefijo de candidatos cuyo costo acumulado cabe en el presupuesto
+        """
+        if candidates is None:
+            candidates = self.grid
+        
+        planned = []
+        total = 0.0
+        for n in candidates:
+            if n not in measured:
+                total += self.predict_cost(n, results)
+            if total > remaining_budget:
+                break
+            planned.append(n)
+        
+        return planned
+    
+    def iterate(self, results):
+        """
+        Genera los n a medir, replanificando tras cada punto
+        
+        run_analysis agrega cada resultado a results antes de pedir el
+        siguiente n, por lo que cada plan usa los tiempos más recientes.
+        
+        Args:
+            results (list): Lista de resultados que se va llenando al medir
+        
+        Yields:
+            int: Siguiente n a medir
+        """
+        start_time = time.perf_counter()
+        candidates = list(self.grid)
+        
+        while candidates:
+            remaining = self.budget - (time.perf_counter() - start_time)
+            planned = self.plan(results, remaining, candidates)
+            if not planned:
+                print(f"  Plan: presupuesto agotado ({max(remaining, 0):.1f} s restantes)")
+                return
+            
+            # Informar solo cuando cambia el mayor n que cabe en el presupuesto
+            if planned[-1:] != self.last_plan[-1:]:
+                estimate = sum(self.predict_cost(n, results) for n in planned)
+                print(f"  Plan: {len(planned)} valores de n hasta {planned[-1]:,} "
+                      f"(estimado {estimate:.1f} s de {remaining:.1f} s restantes)")
+            self.last_plan = planned
+            
+            n = planned[0]
+            candidates = candidates[candidates.index(n) + 1:]
+            yield n
@@ -0,0 +1,602 @@
+"""
+Módulo de Análisis Simbólico de Bucles
+Deriva el conteo exacto de iteraciones y la clase Big-O a partir del código C de cada problema.
+
+Se admite el subconjunto de C que usan los docstrings de Algorithms:
+- Encabezados `for (v = inicio; condición; paso)` con pasos aditivos
+  (v++, v--, v += c, v -= c, v = v + c) o multiplicativos (v *= c, v = v * c)
+- Condiciones lineales en la variable del bucle (ej. `j + n / 2 <= n`)
+  con límites que dependen solo de n y de constantes
+- `break;` incondicional dentro del cuerpo de un bucle
+- Guardas `if (condición en n) return;` antes de los bucles
+
+Lo demás se rechaza con ValueError al analizar, en vez de ignorarlo:
+- `if` dentro de un bucle (y por lo tanto los `break` condicionales)
+- Límites o inicializaciones que dependen de otra variable, como la de un
+  bucle externo (`for (j = 0; j < i; j++)`)
+- Bucles `while` y `do ... while`, y `continue`
+
+Las expresiones usan la división entera de C.
+"""
+
+import ast
+import math
+from fractions import Fraction
+from algorithms import Algorithms
+
+# Comparadores normalizados a la forma `v <= límite` o `v >= límite`
+_FLIPPED = {ast.LtE: ast.GtE, ast.Lt: ast.Gt, ast.GtE: ast.LtE, ast.Gt: ast.Lt}
+
+_SUPERSCRIPTS = {2: '²', 3: '³'}
+
+
+def _c_div(a, b):
+    """
+    División entera con la semántica de C (trunca hacia cero)
+    
+    Args:
+        a (int): Dividendo
+        b (int): Divisor
+    
+    Returns:
+        int: Cociente truncado
+    """
+    if b == 0:
+        raise ZeroDivisionError("División entre cero en la expresión del bucle")
+    quotient = abs(a) // abs(b)
+    return quotient if (a >= 0) == (b > 0) else -quotient
+
+
+def _parse_expression(text):
+    """
+    Convierte una expresión C en un árbol de Python
+    
+    Args:
+        text (str): Expresión C (ej. "n / 2")
+    
+    Returns:
+        ast.AST: Nodo raíz de la expresión
+    """
+    try:
+        return ast.parse(text.strip(), mode='eval').body
+    except SyntaxError:
+        raise ValueError(f"Expresión no soportada: {text.strip()}")
+
+
+def _evaluate(node, variables):
+    """
+    Evalúa una expresión entera con la semántica de C
+    
+    Args:
+        node (ast.AST): Expresión
+        variables (dict): Valores de las variables (ej. {'n': 10})
+    
+    Returns:
+        int: Valor de la expresión
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return node.value
+    if isinstance(node, ast.Name):
+        if node.id not in variables:
+            raise ValueError(f"Variable no soportada en la expresión: {node.id}")
+        return variables[node.id]
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -_evaluate(node.operand, variables)
+    if isinstance(node, ast.BinOp):
+        left = _evaluate(node.left, variables)
+        right = _evaluate(node.right, variables)
+        if isinstance(node.op, ast.Add):
+            return left + right
+        if isinstance(node.op, ast.Sub):
+            return left - right
+        if isinstance(node.op, ast.Mult):
+            return left * right
+        if isinstance(node.op, ast.Div):
+            return _c_div(left, right)
+    
+    raise ValueError(f"Expresión no soportada: {ast.unparse(node)}")
+
+
+def _polynomial(node):
+    """
+    Aproxima una expresión en n como polinomio (sin el truncamiento de la división)
+    
+    Args:
+        node (ast.AST): Expresión en n
+    
+    Returns:
+        dict: Grado -> coeficiente (Fraction)
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return {0: Fraction(node.value)}
+    if isinstance(node, ast.Name) and node.id == 'n':
+        return {1: Fraction(1)}
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return {d: -c for d, c in _polynomial(node.operand).items()}
+    if isinstance(node, ast.BinOp):
+        left = _polynomial(node.left)
+        right = _polynomial(node.right)
+        if isinstance(node.op, (ast.Add, ast.Sub)):
+            sign = 1 if isinstance(node.op, ast.Add) else -1
+            result = dict(left)
+            for degree, coefficient in right.items():
+                result[degree] = result.get(degree, 0) + sign * coefficient
+            return result
+        if isinstance(node.op, ast.Mult):
+            result = {}
+            for d1, c1 in left.items():
+                for d2, c2 in right.items():
+                    result[d1 + d2] = result.get(d1 + d2, 0) + c1 * c2
+            return result
+        if isinstance(node.op, ast.Div) and set(right) <= {0} and right.get(0):
+            return {d: c / right[0] for d, c in left.items()}
+    
+    raise ValueError(f"Expresión no polinomial en n: {ast.unparse(node)}")
+
+
+def _leading(polynomial):
+    """
+    Obtiene el término dominante de un polinomio
+    
+    Args:
+        polynomial (dict): Grado -> coeficiente
+    
+    Returns:
+        tuple: (grado, coeficiente), o (0, 0) si el polinomio es nulo
+    """
+    terms = [(d, c) for d, c in polynomial.items() if c != 0]
+    if not terms:
+        return 0, Fraction(0)
+    return max(terms)
+
+
+def _additive_terms(node, sign=1):
+    """
+    Separa una expresión en sus términos sumados con signo
+    
+    Args:
+        node (ast.AST): Expresión
+        sign (int): Signo acumulado
+    
+    Returns:
+        list: Lista de tuplas (signo, nodo)
+    """
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+        right_sign = sign if isinstance(node.op, ast.Add) else -sign
+        return _additive_terms(node.left, sign) + _additive_terms(node.right, right_sign)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return _additive_terms(node.operand, -sign)
+    return [(sign, node)]
+
+
+def _uses(node, name):
+    """Indica si una expresión usa la variable indicada"""
+    return any(isinstance(sub, ast.Name) and sub.id == name for sub in ast.walk(node))
+
+
+def _names(node):
+    """Variables que usa una expresión"""
+    return {sub.id for sub in ast.walk(node) if isinstance(sub, ast.Name)}
+
+
+def _keyword_at(text, index, word):
+    """Indica si la palabra clave aparece completa en text[index:]"""
+    end = index + len(word)
+    return (text.startswith(word, index)
+            and not (text[index - 1:index].isalnum() or text[index - 1:index] == '_')
+            and not (text[end:end + 1].isalnum() or text[end:end + 1] == '_'))
+
+
+class Loop:
+    """
+    Bucle `for` normalizado a `v = inicio; v <= límite (o >=); v += c (o *= c)`
+    """
+    
+    def __init__(self, header):
+        """
+        Analiza el encabezado de un bucle
+        
+        Args:
+            header (str): Contenido entre paréntesis del `for`
+        """
+        parts = [part.strip() for part in header.split(';')]
+        if len(parts) != 3:
+            raise ValueError(f"Encabezado de bucle no soportado: for ({header})")
+        
+        init, condition, step = parts
+        self.header = f"for ({'; '.join(parts)})"
+        
+        if '=' not in init:
+            raise ValueError(f"Inicialización no soportada: {init}")
+        var, start = init.split('=', 1)
+        self.var = var.strip()
+        self.start = _parse_expression(start)
+        if _uses(self.start, self.var):
+            raise ValueError(f"Inicialización no soportada: {init}")
+        
+        self.step_kind, self.step = self._parse_step(step)
+        self.comparison, self.bound = self._parse_condition(condition)
+        
+        # Con límites en n y constantes el conteo del anidamiento es un producto
+        free = sorted((_names(self.start) | _names(self.bound)) - {'n'})
+        if free:
+            raise ValueError(f"El límite de {self.header} depende de {', '.join(free)}: "
+                             f"solo se admiten límites en n y constantes")
+        self.has_break = False
+        self.children = []
+    
+    def _parse_step(self, text):
+        """
+        Reconoce el paso del bucle
+        
+        Args:
+            text (str): Expresión de paso (ej. "i++", "k = k * 2")
+        
+        Returns:
+            tuple: ('add', incremento) o ('mul', factor)
+        """
+        compact = text.replace(' ', '')
+        v = self.var
+        
+        if compact in (f'{v}++', f'++{v}'):
+            return 'add', 1
+        if compact in (f'{v}--', f'--{v}'):
+            return 'add', -1
+        
+        for prefix, kind, sign in ((f'{v}+=', 'add', 1), (f'{v}-=', 'add', -1), (f'{v}*=', 'mul', 1)):
+            if compact.startswith(prefix) and compact[len(prefix):].isdigit():
+                return kind, sign * int(compact[len(prefix):])
+        
+        if compact.startswith(f'{v}='):
+            node = _parse_expression(compact[len(v) + 1:])
+            if isinstance(node, ast.BinOp):
+                operands = [node.left, node.right]
+                names = [o for o in operands if isinstance(o, ast.Name) and o.id == v]
+                constants = [o for o in operands if isinstance(o, ast.Constant)
+                             and isinstance(o.value, int)]
+                if names and constants:
+                    if isinstance(node.op, ast.Add):
+                        return 'add', constants[0].value
+                    if isinstance(node.op, ast.Sub) and node.left is names[0]:
+                        return 'add', -constants[0].value
+                    if isinstance(node.op, ast.Mult):
+                        return 'mul', constants[0].value
+        
+        raise ValueError(f"Paso de bucle no soportado: {text}")
+    
+    def _parse_condition(self, text):
+        """
+        Despeja la variable del bucle en la condición
+        
+        Args:
+            text (str): Condición (ej. "j + n / 2 <= n")
+        
+        Returns:
+            tuple: (ast.LtE o ast.GtE, expresión del límite en n)
+        """
+        node = _parse_expression(text)
+        if not (isinstance(node, ast.Compare) and len(node.ops) == 1
+                and type(node.ops[0]) in _FLIPPED):
+            raise ValueError(f"Condición no soportada: {text}")
+        
+        # lhs - rhs op 0, con la variable sumando con coeficiente ±1
+        terms = (_additive_terms(node.left)
+                 + [(-sign, term) for sign, term in _additive_terms(node.comparators[0])])
+        var_terms = [sign for sign, term in terms if isinstance(term, ast.Name) and term.id == self.var]
+        rest = [(sign, term) for sign, term in terms
+                if not (isinstance(term, ast.Name) and term.id == self.var)]
+        if len(var_terms) != 1 or any(_uses(term, self.var) for _, term in rest):
+            raise ValueError(f"Condición no lineal en {self.var}: {text}")
+        
+        # v op -(resto) si el signo es +; si es -, se invierte el comparador
+        var_sign = var_terms[0]
+        comparison = type(node.ops[0]) if var_sign > 0 else _FLIPPED[type(node.ops[0])]
+        bound = ast.Constant(0)
+        for sign, term in rest:
+            op = ast.Sub() if sign * var_sign > 0 else ast.Add()
+            bound = ast.BinOp(left=bound, op=op, right=term)
+        
+        # Límites estrictos como inclusivos
+        if comparison is ast.Lt:
+            bound = ast.BinOp(left=bound, op=ast.Sub(), right=ast.Constant(1))
+            comparison = ast.LtE
+        elif comparison is ast.Gt:
+            bound = ast.BinOp(left=bound, op=ast.Add(), right=ast.Constant(1))
+            comparison = ast.GtE
+        
+        return comparison, bound
+    
+    def iterations(self, n):
+        """
+        Número exacto de iteraciones del bucle para un n
+        
+        Args:
+            n (int): Tamaño de entrada
+        
+        Returns:
+            int: Iteraciones (a lo sumo 1 si el cuerpo tiene break)
+        """
+        start = _evaluate(self.start, {'n': n})
+        bound = _evaluate(self.bound, {'n': n})
+        upward = self.comparison is ast.LtE
+        
+        if (start > bound) if upward else (start < bound):
+            return 0
+        if self.has_break:
+            return 1
+        
+        if self.step_kind == 'add' and (self.step > 0) == upward and self.step != 0:
+            return abs(bound - start) // abs(self.step) + 1
+        
+        if self.step_kind == 'mul' and upward and self.step >= 2 and start >= 1:
+            count = 0
+            value = start
+            while value <= bound:
+                count += 1
+                value *= self.step
+            return count
+        
+        raise ValueError(f"El bucle no termina para n = {n}: {self.header}")
+    
+    def growth(self):
+        """
+        Orden de crecimiento de las iteraciones del bucle
+        
+        Returns:
+            tuple: (exponente de n, exponente de log n, coeficiente dominante)
+        """
+        if self.has_break:
+            return 0, 0, 1.0
+        
+        bound = _polynomial(self.bound)
+        if self.step_kind == 'add':
+            span = dict(bound)
+            for degree, coefficient in _polynomial(self.start).items():
+                span[degree] = span.get(degree, 0) - coefficient
+            degree, coefficient = _leading(span)
+            if self.step < 0:
+                coefficient = -coefficient
+            if degree == 0 or coefficient <= 0:
+                return 0, 0, 1.0
+            return degree, 0, float(coefficient / abs(self.step))
+        
+        # Paso multiplicativo: log_c(n^d) = d·log2(n) / log2(c)
+        degree, coefficient = _leading(bound)
+        if degree == 0 or coefficient <= 0:
+            return 0, 0, 1.0
+        return 0, 1, degree / math.log2(self.step)
+
+
+class LoopNest:
+    """
+    Anidamiento de bucles C con conteo exacto y clase Big-O derivados simbólicamente
+    
+    El contador cuenta las ejecuciones de los cuerpos más internos. Los
+    límites de cada bucle no pueden depender de las variables de los bucles
+    externos, por lo que el conteo de un bucle es el producto de sus
+    iteraciones por la suma de los conteos de sus bucles internos.
+    """
+    
+    def __init__(self, loops, guards=None, source=""):
+        """
+        Inicializa el anidamiento
+        
+        Args:
+            loops (list): Bucles de nivel superior (objetos Loop)
+            guards (list): Condiciones en n que hacen `return` antes de los bucles
+            source (str): Código C original
+        """
+        self.loops = loops
+        self.guards = guards or []
+        self.source = source
+    
+    @classmethod
+    def from_source(cls, source):
+        """
+        Analiza código C con bucles `for`, `break` y guardas `if (...) return;`
+        
+        Args:
+            source (str): Código C
+        
+        Returns:
+            LoopNest: Anidamiento analizado
+        
+        Raises:
+            ValueError: Si el código usa algo fuera del subconjunto admitido
+                (ver la documentación del módulo)
+        """
+        roots = []
+        guards = []
+        stack = []
+        pending_braces = []
+        i = 0
+        
+        while i < len(source):
+            if source.startswith('for', i) and not source[i - 1:i].isalnum() \
+                    and source[i + 3:].lstrip().startswith('('):
+                open_index = source.index('(', i)
+                close_index = cls._matching_paren(source, open_index)
+                loop = Loop(source[open_index + 1:close_index])
+                (stack[-1].children if stack else roots).append(loop)
+                
+                rest = source[close_index + 1:].lstrip()
+                if not rest.startswith('{'):
+                    raise ValueError(f"Se esperaba '{{' después de {loop.header}")
+                stack.append(loop)
+                pending_braces.append(True)
+                i = source.index('{', close_index) + 1
+                continue
+            
+            if source.startswith('if', i) and not source[i - 1:i].isalnum() \
+                    and source[i + 2:].lstrip().startswith('('):
+                open_index = source.index('(', i)
+                close_index = cls._matching_paren(source, open_index)
+                condition = source[open_index + 1:close_index].strip()
+                if stack:
+                    raise ValueError(f"`if ({condition})` dentro de un bucle no soportado: "
+                                     f"{stack[-1].header}")
+                rest = source[close_index + 1:].lstrip()
+                if not rest.startswith('return'):
+                    raise ValueError(f"Solo se admiten guardas `if (...) return;`: if ({condition})")
+                guard = _parse_expression(condition)
+                if _names(guard) - {'n'}:
+                    raise ValueError(f"Solo se admiten guardas en n: if ({condition})")
+                guards.append(guard)
+                i = close_index + 1
+                continue
+            
+            if _keyword_at(source, i, 'while') and source[i + 5:].lstrip().startswith('('):
+                raise ValueError("Bucles `while` no soportados: solo se admiten bucles `for`")
+            if _keyword_at(source, i, 'do') and source[i + 2:].lstrip().startswith('{'):
+                raise ValueError("Bucles `do ... while` no soportados: solo se admiten bucles `for`")
+            if _keyword_at(source, i, 'continue') and stack:
+                raise ValueError(f"`continue` no soportado: {stack[-1].header}")
+            
+            if source.startswith('break', i) and not source[i - 1:i].isalnum() and stack:
+                stack[-1].has_break = True
+            elif source[i] == '{':
+                pending_braces.append(False)
+            elif source[i] == '}' and pending_braces:
+                if pending_braces.pop():
+                    stack.pop()
+            i += 1
+        
+        if not roots:
+            raise ValueError("No se encontraron bucles `for` en el código")
+        
+        return cls(roots, guards, source)
+    
+    @classmethod
+    def from_function(cls, func):
+        """
+        Analiza el código C incluido en el docstring de una función
+        
+        Args:
+            func: Función cuyo docstring contiene el bucle original en C
+        
+        Returns:
+            LoopNest: Anidamiento analizado
+        """
+        return cls.from_source(func.__doc__ or "")
+    
+    @staticmethod
+    def _matching_paren(text, open_index):
+        """Índice del paréntesis que cierra al de open_index"""
+        depth = 0
+        for index in range(open_index, len(text)):
+            if text[index] == '(':
+                depth += 1
+            elif text[index] == ')':
+                depth -= 1
+                if depth == 0:
+                    return index
+        raise ValueError("Paréntesis sin cerrar en el código")
+    
+    def count(self, n):
+        """
+        Conteo exacto de ejecuciones del cuerpo más interno
+        
+        Args:
+            n (int): Tamaño de entrada
+        
+        Returns:
+            int: Valor final del contador
+        """
+        n = int(n)
+        if any(self._guard_holds(guard, n) for guard in self.guards):
+            return 0
+        
+        def nest_count(loop):
+            iterations = loop.iterations(n)
+            if iterations == 0:
+                return 0
+            inner = sum(nest_count(child) for child in loop.children) if loop.children else 1
+            return iterations * inner
+        
+        return sum(nest_count(loop) for loop in self.loops)
+    
+    @staticmethod
+    def _guard_holds(guard, n):
+        """Evalúa la condición de una guarda `if (...) return;`"""
+        if not (isinstance(guard, ast.Compare) and len(guard.ops) == 1):
+            raise ValueError(f"Guarda no soportada: {ast.unparse(guard)}")
+        
+        left = _evaluate(guard.left, {'n': n})
+        right = _evaluate(guard.comparators[0], {'n': n})
+        op = guard.ops[0]
+        comparisons = {
+            ast.LtE: left <= right, ast.Lt: left < right,
+            ast.GtE: left >= right, ast.Gt: left > right,
+            ast.Eq: left == right, ast.NotEq: left != right
+        }
+        return comparisons[type(op)]
+    
+    def growth(self):
+        """
+        Término dominante del conteo
+        
+        Returns:
+            tuple: (exponente de n, exponente de log n, coeficiente)
+        """
+        def nest_growth(loop):
+            power, log_power, coefficient = loop.growth()
+            if loop.children:
+                inner = max(nest_growth(child)[:2] for child in loop.children)
+                inner_coefficient = sum(g[2] for g in map(nest_growth, loop.children)
+                                        if g[:2] == inner)
+                power += inner[0]
+                log_power += inner[1]
+                coefficient *= inner_coefficient
+            return power, log_power, coefficient
+        
+        growths = [nest_growth(loop) for loop in self.loops]
+        dominant = max(g[:2] for g in growths)
+        coefficient = sum(g[2] for g in growths if g[:2] == dominant)
+        return dominant[0], dominant[1], coefficient
+    
+    def big_o(self):
+        """
+        Clase Big-O del conteo, con la notación de complexity_fit
+        
+        Returns:
+            str: Clase (ej. 'O(n² log n)')
+        """
+        power, log_power, _ = self.growth()
+        return f"O({self._term(power, log_power)})"
+    
+    def leading_term(self):
+        """
+        Término dominante con su constante
+        
+        Returns:
+            str: Término (ej. '0.5·n² log n')
+        """
+        power, log_power, coefficient = self.growth()
+        return f"{coefficient:.4g}·{self._term(power, log_power)}"
+    
+    @staticmethod
+    def _term(power, log_power):
+        """Texto de n^power · log^log_power n"""
+        parts = []
+        if power:
+            parts.append('n' + (_SUPERSCRIPTS.get(power, f'^{power}') if power > 1 else ''))
+        if log_power:
+            parts.append('log' + (f'^{log_power}' if log_power > 1 else '') + ' n')
+        return ' '.join(parts) or '1'
+
+
+def analyze_problem(problem_num):
+    """
+    Analiza el código C del docstring de un problema de Algorithms
+    
+    Args:
+        problem_num (int): Número del problema
+    
+    Returns:
+        LoopNest: Anidamiento analizado, o None si el problema no existe
+    """
+    problem_info = Algorithms.get_problem_info(problem_num)
+    if not problem_info:
+        return None
+    
+    return LoopNest.from_function(problem_info['algorithm_func'])
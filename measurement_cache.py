@@ -0,0 +1,215 @@
+"""
+Módulo de Caché de Mediciones
+Guarda en disco los resultados de profile_algorithm para no repetir mediciones.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+import types
+
+from result_sink import _to_json
+
+
+# Tipos de los valores globales y atributos de clase que entran en code_hash
+_HASHED_CONSTANTS = (bool, int, float, complex, str, bytes, tuple)
+
+
+def code_hash(func):
+    """
+    Calcula un hash del bytecode de una función y de lo que usa de su módulo
+    
+    Incluye las constantes (y los objetos de código anidados, como lambdas)
+    para que cualquier cambio en el cuerpo de la función cambie el hash.
+    También sigue los nombres que usa el bytecode: las funciones del mismo
+    módulo (globales o métodos de una clase del módulo, como
+    VectorizedAlgorithms._count_iterations) se agregan recursivamente, y
+    los valores constantes (como VectorizedAlgorithms.CHUNK_SIZE) se
+    agregan por su representación.
+    
+    Args:
+        func: Función a identificar
+    
+    Returns:
+        str: Hash hexadecimal de 16 caracteres
+    """
+    digest = hashlib.sha256()
+    module = getattr(func, '__module__', None)
+    namespace = getattr(func, '__globals__', {})
+    seen = set()
+    
+    def resolve(name, classes):
+        """Valores a los que puede referirse un nombre del bytecode"""
+        values = [namespace[name]] if name in namespace else []
+        values.extend(vars(cls)[name] for cls in classes if name in vars(cls))
+        return values
+    
+    def add_code(code):
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode())
+        for const in code.co_consts:
+            if hasattr(const, 'co_code'):
+                add_code(const)
+            else:
+                digest.update(repr(const).encode())
+        
+        classes = [namespace[name] for name in code.co_names
+                   if isinstance(namespace.get(name), type) and namespace[name].__module__ == module]
+        for name in code.co_names:
+            for value in resolve(name, classes):
+                value = getattr(value, '__func__', value)  # staticmethod y classmethod
+                if isinstance(value, types.FunctionType) and value.__module__ == module:
+                    if value.__code__ not in seen:
+                        seen.add(value.__code__)
+                        add_code(value.__code__)
+                elif isinstance(value, _HASHED_CONSTANTS):
+                    digest.update(f'{name}={value!r}'.encode())
+    
+    seen.add(func.__code__)
+    add_code(func.__code__)
+    return digest.hexdigest()[:16]
+
+
+def machine_fingerprint():
+    """
+    Identifica la máquina donde se mide
+    
+    Returns:
+        str: Hash hexadecimal de 16 caracteres
+    """
+    parts = [
+        platform.node(),
+        platform.system(),
+        platform.machine(),
+        platform.processor(),
+        str(os.cpu_count())
+    ]
+    return hashlib.sha256('|'.join(parts).encode()).hexdigest()[:16]
+
+
+class MeasurementCache:
+    """
+    Caché persistente de mediciones con política de desalojo LRU
+    
+    La clave de cada entrada combina el problema, n, el backend, el modo de
+    medición, el hash del bytecode del algoritmo, la versión de Python y la
+    huella de la máquina. Editar un algoritmo (o una función o constante de
+    su módulo que use) o cambiar de intérprete solo invalida las entradas
+    afectadas; las entradas que quedan obsoletas se desalojan cuando se
+    supera max_entries.
+    
+    Los aciertos solo actualizan la fecha de acceso en memoria; el orden LRU
+    se escribe a disco con la siguiente put() o con flush().
+    """
+    
+    def __init__(self, cache_dir=os.path.join("results", ".cache"), max_entries=1000):
+        """
+        Inicializa la caché
+        
+        Args:
+            cache_dir (str): Directorio donde guardar la caché
+            max_entries (int): Número máximo de entradas antes de desalojar
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.filepath = os.path.join(cache_dir, 'measurements.json')
+        self.python_version = platform.python_implementation() + '-' + '.'.join(
+            str(part) for part in sys.version_info[:3]
+        )
+        self.machine = machine_fingerprint()
+        self.entries = self._load()
+        self.dirty = False
+    
+    def _load(self):
+        """
+        Carga las entradas desde disco
+        
+        Returns:
+            dict: Entradas de la caché (vacío si no existe o está dañada)
+        """
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save(self):
+        """Escribe las entradas a disco de forma atómica"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self.filepath + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, default=_to_json)
+        os.replace(tmp_path, self.filepath)
+        self.dirty = False
+    
+    def make_key(self, problem_num, n, algorithm_func, backend='python', mode=''):
+        """
+        Construye la clave de una medición
+        
+        Args:
+            problem_num (int): Número del problema
+            n (int): Tamaño de entrada
+            algorithm_func: Función del algoritmo medido
+            backend (str): Backend utilizado
+            mode (str): Descripción del modo de medición (ej. 'runs=3', 'adaptive')
+        
+        Returns:
+            str: Clave de la entrada
+        """
+        return '|'.join([
+            str(problem_num),
+            str(n),
+            backend,
+            mode,
+            code_hash(algorithm_func),
+            self.python_version,
+            self.machine
+        ])
+    
+    def get(self, key):
+        """
+        Obtiene una medición de la caché
+        
+        Args:
+            key (str): Clave de la entrada
+        
+        Returns:
+            dict: Medición guardada, o None si no existe
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        
+        entry['last_access'] = time.time()
+        self.dirty = True
+        return entry['value']
+    
+    def put(self, key, value):
+        """
+        Guarda una medición y desaloja las menos usadas si se supera el límite
+        
+        Args:
+            key (str): Clave de la entrada
+            value (dict): Medición a guardar (debe ser serializable en JSON)
+        """
+        self.entries[key] = {'value': value, 'last_access': time.time()}
+        
+        if len(self.entries) > self.max_entries:
+            by_access = sorted(self.entries, key=lambda k: self.entries[k]['last_access'])
+            for old_key in by_access[:len(self.entries) - self.max_entries]:
+                del self.entries[old_key]
+        
+        self._save()
+    
+    def flush(self):
+        """Escribe a disco las fechas de acceso pendientes de get()"""
+        if self.dirty:
+            self._save()
+    
+    def clear(self):
+        """Elimina todas las entradas de la caché"""
+        self.entries = {}
+        self._save()
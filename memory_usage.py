@@ -0,0 +1,127 @@
+"""
+Módulo de Uso de Memoria
+Mide el pico de memoria asignada (tracemalloc) y el aumento del RSS de una ejecución.
+
+La memoria no se mide dentro de las ejecuciones cronometradas, porque
+tracemalloc las ralentiza: measure_peak_memory hace una llamada adicional
+por cada n, lo que suma aproximadamente el costo de una ejecución más (algo
+mayor por tracemalloc) a cada punto.
+"""
+
+import sys
+import tracemalloc
+
+# Archivos de Linux para reiniciar y leer el pico de RSS del proceso
+_CLEAR_REFS_PATH = '/proc/self/clear_refs'
+_STATUS_PATH = '/proc/self/status'
+
+
+def reset_peak_rss():
+    """
+    Reinicia el pico de RSS del proceso (VmHWM) si la plataforma lo permite
+    
+    Returns:
+        bool: True si el pico se reinició; si no, peak_rss_bytes() devuelve el
+            pico de toda la vida del proceso
+    """
+    try:
+        with open(_CLEAR_REFS_PATH, 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _status_bytes(field):
+    """
+    Lee un campo de memoria de /proc/self/status
+    
+    Args:
+        field (str): Nombre del campo (ej. 'VmHWM', 'VmRSS')
+    
+    Returns:
+        int: Valor en bytes, o None si no se puede leer
+    """
+    try:
+        with open(_STATUS_PATH, 'r') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def current_rss_bytes():
+    """
+    Obtiene la memoria residente actual del proceso
+    
+    Returns:
+        int: RSS en bytes, o None si la plataforma no lo expone
+    """
+    return _status_bytes('VmRSS')
+
+
+def peak_rss_bytes():
+    """
+    Obtiene el pico de RSS del proceso
+    
+    Returns:
+        int: Pico de memoria residente en bytes, o None si no se puede obtener
+    """
+    peak = _status_bytes('VmHWM')
+    if peak is not None:
+        return peak
+    
+    try:
+        import resource
+    except ImportError:
+        return None
+    
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def measure_peak_memory(algorithm_func, n):
+    """
+    Ejecuta el algoritmo una vez registrando su consumo de memoria
+    
+    tracemalloc ralentiza la ejecución, por lo que esta ejecución no debe
+    usarse para medir tiempo: es una llamada adicional a las cronometradas.
+    
+    El pico de RSS del proceso incluye el intérprete, NumPy y lo que ya esté
+    cargado, por lo que se informa como aumento sobre el RSS previo a la
+    llamada. Para eso el pico debe poder reiniciarse (Linux); si no, el
+    aumento no se puede atribuir a la llamada y queda en None.
+    
+    Args:
+        algorithm_func: Función del algoritmo
+        n (int): Tamaño de entrada
+    
+    Returns:
+        dict: 'peak_alloc_bytes' (pico de asignaciones de Python y NumPy
+            durante la llamada) y 'peak_rss_bytes' (aumento del pico de
+            memoria residente sobre el RSS previo a la llamada)
+    """
+    rss_before = current_rss_bytes()
+    reset = reset_peak_rss()
+    
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        algorithm_func(n)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    rss_peak = peak_rss_bytes()
+    rss_delta = None
+    if reset and rss_before is not None and rss_peak is not None:
+        rss_delta = max(rss_peak - rss_before, 0)
+    
+    return {
+        'peak_alloc_bytes': peak - baseline,
+        'peak_rss_bytes': rss_delta
+    }
@@ -3,16 +3,44 @@ Módulo de Menú Principal
 Sistema interactivo para análisis de complejidad de algoritmos.
 """
 
+import argparse
 from analyzer import PerformanceAnalyzer
+from background import BackgroundSweep, read_line
 from algorithms import Algorithms
+from measurement_cache import MeasurementCache
+from result_sink import ResultSink
+from checkpoint import SweepCheckpoint
+from result_history import ResultHistory
+
+# Presupuesto en segundos para elegir los n cuando no hay valores personalizados
+DEFAULT_GRID_BUDGET = 60.0
+POINTS_PER_DECADE = 4
 
 class MenuSystem:
     """Sistema de menú para análisis de algoritmos"""
     
-    def __init__(self):
-        """Inicializa el sistema de menú"""
-        self.analyzer = PerformanceAnalyzer()
+    def __init__(self, resume=False, track_memory=False, isolate=False, isolate_core=None):
+        """
+        Inicializa el sistema de menú
+        
+        Args:
+            resume (bool): Conservar el checkpoint para reanudar un análisis interrumpido
+            track_memory (bool): Registrar el pico de memoria de cada medición
+            isolate (bool): Medir cada (problema, n) en un intérprete nuevo
+            isolate_core (int): Núcleo para las mediciones aisladas (None elige el último)
+        """
+        checkpoint = SweepCheckpoint()
+        if not resume:
+            checkpoint.clear()
+        elif len(checkpoint):
+            print(f"Reanudando: {len(checkpoint)} ejecuciones ya completadas en el checkpoint")
+        
+        self.analyzer = PerformanceAnalyzer(cache=MeasurementCache(), sink=ResultSink(),
+                                            checkpoint=checkpoint, track_memory=track_memory,
+                                            history=ResultHistory(), isolate=isolate,
+                                            isolate_core=isolate_core)
         self.available_problems = [1, 2, 3]
+        self.background = None
     
     def display_main_menu(self):
         """Muestra el menú principal"""
@@ -33,8 +61,14 @@ class MenuSystem:
         
         print("4. Comparar todos los problemas")
         print("5. Configurar valores de n personalizados")
+        if self.background is not None:
+            print("6. Ver progreso del análisis en curso")
+            print("7. Cancelar el análisis en curso")
         print("0. Salir")
         print("=" * 60)
+        if self.background is not None:
+            print(f"En curso: {self.background.description}")
+            print(self.background.render())
     
     def get_user_choice(self):
         """
@@ -94,10 +128,29 @@ class MenuSystem:
             print(f"Problema {problem_num} no encontrado.")
             return
         
+        if not self.start_background(
+            f"Problema {problem_num}",
+            # Cada resultado se escribe al flujo en cuanto se obtiene; sin valores
+            # personalizados los n se eligen según el presupuesto de tiempo
+            lambda: self.analyzer.run_analysis(problem_num, n_values,
+                                               grid_budget=DEFAULT_GRID_BUDGET,
+                                               points_per_decade=POINTS_PER_DECADE),
+            lambda _: self.report_single_problem(problem_num)
+        ):
+            return
+        
         print(f"\nIniciando análisis del Problema {problem_num}...")
+        self.monitor_background()
+    
+    def report_single_problem(self, problem_num):
+        """
+        Genera tabla, gráfica, CSV y resumen del último análisis de un problema
         
-        # Ejecutar análisis
-        results = self.analyzer.run_analysis(problem_num, n_values)
+        Args:
+            problem_num (int): Número del problema
+        """
+        # Tabla, gráfica y CSV se construyen desde el flujo en disco
+        results = self.analyzer.results_from_stream(problem_num, self.analyzer.sweep_id)
         
         if not results:
             print("No se pudieron obtener resultados.")
@@ -115,8 +168,9 @@ class MenuSystem:
         # Mostrar resumen
         self.analyzer.display_summary(results, problem_num)
         
+        self.finish_sweep()
+        
         print(f"\nAnálisis del Problema {problem_num} completado.")
-        input("Presione Enter para continuar...")
     
     def compare_all_problems(self, n_values=None):
         """
@@ -125,26 +179,131 @@ class MenuSystem:
         Args:
             n_values (list): Valores de n a analizar
         """
-        print("\nIniciando comparación de todos los problemas...")
+        # Sin valores personalizados, los n de cada problema se eligen según el presupuesto
+        if not self.start_background(
+            "Comparación de todos los problemas",
+            lambda: self.analyzer.measure_comparison(self.available_problems, n_values,
+                                                     grid_budget=DEFAULT_GRID_BUDGET,
+                                                     points_per_decade=POINTS_PER_DECADE),
+            self.report_comparison
+        ):
+            return
         
-        # Usar valores optimizados para comparación si no se especifican
-        if n_values is None:
-            n_values = [1, 10, 100, 1000, 10000, 100000]  # Sin 1M para evitar tiempos excesivos
+        print("\nIniciando comparación de todos los problemas...")
+        self.monitor_background()
+    
+    def report_comparison(self, problem_n_values):
+        """
+        Genera la gráfica de comparación con los resultados medidos
         
-        results = self.analyzer.compare_problems(self.available_problems, n_values)
+        Args:
+            problem_n_values (dict): Valores de n de cada problema (de measure_comparison)
+        """
+        self.analyzer.plot_comparison(self.available_problems, problem_n_values)
+        self.finish_sweep()
         
         print("\nComparación completada.")
+    
+    def start_background(self, description, target, on_finish):
+        """
+        Inicia un análisis en segundo plano si no hay otro en curso
+        
+        Args:
+            description (str): Descripción para el menú
+            target: Función sin argumentos que realiza las mediciones
+            on_finish: Función (resultado de target) que genera las salidas al terminar
+        
+        Returns:
+            bool: True si se inició el análisis
+        """
+        if self.background is not None:
+            print(f"\nYa hay un análisis en curso: {self.background.description}")
+            print("Espere a que termine o cancélelo (opción 7).")
+            input("Presione Enter para continuar...")
+            return False
+        
+        self.background = BackgroundSweep(self.analyzer, description, target, on_finish)
+        self.background.start()
+        return True
+    
+    def monitor_background(self):
+        """
+        Muestra el progreso del análisis en curso hasta que termine
+        
+        Enter vuelve al menú sin detener el análisis; 'c' (o Ctrl+C) lo
+        cancela tras la ejecución en curso y espera a que se detenga.
+        """
+        background = self.background
+        print("Enter: volver al menú (el análisis continúa) | c + Enter: cancelar")
+        
+        while background.running():
+            self.print_background_lines()
+            print(f"\r{background.render()}", end='', flush=True)
+            
+            try:
+                line = read_line(0.5)
+            except KeyboardInterrupt:
+                line = 'c'
+            
+            if line is None:
+                continue
+            if line.lower() == 'c' and not background.cancelled():
+                background.cancel()
+                print("Cancelando tras la ejecución en curso...")
+            elif line == '' and not background.cancelled():
+                print()
+                return
+        
+        print()
+        self.finish_background()
         input("Presione Enter para continuar...")
     
+    def print_background_lines(self):
+        """Muestra las líneas escritas por el análisis desde la última vez"""
+        lines = self.background.drain_output()
+        if lines:
+            # Borrar la barra de progreso antes de escribir encima
+            print("\r\033[K", end='')
+            for line in lines:
+                print(line)
+    
+    def finish_background(self, report=True):
+        """
+        Espera al análisis en segundo plano, genera sus salidas y libera el menú
+        
+        Args:
+            report (bool): Generar tabla, gráficas y CSV del análisis
+        """
+        background, self.background = self.background, None
+        background.finish(report)
+    
+    def poll_background(self):
+        """Cierra el análisis en segundo plano si terminó mientras se usaba el menú"""
+        if self.background is not None and not self.background.running():
+            print(f"\nAnálisis terminado: {self.background.description}")
+            self.finish_background()
+            input("Presione Enter para continuar...")
+    
+    def finish_sweep(self):
+        """Descarta el checkpoint o avisa cómo reanudar si hubo una interrupción"""
+        if not self.analyzer.complete_sweep():
+            print("Análisis incompleto: ejecute 'python menu.py --resume' para continuar")
+    
     def run(self):
         """Ejecuta el sistema de menú principal"""
         custom_n_values = None
         
         while True:
+            self.poll_background()
             self.display_main_menu()
             choice = self.get_user_choice()
             
             if choice == 0:
+                if self.background is not None:
+                    print("Cancelando el análisis en curso...")
+                    self.background.cancel()
+                    self.finish_background(report=False)
+                    self.finish_sweep()
                 print("\n¡Gracias por usar el Analizador de Complejidad!")
                 print("Resultados guardados en la carpeta 'results'")
                 break
@@ -163,14 +322,35 @@ class MenuSystem:
                     print("Se usarán los valores por defecto.")
                 input("Presione Enter para continuar...")
             
+            elif choice == 6 and self.background is not None:
+                self.monitor_background()
+            
+            elif choice == 7 and self.background is not None:
+                self.background.cancel()
+                print("Cancelando tras la ejecución en curso...")
+                self.monitor_background()
+            
             else:
                 print("Opción no válida. Por favor, seleccione una opción del menú.")
                 input("Presione Enter para continuar...")
 
 def main():
     """Función principal del programa"""
+    parser = argparse.ArgumentParser(description="Analizador de complejidad de algoritmos")
+    parser.add_argument('--resume', action='store_true',
+                        help="Reanudar el último análisis interrumpido")
+    parser.add_argument('--memory', action='store_true',
+                        help="Registrar el pico de memoria asignada y el aumento del RSS de "
+                             "cada medición (una ejecución adicional por n, fuera del cronómetro)")
+    parser.add_argument('--isolate', action='store_true',
+                        help="Medir cada (problema, n) en un intérprete nuevo fijado a un núcleo")
+    parser.add_argument('--core', type=int, default=None,
+                        help="Núcleo para las mediciones aisladas (por defecto: el último)")
+    args = parser.parse_args()
+    
     try:
-        menu = MenuSystem()
+        menu = MenuSystem(resume=args.resume, track_memory=args.memory, isolate=args.isolate,
+                          isolate_core=args.core)
         menu.run()
     except KeyboardInterrupt:
         print("\n\nPrograma interrumpido por el usuario.")
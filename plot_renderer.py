@@ -0,0 +1,352 @@
+"""
+Módulo de Renderizado de Gráficas
+Dibuja las gráficas fuera del camino de medición: figuras reutilizadas, formato y DPI configurables
+y renderizado opcional en un hilo aparte.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from algorithms import Algorithms
+from complexity_fit import throughput, fit_call_overhead
+
+# Formatos de archivo disponibles (svg y pdf son vectoriales)
+PLOT_FORMATS = ('png', 'svg', 'pdf')
+
+# Resolución de los PNG (no afecta a los formatos vectoriales)
+DEFAULT_DPI = 300
+
+PROBLEM_FIGSIZE = (12, 7)
+COMPARISON_FIGSIZE = (12, 8)
+COMPARISON_COLORS = ['blue', 'red', 'green', 'orange', 'purple']
+
+
+def _robust_series(results):
+    """
+    Tiempos a graficar de una serie de resultados
+    
+    Args:
+        results (list): Lista de resultados
+    
+    Returns:
+        tuple: (tiempos en ms, barras de error [inferiores, superiores] en ms);
+            la mediana con p5 y p95 si todos los resultados los tienen, o el
+            tiempo promedio sin barras de error (None) en otro caso
+    """
+    if not all(r.get('time_median') is not None for r in results):
+        return [r['time_ms'] for r in results], None
+    
+    # Mediana con barras de error asimétricas hasta los percentiles 5 y 95
+    medians_ms = [r['time_median'] * 1000 for r in results]
+    errors = [[m - r['time_p5'] * 1000 for m, r in zip(medians_ms, results)],
+              [r['time_p95'] * 1000 - m for m, r in zip(medians_ms, results)]]
+    return medians_ms, errors
+
+
+def draw_problem(fig, results, problem_num):
+    """
+    Dibuja el tiempo medido contra n de un problema
+    
+    Usa la mediana con barras de error hasta p5 y p95 si todos los
+    resultados las tienen, y el tiempo promedio en otro caso.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figura donde dibujar (se limpia antes)
+        results (list): Lista de resultados
+        problem_num (int): Número del problema
+    """
+    fig.clf()
+    ax = fig.add_subplot()
+    
+    n_values = [r['n'] for r in results]
+    problem_info = Algorithms.get_problem_info(problem_num)
+    
+    times_ms, errors = _robust_series(results)
+    if errors is not None:
+        ax.errorbar(n_values, times_ms, yerr=errors, fmt='bo-', linewidth=2,
+                    markersize=8, capsize=4,
+                    label=f'Mediana medida (p5–p95) - {problem_info["complexity"]}')
+    else:
+        ax.plot(n_values, times_ms, 'bo-', linewidth=2, markersize=8,
+                label=f'Tiempo medido - {problem_info["complexity"]}')
+    ax.set_xlabel('Tamaño de Input (n)', fontsize=12)
+    ax.set_ylabel('Tiempo de Ejecución (ms)', fontsize=12)
+    ax.set_title(f'Problema {problem_num}: {problem_info["name"]}\n'
+                 f'Tiempo de Ejecución vs Tamaño de Input',
+                 fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=11)
+    
+    fig.tight_layout()
+
+
+def _ns_to_ops_per_second(ns_per_op):
+    """Convierte ns/op en operaciones por segundo (eje secundario)"""
+    return 1e9 / np.maximum(ns_per_op, 1e-12)
+
+
+def draw_throughput(fig, results, problem_num):
+    """
+    Dibuja el costo por operación contra n de un problema
+    
+    Junto a los ns/op medidos se dibuja el ajuste T = t0 + c·ops de
+    fit_call_overhead: la curva (t0 + c·ops)/ops muestra cuánto pesa el
+    costo fijo por llamada en los n pequeños y la recta c el costo
+    asintótico de una operación. El eje derecho da las mismas
+    magnitudes en operaciones por segundo.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figura donde dibujar (se limpia antes)
+        results (list): Lista de resultados
+        problem_num (int): Número del problema
+    """
+    fig.clf()
+    ax = fig.add_subplot()
+    
+    measured = [(r['n'], r['operations'], throughput(r)['ns_per_op']) for r in results
+                if throughput(r)]
+    problem_info = Algorithms.get_problem_info(problem_num)
+    
+    if measured:
+        n_values, operations, ns_per_op = (np.asarray(values, dtype=float)
+                                           for values in zip(*measured))
+        ax.plot(n_values, ns_per_op, 'go-', linewidth=2, markersize=8, label='ns/op medido')
+        
+        fit = fit_call_overhead(results)
+        if fit is not None:
+            modeled = (fit['overhead_seconds'] + fit['ns_per_op'] * 1e-9 * operations) / operations * 1e9
+            ax.plot(n_values, modeled, 'k--', linewidth=1.5,
+                    label=f"t0 + c·ops (t0 = {fit['overhead_seconds'] * 1e6:.2f} µs)")
+            ax.axhline(fit['ns_per_op'], color='gray', linestyle=':', linewidth=1.5,
+                       label=f"c = {fit['ns_per_op']:.1f} ns/op")
+    
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel('Tamaño de Input (n)', fontsize=12)
+    ax.set_ylabel('Costo por operación (ns/op)', fontsize=12)
+    rate_axis = ax.secondary_yaxis('right', functions=(_ns_to_ops_per_second, _ns_to_ops_per_second))
+    rate_axis.set_ylabel('Operaciones por segundo', fontsize=12)
+    ax.set_title(f'Problema {problem_num}: {problem_info["name"]}\n'
+                 f'Costo por Operación vs Tamaño de Input',
+                 fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3, which='both')
+    if measured:
+        ax.legend(fontsize=11)
+    
+    fig.tight_layout()
+
+
+def draw_comparison(fig, all_results, problem_numbers):
+    """
+    Dibuja juntos los tiempos de varios problemas en escala logarítmica
+    
+    Como draw_problem, cada serie usa la mediana con barras de error hasta
+    p5 y p95 si todos sus resultados las tienen.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figura donde dibujar (se limpia antes)
+        all_results (dict): Resultados de cada problema indexados por número
+        problem_numbers (list): Orden de los problemas (define los colores)
+    """
+    fig.clf()
+    ax = fig.add_subplot()
+    
+    for i, problem_num in enumerate(problem_numbers):
+        results = all_results.get(problem_num)
+        if not results:
+            continue
+        
+        problem_info = Algorithms.get_problem_info(problem_num)
+        times_ms, errors = _robust_series(results)
+        label = f'Problema {problem_num}: {problem_info["complexity"]}'
+        if errors is not None:
+            label += ' (mediana, p5–p95)'
+        ax.errorbar([r['n'] for r in results], times_ms, yerr=errors, fmt='o-',
+                    color=COMPARISON_COLORS[i % len(COMPARISON_COLORS)], linewidth=2,
+                    markersize=8, capsize=4, label=label)
+    
+    ax.set_xlabel('Tamaño de Input (n)', fontsize=12)
+    ax.set_ylabel('Tiempo de Ejecución (ms)', fontsize=12)
+    ax.set_title('Comparación de Complejidades Temporales', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=11)
+    ax.set_yscale('log')  # Escala logarítmica para mejor comparación
+    
+    fig.tight_layout()
+
+
+class PlotRenderer:
+    """
+    Renderizador de gráficas a archivo sin pyplot
+    
+    Cada tipo de gráfica conserva su Figure (con un lienzo Agg) y la limpia
+    en lugar de crear una nueva, lo que evita reconstruir la figura, el
+    lienzo y las fuentes en cada llamada. Al no pasar por pyplot, las
+    figuras pueden dibujarse en un hilo aparte: con background=True cada
+    gráfica se encola en un único hilo de renderizado y se devuelve un
+    Future; wait() espera a las pendientes.
+    """
+    
+    def __init__(self, results_dir="results", fmt='png', dpi=DEFAULT_DPI, background=False):
+        """
+        Inicializa el renderizador
+        
+        Args:
+            results_dir (str): Directorio donde guardar las gráficas
+            fmt (str): Formato de archivo ('png', 'svg' o 'pdf')
+            dpi (int): Resolución de los PNG
+            background (bool): Renderizar en un hilo aparte
+        """
+        if fmt not in PLOT_FORMATS:
+            raise ValueError(f"Formato de gráfica desconocido: {fmt} "
+                             f"(opciones: {', '.join(PLOT_FORMATS)})")
+        
+        self.results_dir = results_dir
+        self.fmt = fmt
+        self.dpi = dpi
+        self.figures = {}
+        self.executor = ThreadPoolExecutor(max_workers=1) if background else None
+        self.pending = []
+    
+    def figure(self, key, figsize):
+        """
+        Obtiene la figura reutilizable de un tipo de gráfica
+        
+        Args:
+            key (str): Tipo de gráfica
+            figsize (tuple): Tamaño en pulgadas si hay que crearla
+        
+        Returns:
+            matplotlib.figure.Figure: Figura con lienzo Agg
+        """
+        fig = self.figures.get(key)
+        if fig is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+            self.figures[key] = fig
+        
+        return fig
+    
+    def save(self, fig, basename):
+        """
+        Guarda una figura con el formato y la resolución configurados
+        
+        Args:
+            fig (matplotlib.figure.Figure): Figura a guardar
+            basename (str): Nombre del archivo sin extensión
+        
+        Returns:
+            str: Ruta del archivo guardado
+        """
+        filepath = os.path.join(self.results_dir, f'{basename}.{self.fmt}')
+        fig.savefig(filepath, format=self.fmt, dpi=self.dpi, bbox_inches='tight')
+        return filepath
+    
+    def _render_problem(self, results, problem_num):
+        """Dibuja y guarda la gráfica de un problema"""
+        fig = self.figure('problem', PROBLEM_FIGSIZE)
+        draw_problem(fig, results, problem_num)
+        return self.save(fig, f'performance_analysis_problem_{problem_num}')
+    
+    def _render_throughput(self, results, problem_num):
+        """Dibuja y guarda la gráfica de costo por operación de un problema"""
+        fig = self.figure('throughput', PROBLEM_FIGSIZE)
+        draw_throughput(fig, results, problem_num)
+        return self.save(fig, f'performance_throughput_problem_{problem_num}')
+    
+    def _render_comparison(self, all_results, problem_numbers):
+        """Dibuja y guarda la gráfica de comparación"""
+        fig = self.figure('comparison', COMPARISON_FIGSIZE)
+        draw_comparison(fig, all_results, problem_numbers)
+        return self.save(fig, 'comparison_all_problems')
+    
+    def _submit(self, func, *args):
+        """Ejecuta func ahora o la encola en el hilo de renderizado"""
+        if self.executor is None:
+            return func(*args)
+        
+        future = self.executor.submit(func, *args)
+        self.pending.append(future)
+        return future
+    
+    def render_problem(self, results, problem_num):
+        """
+        Renderiza la gráfica de un problema
+        
+        Args:
+            results (list): Lista de resultados (se copia antes de encolarla)
+            problem_num (int): Número del problema
+        
+        Returns:
+            str o Future: Ruta del archivo, o un Future con la ruta en segundo plano
+        """
+        return self._submit(self._render_problem, [dict(r) for r in results], problem_num)
+    
+    def render_throughput(self, results, problem_num):
+        """
+        Renderiza la gráfica de costo por operación de un problema
+        
+        Args:
+            results (list): Lista de resultados (se copia antes de encolarla)
+            problem_num (int): Número del problema
+        
+        Returns:
+            str o Future: Ruta del archivo, o un Future con la ruta en segundo plano
+        """
+        return self._submit(self._render_throughput, [dict(r) for r in results], problem_num)
+    
+    def render_comparison(self, all_results, problem_numbers):
+        """
+        Renderiza la gráfica de comparación de varios problemas
+        
+        Args:
+            all_results (dict): Resultados de cada problema indexados por número
+            problem_numbers (list): Orden de los problemas
+        
+        Returns:
+            str o Future: Ruta del archivo, o un Future con la ruta en segundo plano
+        """
+        copied = {problem_num: [dict(r) for r in results] for problem_num, results in all_results.items()}
+        return self._submit(self._render_comparison, copied, list(problem_numbers))
+    
+    def wait(self, report=True):
+        """
+        Espera a las gráficas encoladas e informa dónde se guardaron
+        
+        Args:
+            report (bool): Mostrar la ruta de cada gráfica guardada
+        
+        Returns:
+            list: Rutas de los archivos guardados desde la última llamada
+        """
+        pending, self.pending = self.pending, []
+        paths = []
+        for future in pending:
+            try:
+                paths.append(future.result())
+            except Exception as e:
+                print(f"Error al renderizar una gráfica: {e}")
+                continue
+            if report:
+                print(f"Gráfica guardada en: {paths[-1]}")
+        
+        return paths
+    
+    def close(self, report=True):
+        """
+        Espera a las gráficas pendientes y detiene el hilo de renderizado
+        
+        Args:
+            report (bool): Mostrar la ruta de cada gráfica guardada
+        
+        Returns:
+            list: Rutas de los archivos guardados por wait
+        """
+        paths = self.wait(report)
+        if self.executor is not None:
+            self.executor.shutdown()
+        return paths
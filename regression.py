@@ -0,0 +1,460 @@
+"""
+Suite de Regresión de Rendimiento
+Mide puntos (problema, n) seleccionados y los compara estadísticamente con los CSV base.
+
+La línea base vive en su propio directorio (results/baseline/, incluido en
+el repositorio), separado de los CSV que sobrescribe cada análisis, y solo
+cambia con --update-baseline. Junto a ella se guarda el entorno donde se
+midió (intérprete, NumPy, plataforma y CPU); si el entorno actual es
+distinto, la comparación se omite salvo con --ignore-environment.
+
+Un punto es una regresión si es más lento que la base en más de la
+tolerancia y la diferencia es significativa (prueba t de Welch unilateral
+al 97.5%). Códigos de salida:
+    0: todos los puntos se compararon y ninguno es una regresión
+    1: hay alguna regresión
+    2: la comparación se omitió (entorno distinto o desconocido) o algún
+       punto no tiene línea base
+
+Ejemplo:
+    python regression.py --update-baseline
+    python regression.py
+    python regression.py --points 1:100,1000 3:1000 --tolerance 0.05
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import platform
+import sys
+
+import numpy as np
+
+from algorithms import Algorithms
+from analyzer import PerformanceAnalyzer, _t_critical
+
+# Directorio por defecto de la línea base
+DEFAULT_BASELINE_DIR = os.path.join("results", "baseline")
+
+# Archivo con el entorno donde se midió la línea base
+ENVIRONMENT_FILE = "environment.json"
+
+# Columnas de los CSV base
+BASELINE_COLUMNS = ('n', 'time_seconds', 'std_dev', 'num_runs')
+
+# Mayor n medido por defecto en cada problema
+DEFAULT_MAX_N = 1000
+
+# Códigos de salida de main
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_INCOMPLETE = 2
+
+
+def _cpu_model():
+    """
+    Nombre del modelo de CPU
+    
+    Returns:
+        str: Modelo leído de /proc/cpuinfo, o platform.processor() si no está disponible
+    """
+    try:
+        with open('/proc/cpuinfo', 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def baseline_environment():
+    """
+    Describe el entorno que debe coincidir para comparar con la línea base
+    
+    A diferencia de result_history.current_environment, no incluye el nombre
+    de la máquina: la misma CPU con el mismo intérprete es comparable aunque
+    cambie el host.
+    
+    Returns:
+        dict: Versión de Python y de NumPy, plataforma, modelo de CPU y núcleos
+    """
+    return {
+        'python': platform.python_implementation() + '-' + '.'.join(
+            str(part) for part in sys.version_info[:3]
+        ),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu': _cpu_model(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def parse_point_spec(text):
+    """
+    Convierte una especificación 'problema:n1,n2' en puntos a medir
+    
+    Args:
+        text (str): Especificación (ej. "1:100,1000")
+    
+    Returns:
+        tuple: (problem_num, lista de n)
+    """
+    try:
+        problem, n_text = text.split(':', 1)
+        n_values = sorted(set(int(x) for x in n_text.split(',') if x.strip()))
+        return int(problem), n_values
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Punto inválido: {text} (formato: problema:n1,n2)")
+
+
+def merge_points(specs):
+    """
+    Combina especificaciones de puntos, incluidas las repetidas de un mismo problema
+    
+    Args:
+        specs (list): Tuplas (problem_num, lista de n) de parse_point_spec
+    
+    Returns:
+        dict: problem_num -> lista ordenada de n sin duplicados
+    """
+    points = {}
+    for problem_num, n_values in specs:
+        points.setdefault(problem_num, set()).update(n_values)
+    return {problem_num: sorted(n_values) for problem_num, n_values in points.items()}
+
+
+def baseline_path(baseline_dir, problem_num):
+    """
+    Ruta del CSV base de un problema
+    
+    Args:
+        baseline_dir (str): Directorio de la línea base
+        problem_num (int): Número del problema
+    
+    Returns:
+        str: Ruta del archivo
+    """
+    return os.path.join(baseline_dir, f'baseline_problem_{problem_num}.csv')
+
+
+def load_environment(baseline_dir):
+    """
+    Lee el entorno guardado con la línea base
+    
+    Args:
+        baseline_dir (str): Directorio de la línea base
+    
+    Returns:
+        dict: Entorno de baseline_environment (None si no existe)
+    """
+    try:
+        with open(os.path.join(baseline_dir, ENVIRONMENT_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def environment_differences(baseline_env, environment):
+    """
+    Compara el entorno de la línea base con el actual
+    
+    Args:
+        baseline_env (dict): Entorno guardado (None si no existe)
+        environment (dict): Entorno actual
+    
+    Returns:
+        list: Descripciones 'clave: base -> actual' de cada diferencia
+    """
+    if baseline_env is None:
+        return ["entorno de la línea base desconocido"]
+    
+    return [f"{key}: {baseline_env.get(key)} -> {value}"
+            for key, value in environment.items() if baseline_env.get(key) != value]
+
+
+def load_baseline(filepath, analyzer):
+    """
+    Lee un CSV de resultados como línea base
+    
+    Los CSV anteriores a la columna num_runs usan el número de ejecuciones
+    que asignaba get_num_runs.
+    
+    Args:
+        filepath (str): Archivo CSV de update_baseline (o de save_results_to_csv)
+        analyzer (PerformanceAnalyzer): Analizador del que tomar get_num_runs
+    
+    Returns:
+        dict: n -> {'mean', 'std', 'num_runs'} (vacío si el archivo no existe)
+    """
+    baseline = {}
+    try:
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                if row.get('extrapolated') == 'True':
+                    continue
+                n = int(row['n'])
+                num_runs = row.get('num_runs')
+                baseline[n] = {
+                    'mean': float(row['time_seconds']),
+                    'std': float(row['std_dev'] or 0.0),
+                    'num_runs': int(num_runs) if num_runs else analyzer.get_num_runs(n)
+                }
+    except OSError:
+        return {}
+    
+    return baseline
+
+
+def welch_t_test(mean_a, std_a, runs_a, mean_b, std_b, runs_b):
+    """
+    Prueba t de Welch a partir de medias y desviaciones poblacionales (np.std)
+    
+    Args:
+        mean_a, std_a, runs_a: Media, desviación y ejecuciones de la muestra nueva
+        mean_b, std_b, runs_b: Media, desviación y ejecuciones de la línea base
+    
+    Returns:
+        tuple: (estadístico t de a - b, grados de libertad), o (None, None) si
+            alguna muestra tiene una sola ejecución o ambas varianzas son nulas
+    """
+    if runs_a < 2 or runs_b < 2:
+        return None, None
+    
+    # Varianza de la media: s²/k con s² = std² · k / (k - 1)
+    var_a = std_a ** 2 / (runs_a - 1)
+    var_b = std_b ** 2 / (runs_b - 1)
+    if var_a + var_b == 0:
+        return None, None
+    
+    t_stat = (mean_a - mean_b) / math.sqrt(var_a + var_b)
+    df = (var_a + var_b) ** 2 / (var_a ** 2 / (runs_a - 1) + var_b ** 2 / (runs_b - 1))
+    return t_stat, df
+
+
+def compare_point(analyzer, problem_num, n, base, num_runs=5, tolerance=0.10, rigorous=False):
+    """
+    Mide un punto y lo compara con su línea base
+    
+    Si la prueba t no es aplicable (una sola ejecución o varianzas nulas),
+    el estado se decide solo con la tolerancia.
+    
+    Args:
+        analyzer (PerformanceAnalyzer): Analizador usado para medir
+        problem_num (int): Número del problema
+        n (int): Tamaño de entrada
+        base (dict): Línea base del punto (None si no existe)
+        num_runs (int): Ejecuciones de la medición nueva
+        tolerance (float): Lentitud relativa tolerada antes de considerar regresión
+        rigorous (bool): Usar el modo de medición riguroso
+    
+    Returns:
+        dict: Medición, diferencia relativa, estadístico t y estado del punto
+    """
+    algorithm_func = Algorithms.get_algorithm(problem_num)
+    mean, std, _ = analyzer.profile_algorithm(algorithm_func, n, num_runs, rigorous=rigorous)
+    runs = analyzer.last_profile['num_runs']
+    
+    point = {
+        'problem': problem_num,
+        'n': n,
+        'time_seconds': float(mean),
+        'baseline_seconds': None,
+        'delta': None,
+        't_stat': None,
+        'status': 'sin base'
+    }
+    if base is None or base['mean'] <= 0:
+        return point
+    
+    delta = mean / base['mean'] - 1
+    t_stat, df = welch_t_test(mean, std, runs, base['mean'], base['std'], base['num_runs'])
+    significant = t_stat is None or t_stat > _t_critical(int(df))
+    
+    point.update({
+        'baseline_seconds': base['mean'],
+        'delta': float(delta),
+        't_stat': t_stat
+    })
+    if delta > tolerance and significant:
+        point['status'] = 'REGRESIÓN'
+    elif delta < -tolerance and (t_stat is None or -t_stat > _t_critical(int(df))):
+        point['status'] = 'mejora'
+    else:
+        point['status'] = 'ok'
+    
+    return point
+
+
+def update_baseline(points, baseline_dir=DEFAULT_BASELINE_DIR, num_runs=5, rigorous=False):
+    """
+    Mide los puntos seleccionados y los guarda como nueva línea base
+    
+    Los n medidos reemplazan a los del CSV base de su problema y el resto se
+    conserva. El entorno guardado solo pasa a ser el actual cuando se vuelve
+    a medir la línea base completa (todos los problemas con sus n por
+    defecto); si no, los datos quedarían con un entorno que no les corresponde.
+    
+    Args:
+        points (dict): problem_num -> lista de n (None usa los n por defecto hasta DEFAULT_MAX_N)
+        baseline_dir (str): Directorio de la línea base
+        num_runs (int): Ejecuciones por punto
+        rigorous (bool): Usar el modo de medición riguroso
+    """
+    analyzer = PerformanceAnalyzer(baseline_dir, show_plots=False)
+    full = (set(points) == set(Algorithms.get_all_problems())
+            and all(n_values is None for n_values in points.values()))
+    
+    for problem_num, n_values in points.items():
+        if n_values is None:
+            n_values = [n for n in analyzer.get_default_n_values(problem_num) if n <= DEFAULT_MAX_N]
+        
+        filepath = baseline_path(baseline_dir, problem_num)
+        rows = {} if full else {
+            n: {'n': n, 'time_seconds': base['mean'], 'std_dev': base['std'],
+                'num_runs': base['num_runs']}
+            for n, base in load_baseline(filepath, analyzer).items()
+        }
+        
+        algorithm_func = Algorithms.get_algorithm(problem_num)
+        for n in n_values:
+            mean, std, _ = analyzer.profile_algorithm(algorithm_func, n, num_runs, rigorous=rigorous)
+            rows[n] = {'n': n, 'time_seconds': float(mean), 'std_dev': float(std),
+                       'num_runs': analyzer.last_profile['num_runs']}
+            print(f"Problema {problem_num}, n = {n:,}: {mean * 1000:.4f} ms")
+        
+        with open(filepath, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=BASELINE_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows[n] for n in sorted(rows))
+        print(f"Línea base guardada en: {filepath}")
+    
+    environment = baseline_environment()
+    if full:
+        with open(os.path.join(baseline_dir, ENVIRONMENT_FILE), 'w', encoding='utf-8') as f:
+            json.dump(environment, f, indent=2, sort_keys=True)
+    elif environment_differences(load_environment(baseline_dir), environment):
+        print("Advertencia: el entorno de la línea base no se actualizó porque solo se midieron "
+              "algunos puntos; use --update-baseline sin --points para medirla completa")
+
+
+def run_regression(points, baseline_dir=DEFAULT_BASELINE_DIR, num_runs=5, tolerance=0.10,
+                   rigorous=False, ignore_environment=False):
+    """
+    Mide los puntos seleccionados y muestra el reporte de diferencias
+    
+    Los problemas sin línea base se miden en sus n por defecto hasta
+    DEFAULT_MAX_N y quedan con estado 'sin base'.
+    
+    Args:
+        points (dict): problem_num -> lista de n (None usa los n de la base hasta DEFAULT_MAX_N)
+        baseline_dir (str): Directorio con los CSV base
+        num_runs (int): Ejecuciones por punto
+        tolerance (float): Lentitud relativa tolerada
+        rigorous (bool): Usar el modo de medición riguroso
+        ignore_environment (bool): Comparar aunque el entorno difiera del de la base
+    
+    Returns:
+        list: Resultados de compare_point para cada punto (None si se omitió
+            la comparación por un entorno distinto o desconocido)
+    """
+    differences = environment_differences(load_environment(baseline_dir), baseline_environment())
+    if differences:
+        print("Advertencia: el entorno difiere del de la línea base:")
+        for difference in differences:
+            print(f"  {difference}")
+        if not ignore_environment:
+            print("Comparación omitida (usar --update-baseline en esta máquina o "
+                  "--ignore-environment)")
+            return None
+    
+    analyzer = PerformanceAnalyzer(baseline_dir, show_plots=False)
+    
+    print(f"{'Problema':>8} {'n':>10} {'Base (ms)':>14} {'Actual (ms)':>14} "
+          f"{'Δ':>9} {'t':>8}   Estado")
+    print("-" * 80)
+    
+    report = []
+    for problem_num, n_values in points.items():
+        baseline = load_baseline(baseline_path(baseline_dir, problem_num), analyzer)
+        if n_values is None and baseline:
+            n_values = [n for n in sorted(baseline) if n <= DEFAULT_MAX_N]
+        elif n_values is None:
+            n_values = [n for n in analyzer.get_default_n_values(problem_num) if n <= DEFAULT_MAX_N]
+        
+        for n in n_values:
+            point = compare_point(analyzer, problem_num, n, baseline.get(n), num_runs,
+                                  tolerance, rigorous)
+            report.append(point)
+            
+            base_ms = (f"{point['baseline_seconds'] * 1000:.4f}"
+                       if point['baseline_seconds'] is not None else "-")
+            delta = f"{point['delta']:+.1%}" if point['delta'] is not None else "-"
+            t_stat = f"{point['t_stat']:.2f}" if point['t_stat'] is not None else "-"
+            print(f"{problem_num:>8} {n:>10,} {base_ms:>14} {point['time_seconds'] * 1000:>14.4f} "
+                  f"{delta:>9} {t_stat:>8}   {point['status']}")
+    
+    return report
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la suite de regresión
+    
+    Args:
+        argv (list): Argumentos (None usa sys.argv)
+    
+    Returns:
+        int: EXIT_OK, EXIT_REGRESSION o EXIT_INCOMPLETE (ver el docstring del módulo)
+    """
+    parser = argparse.ArgumentParser(description="Suite de regresión de rendimiento")
+    parser.add_argument('--points', type=parse_point_spec, nargs='+', default=None,
+                        help="Puntos a medir como problema:n1,n2 (por defecto: los n <= 1000 "
+                             "de cada CSV base)")
+    parser.add_argument('--baseline-dir', default=DEFAULT_BASELINE_DIR,
+                        help="Directorio con los CSV base")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Medir los puntos y guardarlos como nueva línea base")
+    parser.add_argument('--ignore-environment', action='store_true',
+                        help="Comparar aunque el entorno difiera del de la línea base")
+    parser.add_argument('--runs', type=int, default=5,
+                        help="Ejecuciones por punto")
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help="Lentitud relativa tolerada (0.10 = 10%%)")
+    parser.add_argument('--rigorous', action='store_true',
+                        help="Usar el modo de medición riguroso")
+    args = parser.parse_args(argv)
+    
+    if args.points is None:
+        points = {problem_num: None for problem_num in sorted(Algorithms.get_all_problems())}
+    else:
+        points = merge_points(args.points)
+    
+    if args.update_baseline:
+        update_baseline(points, args.baseline_dir, args.runs, args.rigorous)
+        return EXIT_OK
+    
+    report = run_regression(points, args.baseline_dir, args.runs, args.tolerance, args.rigorous,
+                            args.ignore_environment)
+    if report is None:
+        return EXIT_INCOMPLETE
+    
+    regressions = [point for point in report if point['status'] == 'REGRESIÓN']
+    unbaselined = [point for point in report if point['status'] == 'sin base']
+    print("-" * 80)
+    if regressions:
+        print(f"{len(regressions)} regresiones significativas de {len(report)} puntos")
+        return EXIT_REGRESSION
+    if unbaselined or not report:
+        print(f"{len(unbaselined)} de {len(report)} puntos sin línea base "
+              f"(usar --update-baseline)")
+        return EXIT_INCOMPLETE
+    
+    print(f"Sin regresiones significativas ({len(report)} puntos)")
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
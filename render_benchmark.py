@@ -0,0 +1,173 @@
+"""
+Benchmark de Renderizado de Gráficas
+Mide cuánto cuesta generar las gráficas con cada opción de PlotRenderer, sin volver a medir.
+
+Las gráficas se dibujan a partir de los CSV de resultados ya guardados y
+se escriben en un directorio temporal, por lo que no se modifican los
+archivos de results/.
+
+Ejemplo:
+    python render_benchmark.py
+    python render_benchmark.py --problems 1 3 --repeat 10
+"""
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from algorithms import Algorithms
+from analyzer import load_pyplot
+from plot_renderer import PlotRenderer, draw_problem, DEFAULT_DPI, PROBLEM_FIGSIZE
+
+
+def load_results(filepath):
+    """
+    Lee un CSV de resultados con las columnas necesarias para graficar
+    
+    Args:
+        filepath (str): Archivo CSV generado por save_results_to_csv
+    
+    Returns:
+        list: Resultados con 'n', 'time_ms' y, si existen, los percentiles
+            (vacío si el archivo no existe)
+    """
+    results = []
+    try:
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                result = {'n': int(row['n']), 'time_ms': float(row['time_ms'])}
+                for column in ('time_median', 'time_p5', 'time_p95'):
+                    if row.get(column):
+                        result[column] = float(row[column])
+                results.append(result)
+    except OSError:
+        return []
+    
+    return results
+
+
+def render_pyplot(output_dir, results, problem_num):
+    """Renderizado anterior: figura nueva de pyplot, PNG a 300 dpi y cierre"""
+    plt = load_pyplot(headless=True)
+    fig = plt.figure(figsize=PROBLEM_FIGSIZE)
+    draw_problem(fig, results, problem_num)
+    fig.savefig(os.path.join(output_dir, f'pyplot_{problem_num}.png'), dpi=DEFAULT_DPI,
+                bbox_inches='tight')
+    plt.close(fig)
+    return os.path.join(output_dir, f'pyplot_{problem_num}.png')
+
+
+def benchmark_option(render, all_results, repeat):
+    """
+    Mide el tiempo por gráfica de una opción de renderizado
+    
+    El tiempo llega hasta que el archivo está escrito: en segundo plano se
+    espera a future.result(), porque run_analysis también espera a las
+    gráficas pendientes antes de medir el siguiente n.
+    
+    Args:
+        render: Función (resultados, problema) que genera una gráfica y
+            devuelve su ruta o un Future
+        all_results (dict): Resultados de cada problema indexados por número
+        repeat (int): Veces que se generan todas las gráficas
+    
+    Returns:
+        tuple: (mediana en ms por gráfica, mediana en ms hasta que render
+            devuelve el control, tamaño medio del archivo en KB)
+    """
+    # Una pasada previa para no medir la carga de matplotlib ni de las fuentes
+    paths = [render(results, problem_num) for problem_num, results in all_results.items()]
+    paths = [path.result() if hasattr(path, 'result') else path for path in paths]
+    
+    samples = []
+    submit_samples = []
+    for _ in range(repeat):
+        for problem_num, results in all_results.items():
+            start_time = time.perf_counter()
+            rendered = render(results, problem_num)
+            submit_samples.append(time.perf_counter() - start_time)
+            if hasattr(rendered, 'result'):
+                rendered.result()
+            samples.append(time.perf_counter() - start_time)
+    
+    size_kb = np.mean([os.path.getsize(path) for path in paths]) / 1024
+    return float(np.median(samples)) * 1000, float(np.median(submit_samples)) * 1000, size_kb
+
+
+def main(argv=None):
+    """
+    Punto de entrada del benchmark
+    
+    Args:
+        argv (list): Argumentos (None usa sys.argv)
+    
+    Returns:
+        int: 0 si hay resultados para graficar, 1 en otro caso
+    """
+    parser = argparse.ArgumentParser(description="Benchmark de renderizado de gráficas")
+    parser.add_argument('--problems', type=int, nargs='+',
+                        default=sorted(Algorithms.get_all_problems()),
+                        help="Problemas cuyos resultados graficar")
+    parser.add_argument('--results-dir', default="results",
+                        help="Directorio con los CSV de resultados")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Veces que se generan todas las gráficas por opción")
+    args = parser.parse_args(argv)
+    
+    all_results = {}
+    for problem_num in args.problems:
+        filepath = os.path.join(args.results_dir, f'performance_results_problem_{problem_num}.csv')
+        results = load_results(filepath)
+        if results:
+            all_results[problem_num] = results
+    if not all_results:
+        print(f"No hay CSV de resultados en {args.results_dir}")
+        return 1
+    
+    with tempfile.TemporaryDirectory() as output_dir:
+        background = PlotRenderer(output_dir, 'png', DEFAULT_DPI, background=True)
+        background_render = background.render_problem
+        options = [
+            ("pyplot, figura nueva, PNG 300 dpi",
+             lambda results, p: render_pyplot(output_dir, results, p)),
+            ("Figura reutilizada, PNG 300 dpi", PlotRenderer(output_dir, 'png', 300).render_problem),
+            ("Figura reutilizada, PNG 150 dpi", PlotRenderer(output_dir, 'png', 150).render_problem),
+            ("Figura reutilizada, PNG 100 dpi", PlotRenderer(output_dir, 'png', 100).render_problem),
+            ("Figura reutilizada, SVG", PlotRenderer(output_dir, 'svg').render_problem),
+            ("Figura reutilizada, PDF", PlotRenderer(output_dir, 'pdf').render_problem),
+            ("Segundo plano, PNG 300 dpi", background_render)
+        ]
+        
+        print(f"{'Opción':<42} {'ms por gráfica':>15} {'Aceleración':>12} {'Archivo (KB)':>13}")
+        print("-" * 86)
+        
+        baseline_ms = None
+        for name, render in options:
+            render_ms, submit_ms, size_kb = benchmark_option(render, all_results, args.repeat)
+            if baseline_ms is None:
+                baseline_ms = render_ms
+            if render is background_render:
+                # No es una aceleración: el dibujo solo cambia de hilo
+                print(f"{name:<42} {render_ms:>15.2f} {'-':>12} {size_kb:>13.1f}")
+            else:
+                print(f"{name:<42} {render_ms:>15.2f} {baseline_ms / render_ms:>11.1f}x "
+                      f"{size_kb:>13.1f}")
+        
+        print("-" * 86)
+        print(f"En segundo plano, encolar una gráfica devuelve el control en {submit_ms:.2f} ms, pero\n"
+              f"el dibujo cuesta lo mismo en otro hilo y run_analysis espera a las gráficas\n"
+              f"pendientes antes de medir: el hilo que mide queda bloqueado {render_ms:.2f} ms.")
+        
+        # Esperar a que el hilo de renderizado termine antes de borrar el directorio
+        background.close(report=False)
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
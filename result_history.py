@@ -0,0 +1,334 @@
+"""
+Módulo de Historial de Resultados
+Almacén columnar, solo anexado, con todas las mediciones de todos los barridos.
+
+Usa Parquet (pyarrow) si está instalado; si no, un archivo binario de
+registros de NumPy que se anexa sin reescribir lo anterior.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+from measurement_cache import machine_fingerprint
+
+# Esquema de columnas: nombre -> tipo de NumPy (las cadenas son de ancho fijo)
+HISTORY_COLUMNS = {
+    'problem': 'i4',
+    'n': 'i8',
+    'time_seconds': 'f8',
+    'std_dev': 'f8',
+    'operations': 'f8',  # float64: los conteos extrapolados exceden int64
+    'num_runs': 'i4',
+    'extrapolated': '?',
+    'backend': 'S16',
+    'timestamp': 'f8',
+    'sweep_id': 'S40',
+    'environment': 'S16',
+    'peak_alloc_bytes': 'f8',
+    'peak_rss_bytes': 'f8'
+}
+
+HISTORY_DTYPE = np.dtype(list(HISTORY_COLUMNS.items()))
+
+# Backends de almacenamiento disponibles
+STORAGE_BACKENDS = ('parquet', 'numpy')
+
+_part_counter = itertools.count(1)
+
+
+def current_environment():
+    """
+    Describe el entorno donde se mide
+    
+    Returns:
+        dict: Intérprete, plataforma, versión de NumPy, núcleos y huella de la máquina
+    """
+    return {
+        'python': platform.python_implementation() + '-' + '.'.join(
+            str(part) for part in sys.version_info[:3]
+        ),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'cpu_count': os.cpu_count(),
+        'machine': machine_fingerprint()
+    }
+
+
+def environment_id(environment):
+    """
+    Identificador corto de un entorno
+    
+    Args:
+        environment (dict): Descripción del entorno
+    
+    Returns:
+        str: Hash hexadecimal de 16 caracteres
+    """
+    encoded = json.dumps(environment, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _pyarrow_available():
+    """Indica si pyarrow está instalado (sin importarlo)"""
+    import importlib.util
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+class ResultHistory:
+    """
+    Historial columnar de resultados, solo anexado
+    
+    Cada fila es un resultado de run_analysis junto con la hora, el barrido,
+    el backend y el entorno (cuyo detalle se guarda una sola vez en
+    environments.jsonl). Anexar nunca reescribe las filas anteriores:
+    
+    - 'parquet': un archivo part-*.parquet por cada lote anexado; las cargas
+      filtradas se resuelven con pyarrow.dataset
+    - 'numpy': registros de tamaño fijo anexados a history.bin; las cargas
+      usan np.memmap y máscaras booleanas por columna
+    """
+    
+    def __init__(self, directory=os.path.join("results", "history"), storage=None):
+        """
+        Inicializa el historial
+        
+        Args:
+            directory (str): Directorio del historial
+            storage (str): 'parquet' o 'numpy' (None elige parquet si pyarrow está instalado)
+        """
+        if storage is None:
+            storage = 'parquet' if _pyarrow_available() else 'numpy'
+        if storage not in STORAGE_BACKENDS:
+            raise ValueError(f"Almacenamiento desconocido: {storage} "
+                             f"(opciones: {', '.join(STORAGE_BACKENDS)})")
+        
+        self.directory = directory
+        self.storage = storage
+        self.data_path = os.path.join(directory, 'history.bin')
+        self.environments_path = os.path.join(directory, 'environments.jsonl')
+        os.makedirs(directory, exist_ok=True)
+        
+        self.environment = current_environment()
+        self.environment_id = environment_id(self.environment)
+    
+    def _register_environment(self):
+        """Guarda la descripción del entorno actual si aún no está registrada"""
+        if self.environment_id in self.environments():
+            return
+        
+        record = {'environment': self.environment_id}
+        record.update(self.environment)
+        with open(self.environments_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+    
+    def environments(self):
+        """
+        Obtiene los entornos registrados
+        
+        Returns:
+            dict: Identificador -> descripción del entorno
+        """
+        environments = {}
+        try:
+            with open(self.environments_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    environments[record.pop('environment')] = record
+        except OSError:
+            pass
+        
+        return environments
+    
+    def append(self, problem_num, results, sweep_id=None):
+        """
+        Anexa los resultados de un barrido al historial
+        
+        Args:
+            problem_num (int): Número del problema
+            results (list): Resultados en el formato de run_analysis
+            sweep_id (str): Barrido al que pertenecen
+        
+        Returns:
+            int: Número de filas anexadas
+        """
+        if not results:
+            return 0
+        
+        self._register_environment()
+        
+        rows = np.zeros(len(results), dtype=HISTORY_DTYPE)
+        timestamp = time.time()
+        for i, result in enumerate(results):
+            rows[i] = (
+                problem_num,
+                result['n'],
+                result['time_seconds'],
+                result.get('std_dev', np.nan),
+                result['operations'],
+                result.get('num_runs', 0),
+                bool(result.get('extrapolated', False)),
+                result.get('backend', 'python').encode(),
+                timestamp,
+                (sweep_id or '').encode(),
+                self.environment_id.encode(),
+                result.get('peak_alloc_bytes', np.nan),
+                result.get('peak_rss_bytes', np.nan)
+            )
+        
+        if self.storage == 'parquet':
+            self._append_parquet(rows)
+        else:
+            with open(self.data_path, 'ab') as f:
+                rows.tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+        
+        return len(rows)
+    
+    def _append_parquet(self, rows):
+        """
+        Escribe un lote de filas como un nuevo archivo Parquet
+        
+        Args:
+            rows (np.ndarray): Filas con el dtype HISTORY_DTYPE
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        columns = {}
+        for name in HISTORY_COLUMNS:
+            column = rows[name]
+            if column.dtype.kind == 'S':
+                column = column.astype(str)
+            columns[name] = pa.array(column)
+        
+        filename = f"part-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{next(_part_counter)}.parquet"
+        pq.write_table(pa.table(columns), os.path.join(self.directory, filename))
+    
+    def load_columns(self, problem_num=None, n_min=None, n_max=None, backend=None):
+        """
+        Carga las filas que cumplen los filtros, por columnas
+        
+        Args:
+            problem_num (int): Problema a cargar (None para todos)
+            n_min (int): n mínimo, inclusive (None sin límite)
+            n_max (int): n máximo, inclusive (None sin límite)
+            backend (str): Backend de medición a cargar (None para todos)
+        
+        Returns:
+            dict: Nombre de columna -> np.ndarray (las cadenas como str)
+        """
+        if self.storage == 'parquet':
+            columns = self._load_parquet(problem_num, n_min, n_max, backend)
+        else:
+            columns = self._load_numpy(problem_num, n_min, n_max, backend)
+        
+        for name, column in columns.items():
+            if column.dtype.kind in ('S', 'O'):
+                columns[name] = column.astype(str)
+        
+        return columns
+    
+    def _load_numpy(self, problem_num, n_min, n_max, backend):
+        """Carga filtrada desde history.bin"""
+        try:
+            size = os.path.getsize(self.data_path)
+        except OSError:
+            size = 0
+        
+        # Un registro incompleto al final (escritura interrumpida) se ignora
+        count = size // HISTORY_DTYPE.itemsize
+        if count == 0:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in HISTORY_COLUMNS.items()}
+        
+        data = np.memmap(self.data_path, dtype=HISTORY_DTYPE, mode='r', shape=(count,))
+        mask = np.ones(count, dtype=bool)
+        if problem_num is not None:
+            mask &= data['problem'] == problem_num
+        if n_min is not None:
+            mask &= data['n'] >= n_min
+        if n_max is not None:
+            mask &= data['n'] <= n_max
+        if backend is not None:
+            mask &= data['backend'] == backend.encode()
+        
+        selected = data[mask]
+        return {name: np.array(selected[name]) for name in HISTORY_COLUMNS}
+    
+    def _load_parquet(self, problem_num, n_min, n_max, backend):
+        """Carga filtrada desde los archivos part-*.parquet"""
+        parts = [name for name in os.listdir(self.directory) if name.endswith('.parquet')]
+        if not parts:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in HISTORY_COLUMNS.items()}
+        
+        import pyarrow.dataset as ds
+        
+        conditions = []
+        if problem_num is not None:
+            conditions.append(ds.field('problem') == problem_num)
+        if n_min is not None:
+            conditions.append(ds.field('n') >= n_min)
+        if n_max is not None:
+            conditions.append(ds.field('n') <= n_max)
+        if backend is not None:
+            conditions.append(ds.field('backend') == backend)
+        
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        
+        dataset = ds.dataset([os.path.join(self.directory, name) for name in sorted(parts)],
+                             format='parquet')
+        table = dataset.to_table(filter=expression)
+        return {name: table.column(name).to_numpy(zero_copy_only=False) for name in HISTORY_COLUMNS}
+    
+    def load(self, problem_num=None, n_min=None, n_max=None, backend=None):
+        """
+        Carga las filas que cumplen los filtros como lista de resultados
+        
+        Args:
+            problem_num (int): Problema a cargar (None para todos)
+            n_min (int): n mínimo, inclusive (None sin límite)
+            n_max (int): n máximo, inclusive (None sin límite)
+            backend (str): Backend de medición a cargar (None para todos)
+        
+        Returns:
+            list: Diccionarios con las columnas del historial y 'time_ms'
+        """
+        columns = self.load_columns(problem_num, n_min, n_max, backend)
+        
+        rows = []
+        for i in range(len(columns['n'])):
+            row = {name: columns[name][i].item() for name in HISTORY_COLUMNS}
+            row['time_ms'] = row['time_seconds'] * 1000
+            rows.append(row)
+        
+        return rows
+    
+    def trend(self, problem_num, n, backend='python'):
+        """
+        Evolución del tiempo medido de un (problema, n) a lo largo de los barridos
+        
+        Args:
+            problem_num (int): Número del problema
+            n (int): Tamaño de entrada
+            backend (str): Backend de medición
+        
+        Returns:
+            tuple: (marcas de tiempo, tiempos en segundos), ordenados por fecha y
+                sin resultados extrapolados
+        """
+        columns = self.load_columns(problem_num, n, n, backend)
+        measured = ~columns['extrapolated']
+        order = np.argsort(columns['timestamp'][measured], kind='stable')
+        return columns['timestamp'][measured][order], columns['time_seconds'][measured][order]
@@ -0,0 +1,152 @@
+"""
+Módulo de Resultados en Flujo
+Escribe cada resultado a disco en cuanto se obtiene (JSON Lines, solo anexado).
+"""
+
+import itertools
+import json
+import os
+import time
+
+# Secuencia para distinguir barridos iniciados en el mismo segundo
+_sweep_counter = itertools.count(1)
+
+
+def new_sweep_id():
+    """
+    Genera un identificador para un barrido
+    
+    Returns:
+        str: Identificador con fecha, hora, proceso y secuencia (ej. '20261016T101500-1234-1')
+    """
+    return f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{next(_sweep_counter)}"
+
+
+def _to_json(value):
+    """
+    Convierte valores de NumPy y arreglos compactos a tipos nativos para JSON
+    
+    Args:
+        value: Valor no serializable por defecto
+    
+    Returns:
+        Valor nativo equivalente
+    """
+    if hasattr(value, 'item'):
+        return value.item()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Tipo no serializable: {type(value).__name__}")
+
+
+def append_json_line(filepath, record):
+    """
+    Anexa un registro JSON como una línea completa y lo fuerza a disco
+    
+    Args:
+        filepath (str): Archivo donde anexar
+        record (dict): Registro a escribir
+    """
+    line = json.dumps(record, default=_to_json, ensure_ascii=False) + '\n'
+    
+    with open(filepath, 'a', encoding='utf-8') as f:
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_json_lines(filepath):
+    """
+    Lee los registros completos de un archivo JSON Lines
+    
+    Args:
+        filepath (str): Archivo a leer
+        
+    Returns:
+        list: Registros en orden de escritura (una última línea truncada se ignora)
+    """
+    records = []
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue  # Línea truncada por una interrupción
+    except OSError:
+        return []
+    
+    return records
+
+
+class ResultSink:
+    """
+    Archivo de resultados en formato JSON Lines, solo anexado
+    
+    Cada resultado se escribe como una línea completa, seguida de flush y
+    fsync, por lo que una interrupción o caída solo puede perder la medición
+    en curso. Una última línea truncada se ignora al leer.
+    """
+    
+    def __init__(self, filepath=os.path.join("results", "results_stream.jsonl")):
+        """
+        Inicializa el flujo de resultados
+        
+        Args:
+            filepath (str): Archivo donde anexar los resultados
+        """
+        self.filepath = filepath
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def write(self, problem_num, result, sweep_id):
+        """
+        Anexa un resultado al archivo y lo fuerza a disco
+        
+        Args:
+            problem_num (int): Número del problema
+            result (dict): Resultado de una medición
+            sweep_id (str): Identificador del barrido al que pertenece
+        """
+        record = {'problem': problem_num, 'sweep_id': sweep_id}
+        record.update(result)
+        append_json_line(self.filepath, record)
+    
+    def read(self):
+        """
+        Lee todos los registros completos del archivo
+        
+        Returns:
+            list: Registros en orden de escritura
+        """
+        return read_json_lines(self.filepath)
+    
+    def load(self, problem_num, sweep_id=None):
+        """
+        Obtiene los resultados de un problema desde el flujo
+        
+        Args:
+            problem_num (int): Número del problema
+            sweep_id (str): Barrido a cargar (None usa el último barrido del problema)
+        
+        Returns:
+            list: Resultados en el formato de run_analysis
+        """
+        records = [r for r in self.read() if r.get('problem') == problem_num]
+        if not records:
+            return []
+        
+        if sweep_id is None:
+            sweep_id = records[-1].get('sweep_id')
+        
+        results = []
+        for record in records:
+            if record.get('sweep_id') != sweep_id:
+                continue
+            result = dict(record)
+            del result['problem']
+            del result['sweep_id']
+            results.append(result)
+        
+        return results
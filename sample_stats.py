@@ -0,0 +1,82 @@
+"""
+Módulo de Estadística Robusta de Muestras
+Guarda las muestras crudas de cada medición y calcula estadísticos resistentes a valores atípicos.
+"""
+
+from array import array
+
+import numpy as np
+
+# Umbral del puntaje z modificado (Iglewicz y Hoaglin) para considerar un valor atípico
+OUTLIER_THRESHOLD = 3.5
+
+# Columnas que agrega robust_summary a cada resultado
+ROBUST_COLUMNS = ('time_median', 'time_p5', 'time_p95', 'time_mad', 'time_iqr', 'time_cv',
+                  'outliers')
+
+
+def sample_array(samples=()):
+    """
+    Crea el contenedor compacto de muestras (float64 contiguos, 8 bytes por muestra)
+    
+    Args:
+        samples: Muestras iniciales en segundos
+    
+    Returns:
+        array.array: Arreglo de tipo 'd'
+    """
+    return array('d', samples)
+
+
+def reject_outliers(samples, threshold=OUTLIER_THRESHOLD):
+    """
+    Separa los valores atípicos con el puntaje z modificado basado en la MAD
+    
+    Args:
+        samples: Muestras en segundos
+        threshold (float): Puntaje a partir del cual una muestra es atípica
+    
+    Returns:
+        tuple: (muestras conservadas, muestras rechazadas) como np.ndarray
+    """
+    values = np.asarray(samples, dtype=float)
+    if values.size < 3:
+        return values, values[:0]
+    
+    median = np.median(values)
+    mad = np.median(np.abs(values - median))
+    if mad == 0:
+        return values, values[:0]
+    
+    scores = 0.6745 * np.abs(values - median) / mad
+    return values[scores <= threshold], values[scores > threshold]
+
+
+def robust_summary(samples, threshold=OUTLIER_THRESHOLD):
+    """
+    Calcula estadísticos robustos sobre las muestras sin valores atípicos
+    
+    Args:
+        samples: Muestras en segundos
+        threshold (float): Umbral de reject_outliers
+    
+    Returns:
+        dict: Mediana, percentiles 5 y 95, MAD, IQR y coeficiente de variación
+            (en segundos, salvo time_cv) y número de muestras rechazadas
+    """
+    kept, rejected = reject_outliers(samples, threshold)
+    if kept.size == 0:
+        return {}
+    
+    p5, q1, median, q3, p95 = np.percentile(kept, [5, 25, 50, 75, 95])
+    mean = np.mean(kept)
+    
+    return {
+        'time_median': float(median),
+        'time_p5': float(p5),
+        'time_p95': float(p95),
+        'time_mad': float(np.median(np.abs(kept - median))),
+        'time_iqr': float(q3 - q1),
+        'time_cv': float(np.std(kept, ddof=1) / mean) if kept.size > 1 and mean > 0 else 0.0,
+        'outliers': int(rejected.size)
+    }
@@ -0,0 +1,95 @@
+"""
+Benchmark de Tiempo de Arranque
+Mide el costo de importar los módulos del analizador con `python -X importtime`.
+
+Ejemplo:
+    python startup_benchmark.py
+    python startup_benchmark.py --modules menu cli --repeat 5
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Dependencias pesadas que una ejecución de solo medición no debería cargar
+HEAVY_MODULES = ('matplotlib', 'pandas', 'tabulate')
+
+
+def measure_import(module, repeat=3):
+    """
+    Mide el tiempo de importación de un módulo en intérpretes nuevos
+    
+    Args:
+        module (str): Nombre del módulo a importar
+        repeat (int): Número de repeticiones (se reporta la mínima)
+    
+    Returns:
+        dict: Tiempo acumulado en ms y módulos pesados cargados
+    """
+    best_us = None
+    loaded_heavy = set()
+    
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True, text=True, check=True
+        )
+        
+        total_us = None
+        for line in completed.stderr.splitlines():
+            if not line.startswith('import time:') or '|' not in line:
+                continue
+            
+            parts = [part.strip() for part in line.split(':', 1)[1].split('|')]
+            if not parts[1].isdigit():
+                continue  # Encabezado
+            
+            name = parts[2]
+            if name == module:
+                total_us = int(parts[1])
+            if name.split('.')[0] in HEAVY_MODULES:
+                loaded_heavy.add(name.split('.')[0])
+        
+        if total_us is not None and (best_us is None or total_us < best_us):
+            best_us = total_us
+    
+    return {
+        'module': module,
+        'import_ms': best_us / 1000 if best_us is not None else float('nan'),
+        'heavy_loaded': sorted(loaded_heavy)
+    }
+
+
+def main(argv=None):
+    """
+    Punto de entrada del benchmark
+    
+    Args:
+        argv (list): Argumentos (None usa sys.argv)
+    
+    Returns:
+        int: 0 si ningún módulo carga dependencias pesadas, 1 en otro caso
+    """
+    parser = argparse.ArgumentParser(description="Benchmark de tiempo de arranque")
+    parser.add_argument('--modules', nargs='+', default=['algorithms', 'analyzer', 'menu', 'cli'],
+                        help="Módulos a importar")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Repeticiones por módulo")
+    args = parser.parse_args(argv)
+    
+    print(f"{'Módulo':<15} {'Importación (ms)':>18}   Dependencias pesadas cargadas")
+    print("-" * 70)
+    
+    exit_code = 0
+    for module in args.modules:
+        result = measure_import(module, args.repeat)
+        heavy = ', '.join(result['heavy_loaded']) or '-'
+        print(f"{result['module']:<15} {result['import_ms']:>18.1f}   {heavy}")
+        if result['heavy_loaded']:
+            exit_code = 1
+    
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Pruebas de SweepCheckpoint y de la reanudación de barridos.
+"""
+
+import json
+
+from analyzer import PerformanceAnalyzer
+from checkpoint import SweepCheckpoint
+
+
+def test_records_survive_reload(tmp_path):
+    filepath = str(tmp_path / 'checkpoint.jsonl')
+    checkpoint = SweepCheckpoint(filepath)
+    checkpoint.record(1, 10, 'python', 0.5, 42, mode='runs=3')
+    checkpoint.record(1, 10, 'python', 0.7, 42, mode='runs=3')
+    checkpoint.record(1, 10, 'python', 0.9, 42, run_index=5, mode='runs=3')
+    
+    reloaded = SweepCheckpoint(filepath)
+    assert len(reloaded) == 3
+    assert reloaded.completed_runs(1, 10, 'python', 'runs=3') == {0: (0.5, 42), 1: (0.7, 42),
+                                                                  5: (0.9, 42)}
+    assert reloaded.completed_runs(1, 20, 'python', 'runs=3') == {}
+    assert reloaded.completed_runs(1, 10, 'numpy', 'runs=3') == {}
+
+
+def test_runs_are_keyed_by_mode(tmp_path):
+    filepath = str(tmp_path / 'checkpoint.jsonl')
+    SweepCheckpoint(filepath).record(1, 10, 'python', 0.5, 42, mode='runs=3')
+    
+    reloaded = SweepCheckpoint(filepath)
+    assert reloaded.completed_runs(1, 10, 'python', 'adaptive') == {}
+    assert reloaded.completed_runs(1, 10, 'python', 'runs=3+rigorous') == {}
+
+
+def test_records_without_mode_are_not_reused(tmp_path):
+    filepath = tmp_path / 'checkpoint.jsonl'
+    filepath.write_text(json.dumps({'problem': 1, 'n': 10, 'backend': 'python', 'run': 0,
+                                    'elapsed': 0.5, 'result': 42}) + '\n')
+    
+    assert SweepCheckpoint(str(filepath)).completed_runs(1, 10, 'python', 'runs=3') == {}
+
+
+def test_clear_removes_file(tmp_path):
+    filepath = tmp_path / 'checkpoint.jsonl'
+    checkpoint = SweepCheckpoint(str(filepath))
+    checkpoint.record(1, 10, 'python', 0.5, 42)
+    checkpoint.clear()
+    
+    assert len(checkpoint) == 0
+    assert not filepath.exists()
+
+
+def make_analyzer(tmp_path):
+    """Analizador con un checkpoint que ya tiene todas las ejecuciones de (2, n = 10)"""
+    checkpoint = SweepCheckpoint(str(tmp_path / 'checkpoint.jsonl'))
+    analyzer = PerformanceAnalyzer(str(tmp_path), show_plots=False, checkpoint=checkpoint)
+    num_runs = analyzer.get_num_runs(10)
+    for _ in range(num_runs):
+        checkpoint.record(2, 10, 'python', 5.0, 10, mode=f'runs={num_runs}')
+    return analyzer
+
+
+def test_run_analysis_resumes_from_checkpoint(tmp_path):
+    results = make_analyzer(tmp_path).run_analysis(2, [10])
+    
+    # Los tiempos recuperados (5 s) se usan en lugar de volver a medir
+    assert results[0]['time_seconds'] == 5.0
+    assert results[0]['operations'] == 10
+
+
+def test_run_analysis_does_not_resume_other_mode(tmp_path):
+    results = make_analyzer(tmp_path).run_analysis(2, [10], adaptive=True)
+    
+    assert results[0]['time_seconds'] < 5.0
@@ -0,0 +1,71 @@
+"""
+Pruebas de la planificación de valores de n con presupuesto (grid_planner).
+"""
+
+import pytest
+
+import cli
+from algorithms import Algorithms
+from analyzer import PerformanceAnalyzer
+from grid_planner import DEFAULT_SECONDS_PER_UNIT, GridPlanner
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    return PerformanceAnalyzer(str(tmp_path), show_plots=False)
+
+
+def test_log_grid_is_increasing_and_spans_the_range():
+    grid = GridPlanner.log_grid(1, 10 ** 4, 4)
+    assert grid[0] == 1 and grid[-1] == 10 ** 4
+    assert grid == sorted(set(grid))
+    assert len(grid) == 17
+
+
+def test_plan_is_the_prefix_that_fits_the_budget(analyzer):
+    budget = 1.0
+    planner = GridPlanner(analyzer, 2, budget)
+    planned = planner.plan([], budget)
+    
+    assert planned == planner.grid[:len(planned)]
+    assert sum(planner.predict_cost(n, []) for n in planned) <= budget
+    
+    # El siguiente candidato ya no cabe
+    assert len(planned) < len(planner.grid)
+    assert sum(planner.predict_cost(n, []) for n in planner.grid[:len(planned) + 1]) > budget
+
+
+def test_cost_without_measurements_uses_theoretical_complexity(analyzer):
+    planner = GridPlanner(analyzer, 1, 10.0)
+    n = 1000
+    expected = (analyzer.get_num_runs(n) * DEFAULT_SECONDS_PER_UNIT
+                * Algorithms.get_theoretical_complexity(1, n))
+    assert planner.predict_cost(n, []) == pytest.approx(expected)
+
+
+def test_measured_times_change_the_plan(analyzer):
+    planner = GridPlanner(analyzer, 3, 1.0)
+    results = [{'n': n, 'time_seconds': 1e-18 * Algorithms.get_theoretical_complexity(3, n)}
+               for n in (10, 100, 1000)]
+    
+    # Con tiempos medidos muy pequeños cabe toda la malla
+    assert planner.plan(results, 1.0) == planner.grid
+    assert len(planner.plan([], 1.0)) < len(planner.grid)
+
+
+def test_measured_points_do_not_consume_budget(analyzer):
+    planner = GridPlanner(analyzer, 2, 0.0)
+    assert planner.plan([], 0.0) == []
+    assert planner.plan([], 0.0, measured=set(planner.grid)) == planner.grid
+
+
+def test_parallel_cli_sweep_measures_the_planned_grid(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(PerformanceAnalyzer, 'parallel_sweep',
+                        lambda self, problems, n_values, *args, **kwargs: calls.append(n_values))
+    
+    cli.main(['--problems', '2', '--workers', '2', '--grid-budget', '1', '--density', '2',
+              '--formats', 'csv', '--results-dir', str(tmp_path), '--no-history', '--no-cache'])
+    
+    planner = GridPlanner(PerformanceAnalyzer(str(tmp_path), show_plots=False), 2, 1.0, 2)
+    assert calls == [{2: planner.plan([], 1.0)}]
@@ -0,0 +1,47 @@
+"""
+Pruebas del análisis simbólico de bucles de loop_nest.
+"""
+
+import pytest
+
+from algorithms import OperationCounter
+from loop_nest import LoopNest, analyze_problem
+
+
+@pytest.mark.parametrize('problem_num', [1, 2, 3])
+def test_count_matches_operation_counter(problem_num):
+    nest = analyze_problem(problem_num)
+    for n in list(range(51)) + [10 ** 3, 10 ** 6, 10 ** 12]:
+        assert nest.count(n) == OperationCounter.count(problem_num, n), f"n = {n}"
+
+
+@pytest.mark.parametrize('problem_num, big_o', [(1, 'O(n² log n)'), (2, 'O(n)'), (3, 'O(n²)')])
+def test_big_o(problem_num, big_o):
+    assert analyze_problem(problem_num).big_o() == big_o
+
+
+def test_leading_term_of_problem_3():
+    # n/3 iteraciones externas por n/4 internas
+    assert analyze_problem(3).leading_term() == '0.08333·n²'
+
+
+def test_downward_and_multiplicative_steps():
+    nest = LoopNest.from_source("for (i = n; i > 0; i -= 2) { for (k = 1; k < n; k *= 3) { c++; } }")
+    for n in range(30):
+        expected = sum(1 for _ in range(n, 0, -2)) * sum(1 for k in (3 ** e for e in range(20)) if k < n)
+        assert nest.count(n) == expected, f"n = {n}"
+
+
+@pytest.mark.parametrize('source, message', [
+    ("for (i = 0; i < n; i++) { for (j = 0; j < i; j++) { c++; } }", "depende de i"),
+    ("for (i = 0; i < n; i++) { for (j = i; j < n; j++) { c++; } }", "depende de i"),
+    ("for (i = 0; i < n; i++) { while (k < n) { k++; } }", "while"),
+    ("do { k++; } while (k < n);", "do"),
+    ("for (i = 0; i < n; i++) { continue; }", "continue"),
+    ("for (i = 0; i < n; i++) { if (i > 3) break; }", "if"),
+    ("if (m <= 1) return; for (i = 0; i < n; i++) { c++; }", "guardas en n"),
+    ("counter++;", "No se encontraron bucles"),
+])
+def test_unsupported_code_is_rejected_at_parse_time(source, message):
+    with pytest.raises(ValueError, match=message):
+        LoopNest.from_source(source)
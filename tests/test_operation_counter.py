@@ -0,0 +1,36 @@
+"""
+Pruebas del conteo en forma cerrada de OperationCounter contra los bucles reales.
+"""
+
+import pytest
+
+from algorithms import Algorithms, OperationCounter
+from analyzer import PerformanceAnalyzer
+
+
+@pytest.mark.parametrize('problem_num', [1, 2, 3])
+def test_closed_form_matches_loops(problem_num):
+    algorithm_func = Algorithms.get_algorithm(problem_num)
+    for n in range(51):
+        assert OperationCounter.count(problem_num, n) == algorithm_func(n), f"n = {n}"
+
+
+@pytest.mark.parametrize('problem_num', [1, 2, 3])
+def test_verify_reports_no_mismatches(problem_num):
+    assert OperationCounter.verify(problem_num, range(51)) == []
+
+
+def test_closed_form_handles_huge_n():
+    n = 10 ** 12
+    assert OperationCounter.problem_1(n) == (n - n // 2 + 1) * (n - n // 2) * n.bit_length()
+    assert OperationCounter.problem_2(n) == n
+    assert OperationCounter.problem_3(n) == (n // 3) * ((n - 1) // 4 + 1)
+
+
+def test_unknown_problem_counts_zero():
+    assert OperationCounter.count(99, 100) == 0
+
+
+def test_verify_counts_returns_no_mismatches(tmp_path):
+    analyzer = PerformanceAnalyzer(str(tmp_path), show_plots=False)
+    assert analyzer.verify_counts(1, 20) == []
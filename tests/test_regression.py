@@ -0,0 +1,103 @@
+"""
+Pruebas de la prueba t de Welch y de los códigos de salida de regression.py.
+
+Las líneas base se escriben con tiempos extremos (mucho menores o mayores que
+cualquier medición real) para que el resultado no dependa de la máquina.
+"""
+
+import csv
+import json
+import os
+
+import pytest
+
+import regression
+from regression import EXIT_INCOMPLETE, EXIT_OK, EXIT_REGRESSION, welch_t_test
+
+
+def write_baseline(baseline_dir, problem_num, rows, environment=True):
+    """Escribe un CSV base (filas n -> tiempo medio) y, opcionalmente, el entorno actual"""
+    with open(regression.baseline_path(str(baseline_dir), problem_num), 'w',
+              encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=regression.BASELINE_COLUMNS)
+        writer.writeheader()
+        for n, mean in rows.items():
+            writer.writerow({'n': n, 'time_seconds': mean, 'std_dev': mean / 10, 'num_runs': 5})
+    if environment:
+        with open(os.path.join(str(baseline_dir), regression.ENVIRONMENT_FILE), 'w',
+                  encoding='utf-8') as f:
+            json.dump(regression.baseline_environment(), f)
+
+
+def run_main(baseline_dir, *args):
+    return regression.main(['--baseline-dir', str(baseline_dir), '--runs', '3'] + list(args))
+
+
+def test_welch_t_test_statistic_and_degrees_of_freedom():
+    t_stat, df = welch_t_test(2.0, 1.0, 5, 1.0, 1.0, 5)
+    assert t_stat == pytest.approx(2 ** 0.5)
+    assert df == pytest.approx(8.0)
+    
+    t_stat, _ = welch_t_test(1.0, 1.0, 5, 2.0, 1.0, 5)
+    assert t_stat == pytest.approx(-(2 ** 0.5))
+
+
+@pytest.mark.parametrize('args', [(1.0, 0.1, 1, 1.0, 0.1, 5), (1.0, 0.0, 5, 2.0, 0.0, 5)])
+def test_welch_t_test_not_applicable(args):
+    assert welch_t_test(*args) == (None, None)
+
+
+def test_regression_exits_1(tmp_path):
+    write_baseline(tmp_path, 2, {10: 1e-12})
+    assert run_main(tmp_path, '--points', '2:10') == EXIT_REGRESSION
+
+
+def test_no_regression_exits_0(tmp_path):
+    write_baseline(tmp_path, 2, {10: 100.0})
+    assert run_main(tmp_path, '--points', '2:10') == EXIT_OK
+
+
+def test_point_without_baseline_exits_2(tmp_path):
+    write_baseline(tmp_path, 2, {10: 100.0})
+    assert run_main(tmp_path, '--points', '2:10,20') == EXIT_INCOMPLETE
+
+
+def test_unknown_environment_exits_2(tmp_path):
+    write_baseline(tmp_path, 2, {10: 1e-12}, environment=False)
+    assert run_main(tmp_path, '--points', '2:10') == EXIT_INCOMPLETE
+
+
+def test_different_environment_is_skipped_unless_ignored(tmp_path):
+    write_baseline(tmp_path, 2, {10: 1e-12})
+    environment_file = os.path.join(str(tmp_path), regression.ENVIRONMENT_FILE)
+    with open(environment_file, 'r', encoding='utf-8') as f:
+        environment = json.load(f)
+    environment['python'] = '0.0.0'
+    with open(environment_file, 'w', encoding='utf-8') as f:
+        json.dump(environment, f)
+    
+    assert run_main(tmp_path, '--points', '2:10') == EXIT_INCOMPLETE
+    assert run_main(tmp_path, '--points', '2:10', '--ignore-environment') == EXIT_REGRESSION
+
+
+def test_environment_has_no_hostname():
+    assert 'hostname' not in regression.baseline_environment()
+
+
+def test_partial_update_keeps_rows_and_environment(tmp_path):
+    write_baseline(tmp_path, 2, {10: 100.0, 20: 100.0}, environment=False)
+    assert run_main(tmp_path, '--update-baseline', '--points', '2:20') == EXIT_OK
+    
+    analyzer = regression.PerformanceAnalyzer(str(tmp_path), show_plots=False)
+    baseline = regression.load_baseline(regression.baseline_path(str(tmp_path), 2), analyzer)
+    assert baseline[10]['mean'] == 100.0
+    assert baseline[20]['mean'] < 100.0
+    assert not os.path.exists(os.path.join(str(tmp_path), regression.ENVIRONMENT_FILE))
+
+
+def test_committed_baseline_is_complete():
+    baseline_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                regression.DEFAULT_BASELINE_DIR)
+    assert os.path.exists(os.path.join(baseline_dir, regression.ENVIRONMENT_FILE))
+    for problem_num in regression.Algorithms.get_all_problems():
+        assert os.path.exists(regression.baseline_path(baseline_dir, problem_num))